@@ -0,0 +1,242 @@
+"""Tables backed by CSV / YAML / JSON data files in docs/, rendered by macros.
+
+Large device and inventory lists can live in data files instead of
+hand-maintained pipe tables, so the Markdown checkers and fixers never
+re-scan them. mkdocs_macros.py exposes:
+- data_table(src, columns=None, sort=None, where=None, per_page=None, part=1)
+- data_rows(src, sort=None, where=None): the rows as dicts, for Jinja loops
+
+src is relative to the page's folder (or to docs/ when it starts with '/').
+sort is a column or a list of columns, '-Column' sorts descending; where
+maps a column to the value (or list of values) a row must have.
+
+A data file is parsed once and kept while its mtime and size are unchanged,
+so all pages of a build, and every rebuild of `mkdocs serve`, share the
+parsed rows and their sorted / filtered selections.
+
+Splitting: with per_page=N a page shows the first N rows and a pager. This
+module also runs as a MkDocs hook (`hooks:` in mkdocs.yml): on_files adds a
+generated page for every further part (`inventory-2.md`, `inventory-3.md`,
+... next to `inventory.md`, left out of the nav). One split table per page;
+its macro arguments must be literals.
+"""
+import ast
+import csv
+import json
+import logging
+import math
+import os
+import posixpath
+import re
+import sys
+
+import yaml
+
+# MkDocs loads hooks under their file name; register the usual module name too,
+# so mkdocs_macros.py imports this same instance and shares its cache
+sys.modules.setdefault('mkdocs_data_tables', sys.modules[__name__])
+
+log = logging.getLogger('mkdocs.hooks.data_tables')
+
+CALL_RE = re.compile(r'\{\{-?\s*(data_table\s*\(.*?\))\s*-?\}\}', re.S)
+TITLE_RE = re.compile(r'^#\s+(.+?)\s*#*\s*$', re.M)
+NUMBER_RE = re.compile(r'^-?[0-9]+(?:\.[0-9]+)?$')
+
+# abs path -> ((mtime_ns, size), columns, rows, {selection key: rows})
+_files = {}
+# page abs path -> ((mtime_ns, size), split call or None)
+_pages = {}
+
+
+def parse_file(path):
+    """Return (columns, rows) of a .csv, .yml / .yaml or .json file; rows are dicts."""
+    ext = os.path.splitext(path)[1].lower()
+    with open(path, encoding='utf-8-sig', newline='' if ext == '.csv' else None) as f:
+        if ext == '.csv':
+            reader = csv.DictReader(f)
+            return list(reader.fieldnames or []), list(reader)
+        if ext in ('.yml', '.yaml'):
+            rows = yaml.safe_load(f)
+        elif ext == '.json':
+            rows = json.load(f)
+        else:
+            raise ValueError(f'{path}: unsupported data file type {ext}')
+    if rows is None:
+        rows = []
+    if not isinstance(rows, list) or not all(isinstance(r, dict) for r in rows):
+        raise ValueError(f'{path}: expected a list of mappings')
+    columns = {}
+    for r in rows:
+        columns.update(dict.fromkeys(r))
+    return list(columns), rows
+
+
+def load(path):
+    """(columns, rows) of a data file, parsed again only when its mtime or size changed."""
+    path = os.path.abspath(path)
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    entry = _files.get(path)
+    if entry is None or entry[0] != stamp:
+        columns, rows = parse_file(path)
+        entry = _files[path] = (stamp, columns, rows, {})
+    return entry
+
+
+def sort_key(value):
+    """Numbers sort numerically, everything else case-insensitively after them."""
+    s = '' if value is None else str(value).strip()
+    if NUMBER_RE.match(s):
+        return 0, float(s), ''
+    return 1, 0.0, s.lower()
+
+
+def select(path, sort=None, where=None):
+    """(columns, rows) of a data file, filtered by where and sorted by sort; memoized per file version."""
+    _, columns, rows, selections = load(path)
+    if not sort and not where:
+        return columns, rows
+    sort = [sort] if isinstance(sort, str) else list(sort or [])
+    where = {k: v if isinstance(v, (list, tuple)) else [v] for k, v in (where or {}).items()}
+    key = json.dumps([sort, where], sort_keys=True, default=str)
+    if key not in selections:
+        out = rows
+        if where:
+            want = {k: {str(v) for v in vals} for k, vals in where.items()}
+            out = [r for r in out if all(str(r.get(k, '')) in vals for k, vals in want.items())]
+        # stable sorts, least significant column first
+        for col in reversed(sort):
+            desc = col.startswith('-')
+            col = col.lstrip('-')
+            out = sorted(out, key=lambda r: sort_key(r.get(col)), reverse=desc)
+        selections[key] = out
+    return columns, selections[key]
+
+
+def data_path(docs_dir, page_uri, src):
+    if src.startswith('/'):
+        return os.path.join(docs_dir, src.lstrip('/'))
+    return os.path.join(docs_dir, posixpath.dirname(page_uri), src)
+
+
+def cell(value):
+    if value is None:
+        return ''
+    return str(value).replace('|', '\\|').replace('\r\n', '\n').replace('\n', '<br>')
+
+
+def part_uri(page_uri, part):
+    """docs-relative path of part `part` of the split table on page_uri (part 1 is the page itself)."""
+    stem, ext = posixpath.splitext(page_uri)
+    return page_uri if part == 1 else f'{stem}-{part}{ext}'
+
+
+def pager(base_uri, page_uri, part, parts):
+    here = posixpath.dirname(page_uri)
+    links = []
+    for n in range(1, parts + 1):
+        if n == part:
+            links.append(f'**{n}**')
+        else:
+            links.append(f'[{n}](<{posixpath.relpath(part_uri(base_uri, n), here or ".")}>)')
+    return f'Part {part} of {parts}: ' + ' · '.join(links)
+
+
+def render(columns, rows):
+    out = ['| ' + ' | '.join(cell(c) for c in columns) + ' |', '|' + ' --- |' * len(columns)]
+    for r in rows:
+        out.append('| ' + ' | '.join(cell(r.get(c)) for c in columns) + ' |')
+    return '\n'.join(out)
+
+
+def data_table(docs_dir, page_uri, src, columns=None, sort=None, where=None, per_page=None, part=1):
+    """Markdown table of a data file for the page at page_uri (docs-relative)."""
+    all_columns, rows = select(data_path(docs_dir, page_uri, src), sort, where)
+    if isinstance(columns, str):
+        columns = [c.strip() for c in columns.split(',')]
+    columns = list(columns or all_columns)
+    if not per_page:
+        return render(columns, rows)
+    parts = max(1, math.ceil(len(rows) / per_page))
+    part = min(max(1, part), parts)
+    base_uri = page_uri
+    if part > 1:
+        stem, ext = posixpath.splitext(page_uri)
+        base_uri = stem[:-len(f'-{part}')] + ext
+    table = render(columns, rows[(part - 1) * per_page:part * per_page])
+    if parts == 1:
+        return table
+    nav = pager(base_uri, page_uri, part, parts)
+    return f'{nav}\n\n{table}\n\n{nav}'
+
+
+def split_call(text):
+    """Return (expression, args, kwargs) of the page's data_table call with per_page, or None."""
+    for m in CALL_RE.finditer(text):
+        expr = m.group(1)
+        if 'per_page' not in expr:
+            continue
+        try:
+            call = ast.parse(expr, mode='eval').body
+            args = [ast.literal_eval(a) for a in call.args]
+            kwargs = {k.arg: ast.literal_eval(k.value) for k in call.keywords}
+        except (SyntaxError, ValueError):
+            log.warning('data_table call with non-literal arguments is not split: %s', expr)
+            continue
+        if kwargs.get('per_page') and 'part' not in kwargs:
+            return expr, args, kwargs
+    return None
+
+
+def page_split(path):
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    entry = _pages.get(path)
+    if entry is None or entry[0] != stamp:
+        with open(path, encoding='utf-8') as f:
+            text = f.read()
+        found = None
+        if 'per_page' in text:
+            found = split_call(text)
+            if found:
+                m = TITLE_RE.search(text)
+                found = found + (m.group(1) if m else None,)
+        entry = _pages[path] = (stamp, found)
+    return entry[1]
+
+
+def split_parts(docs_dir, src_uri, found):
+    """[(uri, content)] of the generated pages for parts 2.. of a page's split table (found: page_split())."""
+    expr, args, kwargs, title = found
+    src = args[0] if args else kwargs.get('src')
+    if not src:
+        log.warning('%s: data_table call without a data file is not split: %s', src_uri, expr)
+        return []
+    try:
+        _, rows = select(data_path(docs_dir, src_uri, src), kwargs.get('sort'), kwargs.get('where'))
+    except (OSError, ValueError) as e:
+        log.warning('%s: %s', src_uri, e)
+        return []
+    parts = math.ceil(len(rows) / kwargs['per_page'])
+    title = title or posixpath.splitext(posixpath.basename(src_uri))[0]
+    head = expr[:-1].rstrip().rstrip(',')
+    return [(part_uri(src_uri, part), f'# {title} ({part}/{parts})\n\n{{{{ {head}, part={part}) }}}}\n')
+            for part in range(2, parts + 1)]
+
+
+def on_files(files, config):
+    from mkdocs.structure.files import File, InclusionLevel
+
+    docs_dir = config['docs_dir']
+    for f in list(files.documentation_pages()):
+        if not f.abs_src_path:
+            continue
+        found = page_split(f.abs_src_path)
+        if not found:
+            continue
+        for part, (uri, content) in enumerate(split_parts(docs_dir, f.src_uri, found), 2):
+            if files.get_file_from_path(uri) is not None:
+                log.warning('%s exists, not generating part %d of the table on %s', uri, part, f.src_uri)
+                continue
+            files.append(File.generated(config, uri, content=content, inclusion=InclusionLevel.NOT_IN_NAV))
+    return files
@@ -0,0 +1,254 @@
+"""Git history index for the docs: last-modified date, creation date and committers per file.
+
+One streaming `git log --name-status` pass over the whole history replaces
+a git call per page. Renames are followed, so a moved page keeps its
+history. The index is cached in .cache/git_history.json under the HEAD
+commit it was built for; when HEAD moves forward, only the new commits are
+read and merged in (a rewritten history triggers a full rebuild).
+
+Used two ways:
+- as a MkDocs hook (`hooks:` in mkdocs.yml): fills page.meta
+  git_revision_date_localized / git_creation_date_localized, which the
+  Material theme shows at the bottom of each page
+- from mkdocs_macros.py, which exposes git_revision_date(),
+  git_creation_date() and git_committers() to pages
+"""
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+# MkDocs loads hooks under their file name; register the usual module name too,
+# so mkdocs_macros.py imports this same instance and reuses the loaded index
+sys.modules.setdefault('mkdocs_git_history', sys.modules[__name__])
+
+log = logging.getLogger('mkdocs.hooks.git_history')
+
+CACHE_PATH = Path('.cache') / 'git_history.json'
+CACHE_VERSION = 1
+DATE_FORMAT = '%Y-%m-%d'
+# record separator before each commit, unit separator between header fields
+LOG_FORMAT = '--format=%x1e%H%x1f%at%x1f%an%x1f%ae'
+
+
+def git(root, *args):
+    return subprocess.run(['git', *args], cwd=root, capture_output=True, text=True, check=True).stdout.strip()
+
+
+def parse_log(stream):
+    """Yield (timestamp, name, email, [(status, path, new_path)]) from `git log -z --name-status` bytes."""
+    buf = b''
+    for chunk in iter(lambda: stream.read(1 << 16), b''):
+        buf += chunk
+        records = buf.split(b'\x1e')
+        buf = records.pop()
+        for rec in records:
+            if rec:
+                yield parse_record(rec)
+    if buf:
+        yield parse_record(buf)
+
+
+def parse_record(rec):
+    header, _, rest = rec.partition(b'\0')
+    _, ts, name, email = header.decode('utf-8', 'replace').split('\x1f')
+    tokens = rest.lstrip(b'\n').split(b'\0')
+    changes = []
+    i = 0
+    while i < len(tokens) and tokens[i]:
+        status = tokens[i].decode()
+        if status[0] in 'RC':
+            changes.append((status[0], os.fsdecode(tokens[i+1]), os.fsdecode(tokens[i+2])))
+            i += 3
+        else:
+            changes.append((status[0], os.fsdecode(tokens[i+1]), None))
+            i += 2
+    return int(ts), name, email, changes
+
+
+def index_commits(stream):
+    """Index a newest-first commit stream. Returns (paths, renamed).
+
+    paths: path -> [modified, created, {email: [name, commits]}]
+    renamed: old path -> the path its history now belongs to
+    """
+    paths = {}
+    renamed = {}
+
+    def touch(path, ts, name, email):
+        e = paths.get(path)
+        if e is None:
+            e = paths[path] = [ts, ts, {}]
+        e[1] = ts
+        a = e[2].get(email)
+        if a is None:
+            e[2][email] = [name, 1]
+        else:
+            a[1] += 1
+
+    for ts, name, email, changes in parse_log(stream):
+        for status, path, new_path in changes:
+            if status == 'D':
+                continue
+            if status == 'R':
+                current = renamed.get(new_path, new_path)
+                touch(current, ts, name, email)
+                # older commits touching the old name belong to the renamed file
+                renamed[path] = current
+            elif status == 'C':
+                touch(renamed.get(new_path, new_path), ts, name, email)
+            else:
+                touch(renamed.get(path, path), ts, name, email)
+    return paths, renamed
+
+
+def merge_older(paths, renamed, older):
+    """Fold an index of older history into paths (built from the newer commits)."""
+    for path, (modified, created, authors) in older.items():
+        path = renamed.get(path, path)
+        e = paths.get(path)
+        if e is None:
+            paths[path] = [modified, created, authors]
+            continue
+        e[1] = created
+        for email, (name, n) in authors.items():
+            a = e[2].get(email)
+            if a is None:
+                e[2][email] = [name, n]
+            else:
+                a[1] += n
+    return paths
+
+
+def read_history(root, rev_range):
+    cmd = ['git', 'log', '-z', '-M', '--name-status', LOG_FORMAT, rev_range]
+    proc = subprocess.Popen(cmd, cwd=root, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    try:
+        result = index_commits(proc.stdout)
+    finally:
+        proc.stdout.close()
+        code = proc.wait()
+    if code:
+        raise subprocess.CalledProcessError(code, cmd)
+    return result
+
+
+class GitHistory:
+    """Per-path git history of the repository containing root (empty outside a git checkout)."""
+
+    def __init__(self, root='.', cache_path=None):
+        self.paths = {}
+        self.head = None
+        self.top = None
+        try:
+            self.top = Path(git(root, 'rev-parse', '--show-toplevel'))
+            self.head = git(root, 'rev-parse', 'HEAD')
+        except (OSError, subprocess.CalledProcessError):
+            log.warning('git history unavailable: %s is not a git checkout with commits', root)
+            return
+        cache_path = self.top / (cache_path or CACHE_PATH)
+        cached = self._read(cache_path)
+        old_head = cached.get('head')
+        if old_head == self.head:
+            self.paths = cached['paths']
+            return
+        if old_head and self._is_ancestor(old_head):
+            paths, renamed = read_history(self.top, f'{old_head}..{self.head}')
+            self.paths = merge_older(paths, renamed, cached['paths'])
+            log.info('git history: merged commits %s..%s', old_head[:8], self.head[:8])
+        else:
+            self.paths, _ = read_history(self.top, self.head)
+            log.info('git history: indexed %d paths', len(self.paths))
+        self._write(cache_path)
+
+    def _is_ancestor(self, rev):
+        return subprocess.run(['git', 'merge-base', '--is-ancestor', rev, self.head], cwd=self.top,
+                              capture_output=True).returncode == 0
+
+    def _read(self, cache_path):
+        try:
+            data = json.loads(cache_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+        return data if data.get('version') == CACHE_VERSION else {}
+
+    def _write(self, cache_path):
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # a temp file of its own, so two builds saving at once never share one
+        fd, tmp = tempfile.mkstemp(dir=cache_path.parent, prefix='.' + cache_path.name + '.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'version': CACHE_VERSION, 'head': self.head, 'paths': self.paths}, f,
+                          separators=(',', ':'))
+            os.replace(tmp, cache_path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def rel(self, path):
+        """Repository-relative posix path for a filesystem path."""
+        if self.top is None:
+            return str(path)
+        return Path(os.path.relpath(Path(path).resolve(), self.top)).as_posix()
+
+    def modified(self, path):
+        """Last-modified datetime (UTC) of path, or None if it has no commits."""
+        e = self.paths.get(self.rel(path))
+        return datetime.fromtimestamp(e[0], timezone.utc) if e else None
+
+    def created(self, path):
+        e = self.paths.get(self.rel(path))
+        return datetime.fromtimestamp(e[1], timezone.utc) if e else None
+
+    def committers(self, path):
+        """[(name, email, commits)] for path, most commits first."""
+        e = self.paths.get(self.rel(path))
+        if not e:
+            return []
+        return sorted(((name, email, n) for email, (name, n) in e[2].items()), key=lambda c: (-c[2], c[0]))
+
+
+_histories = {}
+
+
+def history(config, refresh=False):
+    """The GitHistory of the project a MkDocs config belongs to.
+
+    HEAD is only resolved with refresh, which on_config passes once per
+    build (and `mkdocs serve` rebuild); pages and macros reuse that index
+    without running git.
+    """
+    root = Path(config['config_file_path'] or '.').resolve().parent
+    h = _histories.get(root)
+    if h is not None and refresh:
+        try:
+            head = git(root, 'rev-parse', 'HEAD')
+        except (OSError, subprocess.CalledProcessError):
+            head = None
+        if h.head != head:
+            h = None
+    if h is None:
+        h = _histories[root] = GitHistory(root)
+    return h
+
+
+def page_path(config, page):
+    return Path(config['docs_dir']) / page.file.src_path
+
+
+def on_config(config):
+    history(config, refresh=True)
+
+
+def on_page_markdown(markdown, page, config, files):
+    h = history(config)
+    path = page_path(config, page)
+    for key, when in (('git_revision_date_localized', h.modified(path)),
+                      ('git_creation_date_localized', h.created(path))):
+        if when is not None:
+            page.meta.setdefault(key, when.strftime(DATE_FORMAT))
+    return markdown
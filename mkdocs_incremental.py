@@ -0,0 +1,362 @@
+"""Incremental MkDocs builds: re-render only the pages whose inputs changed.
+
+Active for `mkdocs build --dirty` and `mkdocs serve --dirty` (as a hook in
+mkdocs.yml). Every build, dirty or not, records a manifest of the site in
+.cache/incremental_build.json (one per site directory). Per page it holds:
+- key: hash of the page source, its git dates and the values of the macros
+  variables it uses. A page that calls a macro or includes a template is
+  never reused, because its output depends on more than its source.
+- its title and meta, which other pages show in their navigation
+- its anchors and the anchors it links to, so MkDocs validates the links
+  of a kept page (and of pages linking to it) as in a full build
+- the warnings logged while it was rendered, replayed when it is kept, so
+  --strict fails the same way
+- its search index entries
+For the whole site it holds hashes of the config (mkdocs.yml, hook and
+macros modules, theme, package versions), of the file list and of the
+navigation (title, URL and meta of every entry).
+
+A dirty build re-renders a page only when its key changed or its output is
+missing, and keeps the previous site/ output of the others. MkDocs' own
+--dirty compares mtimes and leaves the navigation of the other pages stale.
+Fallbacks:
+- the config, theme or file list changed: full build into a cleaned site/
+- the navigation changed: every page is re-rendered
+The search index is rewritten with the kept pages' entries, in the same
+order as a full build.
+"""
+import hashlib
+import json
+import logging
+import os
+import sys
+import tempfile
+from importlib import metadata
+
+# `mkdocs serve` loads hooks again for every rebuild but sends on_startup only once:
+# the --dirty flag is kept on the first loaded instance
+_first = sys.modules.setdefault('mkdocs_incremental', sys.modules[__name__])
+
+log = logging.getLogger('mkdocs.hooks.incremental')
+
+CACHE_PATH = os.path.join('.cache', 'incremental_build.json')
+MANIFEST_VERSION = 1
+PACKAGES = ('mkdocs', 'mkdocs-material', 'mkdocs-macros-plugin', 'markdown', 'pymdown-extensions')
+DIRTY_WARNING = "A 'dirty' build is being performed"
+
+
+def digest(*parts):
+    h = hashlib.blake2b(digest_size=16)
+    for p in parts:
+        h.update(p if isinstance(p, bytes) else str(p).encode('utf-8'))
+        h.update(b'\0')
+    return h.hexdigest()
+
+
+def plain(value):
+    """value as JSON-compatible data (anything else becomes its str())."""
+    return json.loads(json.dumps(value, default=str))
+
+
+class _DirtyWarningFilter(logging.Filter):
+    """Drops MkDocs' stale-navigation warning: the manifest keeps the navigation right."""
+
+    def filter(self, record):
+        return not record.getMessage().startswith(DIRTY_WARNING)
+
+
+def on_startup(command, dirty):
+    _first.dirty = dirty
+    if dirty:
+        build_log = logging.getLogger('mkdocs.commands.build')
+        if not any(isinstance(f, _DirtyWarningFilter) for f in build_log.filters):
+            build_log.addFilter(_DirtyWarningFilter())
+
+
+def config_hash(config):
+    """Hash of everything that can change every page: config, hooks, macros module, theme, packages."""
+    parts = []
+    if config.config_file_path:
+        with open(config.config_file_path, 'rb') as f:
+            parts.append(f.read())
+    modules = [getattr(m, '__file__', None) for m in (config.hooks or {}).values()]
+    macros = config.plugins.get('macros')
+    if macros is not None:
+        modules.append(os.path.join(os.path.dirname(config.config_file_path or '.'),
+                                    macros.config['module_name'] + '.py'))
+    for path in modules:
+        if path and os.path.isfile(path):
+            with open(path, 'rb') as f:
+                parts.append(f.read())
+    parts.append(config.theme.name)
+    for d in config.theme.dirs:
+        if 'site-packages' in d:
+            continue
+        # custom_dir: any template or asset edit rebuilds everything
+        for dirpath, dirnames, filenames in os.walk(d):
+            dirnames.sort()
+            for fn in sorted(filenames):
+                st = os.stat(os.path.join(dirpath, fn))
+                parts.append(f'{dirpath}/{fn}:{st.st_size}:{st.st_mtime_ns}')
+    for name in PACKAGES:
+        try:
+            parts.append(f'{name}={metadata.version(name)}')
+        except metadata.PackageNotFoundError:
+            pass
+    return digest(*parts)
+
+
+def nav_tree(items):
+    out = []
+    for item in items:
+        if item.is_section:
+            out.append(['s', item.title, nav_tree(item.children)])
+        elif item.is_page:
+            out.append(['p', item.title, item.url, plain(item.meta)])
+        else:
+            out.append(['l', item.title, item.url])
+    return out
+
+
+class _PageLog(logging.Handler):
+    """Collects the warnings MkDocs and the plugins log while a page is read or rendered."""
+
+    def __init__(self, build, config):
+        super().__init__(logging.WARNING)
+        self.build = build
+        self.config = config
+
+    def emit(self, record):
+        page = self.config._current_page
+        if page is not None:
+            self.build.messages.setdefault(page.file.src_uri, []).append(
+                [record.name, record.levelno, record.getMessage()])
+
+
+class Build:
+    """State of one build: the previous manifest, the pages kept from it, and the new records."""
+
+    def __init__(self, config):
+        self.dirty = getattr(_first, 'dirty', False)
+        self.site_dir = os.path.abspath(config.site_dir)
+        self.cache_path = os.path.join(os.path.dirname(os.path.abspath(config.config_file_path or 'mkdocs.yml')),
+                                       CACHE_PATH)
+        self.sites = self._read()
+        self.old = self.sites.get(self.site_dir) or {}
+        self.config_hash = config_hash(config)
+        self.files_hash = None
+        self.nav_hash = None
+        self.full = True
+        self.keys = {}
+        self.keep = set()
+        self.files = None
+        self.nav = None
+        self.search = {}
+        self.messages = {}
+        self._seen = 0
+        plugin = config.plugins.get('material/search') or config.plugins.get('search')
+        self.search_index = getattr(plugin, 'search_index', None)
+
+    def _read(self):
+        try:
+            with open(self.cache_path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data.get('sites', {}) if data.get('version') == MANIFEST_VERSION else {}
+
+    def page_key(self, file, config):
+        """Hash of a page's inputs, or None when its output depends on more than them."""
+        content = file.content_bytes
+        parts = [content]
+        git = sys.modules.get('mkdocs_git_history')
+        if git is not None and file.abs_src_path:
+            h = git.history(config)
+            entry = h.paths.get(h.rel(file.abs_src_path))
+            parts.append(entry[:2] if entry else None)
+        text = content.decode('utf-8', 'replace')
+        macros = config.plugins.get('macros')
+        if macros is not None and ('{{' in text or '{%' in text):
+            from jinja2 import TemplateSyntaxError, meta, nodes
+
+            try:
+                ast = macros.env.parse(text)
+            except TemplateSyntaxError:
+                return None
+            if any(True for _ in meta.find_referenced_templates(ast)):
+                return None
+            # every name the page reads (find_undeclared_variables leaves out the globals macros live in)
+            for name in sorted({n.name for n in ast.find_all(nodes.Name) if n.ctx == 'load'}):
+                if name in macros.macros:
+                    return None
+                value = macros.variables.get(name)
+                if callable(value):
+                    return None
+                parts.append(name)
+                parts.append(json.dumps(value, sort_keys=True, default=str))
+        return digest(*parts)
+
+    def plan(self, files, config):
+        """Decide which pages keep their previous output; returns the reason for a full build, if any."""
+        self.files = files
+        self.files_hash = digest(*sorted(f.src_uri for f in files))
+        pages = self.old.get('pages', {})
+        for f in files.documentation_pages():
+            self.keys[f.src_uri] = self.page_key(f, config)
+        if not self.dirty:
+            return 'not a --dirty build'
+        if not self.old:
+            return 'no previous build of this site'
+        if self.old.get('config') != self.config_hash:
+            return 'config, theme or hooks changed'
+        if self.old.get('files') != self.files_hash:
+            return 'files added or removed'
+        self.full = False
+        for f in files.documentation_pages():
+            rec = pages.get(f.src_uri)
+            key = self.keys[f.src_uri]
+            if key is not None and rec and rec['key'] == key and os.path.isfile(f.abs_dest_path):
+                self.keep.add(f.src_uri)
+        return None
+
+    def restore(self, file):
+        """Give a kept page the title, meta, anchors and anchor links of its previous build."""
+        rec = self.old['pages'][file.src_uri]
+        page = file.page
+        page.title = rec['title']
+        page.meta = rec['meta']
+        page.present_anchor_ids = set(rec['anchors'])
+        page.links_to_anchors = {}
+        for target, anchors in rec['links'].items():
+            f = self.files.get_file_from_path(target)
+            if f is not None:
+                page.links_to_anchors[f] = anchors
+
+    def record(self, file):
+        page = file.page
+        if file.src_uri in self.keep:
+            return self.old['pages'][file.src_uri]
+        if page is None or page.present_anchor_ids is None:
+            return None
+        links = {target.src_uri: anchors for target, anchors in (page.links_to_anchors or {}).items()}
+        return {'key': self.keys.get(file.src_uri), 'title': page.title, 'meta': plain(page.meta),
+                'anchors': sorted(page.present_anchor_ids), 'links': links,
+                'messages': self.messages.get(file.src_uri, []), 'search': self.search.get(file.src_uri, [])}
+
+    def search_entries(self):
+        idx = self.search_index
+        if idx is None:
+            return None
+        entries = getattr(idx, 'entries', None)
+        return entries if entries is not None else getattr(idx, '_entries', None)
+
+    def save(self, pages):
+        self.sites[self.site_dir] = {'config': self.config_hash, 'files': self.files_hash, 'nav': self.nav_hash,
+                                     'pages': pages}
+        sites = {d: m for d, m in self.sites.items() if os.path.isdir(d)}
+        cache_dir = os.path.dirname(self.cache_path)
+        os.makedirs(cache_dir, exist_ok=True)
+        # a temp file of its own, so two builds saving at once never share one
+        fd, tmp = tempfile.mkstemp(dir=cache_dir, prefix='.' + os.path.basename(self.cache_path) + '.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'version': MANIFEST_VERSION, 'sites': sites}, f, separators=(',', ':'))
+            os.replace(tmp, self.cache_path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+
+_build = None
+
+
+def on_config(config):
+    global _build
+    _build = Build(config)
+    _build.log_handler = _PageLog(_build, config)
+    logging.getLogger('mkdocs').addHandler(_build.log_handler)
+
+
+def on_files(files, config):
+    b = _build
+    reason = b.plan(files, config)
+    if b.dirty:
+        if reason:
+            from mkdocs.utils import clean_directory
+
+            log.info('incremental build: full build (%s)', reason)
+            clean_directory(config.site_dir)
+        # MkDocs' --dirty asks every page whether it must be built
+        for f in files.documentation_pages():
+            f.is_modified = lambda uri=f.src_uri: uri not in b.keep
+    return files
+
+
+def on_nav(nav, config, files):
+    b = _build
+    b.nav = nav
+    for uri in b.keep:
+        f = files.get_file_from_path(uri)
+        if f.page is not None:
+            b.restore(f)
+    return nav
+
+
+def on_env(env, config, files):
+    b = _build
+    for uri in b.keep:
+        b.restore(files.get_file_from_path(uri))
+    b.nav_hash = digest(json.dumps(nav_tree(b.nav.items), sort_keys=True, default=str))
+    if b.full or not b.keep:
+        return env
+    if b.old.get('nav') != b.nav_hash:
+        from mkdocs.commands.build import _populate_page
+
+        log.info('incremental build: navigation changed, rendering every page')
+        for uri in sorted(b.keep):
+            page = files.get_file_from_path(uri).page
+            # drop the restored title so the page's own source decides it again
+            page.__dict__.pop('title', None)
+            _populate_page(page, config, files)
+        b.keep.clear()
+        return env
+    pages = b.old['pages']
+    for uri in sorted(b.keep):
+        for name, level, message in pages[uri]['messages']:
+            logging.getLogger(name).log(level, message)
+    log.info('incremental build: %d of %d pages kept', len(b.keep), len(b.keys))
+    return env
+
+
+def on_page_context(context, page, config, nav):
+    b = _build
+    entries = b.search_entries()
+    if entries is not None:
+        b.search[page.file.src_uri] = entries[b._seen:]
+        b._seen = len(entries)
+    return context
+
+
+def on_post_build(config):
+    b = _build
+    logging.getLogger('mkdocs').removeHandler(b.log_handler)
+    pages = {}
+    docs = []
+    for f in b.files.documentation_pages():
+        rec = b.record(f)
+        if rec is not None:
+            pages[f.src_uri] = rec
+            docs.extend(rec['search'])
+    path = os.path.join(config.site_dir, 'search', 'search_index.json')
+    if b.dirty and b.search_index is not None and os.path.isfile(path):
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        data['docs'] = docs
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(data, separators=(',', ':'), default=str))
+    b.save(pages)
+
+
+def on_build_error(error):
+    if _build is not None:
+        logging.getLogger('mkdocs').removeHandler(_build.log_handler)
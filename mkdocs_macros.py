@@ -1,4 +1,15 @@
+import os
+import sys
 from datetime import datetime
+from pathlib import Path
+
+# mkdocs-macros loads this file by path, so make its neighbours (and scripts/) importable
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HERE)
+sys.path.insert(1, os.path.join(HERE, 'scripts'))
+import device_registry  # noqa: E402
+import mkdocs_data_tables  # noqa: E402
+import mkdocs_git_history  # noqa: E402
 
 # This file is used by mkdocs-macros-plugin
 
@@ -6,6 +17,59 @@ def define_env(env):
     """Define variables and functions to be available in MkDocs templates and Markdown.
 
     Usage in Markdown: {{ year }} or {{ now().year }}
+
+    Git history of the current page (or of path, relative to docs/):
+    {{ git_revision_date() }}, {{ git_creation_date('%d %B %Y') }},
+    {{ git_committers() | join(', ') }}
+
+    Tables from CSV / YAML / JSON files in docs/ (see mkdocs_data_tables.py):
+    {{ data_table('inventory.csv', sort=['Site', '-Purchased'], where={'Site': 'HQ'}, per_page=500) }},
+    {% for r in data_rows('/data/vlans.yml', sort='VLAN') %}...{% endfor %}
+
+    Device tables from the device registry (scripts/device_registry.py):
+    {{ device_table('WOR') }}, {{ device_table(model='WORMOD01') }}, {{ device_table(location='LOC') }}
     """
     env.variables['year'] = datetime.utcnow().year
     env.variables['now'] = datetime.utcnow
+
+    def source(path):
+        if path is None:
+            path = env.page.file.src_path
+        return Path(env.conf['docs_dir']) / path
+
+    @env.macro
+    def git_revision_date(fmt=mkdocs_git_history.DATE_FORMAT, path=None, default=''):
+        when = mkdocs_git_history.history(env.conf).modified(source(path))
+        return when.strftime(fmt) if when else default
+
+    @env.macro
+    def git_creation_date(fmt=mkdocs_git_history.DATE_FORMAT, path=None, default=''):
+        when = mkdocs_git_history.history(env.conf).created(source(path))
+        return when.strftime(fmt) if when else default
+
+    @env.macro
+    def git_committers(path=None, limit=None):
+        """Committer names, most commits first."""
+        names = [name for name, _, _ in mkdocs_git_history.history(env.conf).committers(source(path))]
+        return names[:limit] if limit else names
+
+    @env.macro
+    def data_table(src, columns=None, sort=None, where=None, per_page=None, part=1):
+        """Markdown table of a data file; with per_page, one part of it plus a pager."""
+        return mkdocs_data_tables.data_table(env.conf['docs_dir'], env.page.file.src_uri, src,
+                                             columns, sort, where, per_page, part)
+
+    @env.macro
+    def data_rows(src, sort=None, where=None):
+        path = mkdocs_data_tables.data_path(env.conf['docs_dir'], env.page.file.src_uri, src)
+        return mkdocs_data_tables.select(path, sort, where)[1]
+
+    registry = None
+
+    @env.macro
+    def device_table(category=None, model=None, location=None):
+        """Markdown table of the registered devices, filtered by category, model and/or location."""
+        nonlocal registry
+        if registry is None:
+            registry = device_registry.build(env.conf['docs_dir'])
+        return registry.table(category, model, location, page=env.page.file.src_path)
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Benchmark every docs script on synthetic corpora of several sizes.
+
+For each size, gen_corpus.py writes a docs/ + site/ corpus once; each
+script then runs as a subprocess on a fresh copy of it (copying is not
+timed) and the runner records:
+- wall time (best of --repeat runs)
+- peak RSS of the script process (VmHWM, read as it exits) or of its
+  largest worker process, whichever is higher
+- input files per second (Markdown, .txt or HTML pages, whichever the script reads)
+
+Cached scripts run twice: `cold` without the cache and `warm` after a
+priming run has filled it. The `streamed` Markdown cases force the
+line-by-line mode (--stream-above 0); --large-page MB adds a page of that
+size to every corpus (gen_corpus.py), where streaming pays off.
+Equivalence checks (fixer output, cached and streamed runs against plain
+ones, the fast link extractor, search hits) are in tests/test_scripts.py.
+
+Results are compared with a saved baseline (--save-baseline writes one,
+default .cache/bench_baseline.json); a run slower than the baseline by more
+than --tolerance is flagged as a regression. Times under 50 ms are never
+flagged, they are mostly interpreter start-up.
+
+Usage: python3 scripts/bench_scripts.py [--sizes 100,1000,5000] [--only NAME]
+           [--repeat N] [--jobs N] [--large-page MB] [--save-baseline] [--baseline PATH]
+           [--tolerance 0.2] [--json PATH] [--keep DIR]
+Exit code 1 if a script crashed or a regression was found.
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from gen_corpus import generate, large_page
+from result_cache import write_json_atomic
+
+HERE = Path(__file__).resolve().parent
+BASELINE_PATH = Path('.cache') / 'bench_baseline.json'
+MIN_FLAG_SECONDS = 0.05
+
+# Runs a script (or -c code) and writes its peak RSS in bytes to argv[1] on exit.
+# ru_maxrss of a child started by this (large) process would count the memory it
+# inherited at fork, so the script measures itself instead.
+PEAK_WRAPPER = """
+import resource, runpy, sys
+out = sys.argv.pop(1)
+def peak():
+    kids = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * 1024
+    try:
+        with open('/proc/self/status') as f:
+            own = next(int(l.split()[1]) * 1024 for l in f if l.startswith('VmHWM:'))
+    except (OSError, StopIteration):
+        own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    with open(out, 'w') as f:
+        f.write(str(max(own, kids)))
+try:
+    if sys.argv[1] == '-c':
+        del sys.argv[1]
+        sys.argv[0] = '-c'
+        exec(compile(sys.argv.pop(1), '<bench>', 'exec'), {'__name__': '__main__'})
+    else:
+        del sys.argv[0]
+        runpy.run_path(sys.argv[0], run_name='__main__')
+finally:
+    peak()
+"""
+
+# name: (argv after the interpreter, input kind, takes --jobs, prime first, expected exit codes)
+CASES = {
+    'check_md_strict cold': (['check_md_strict.py', '--no-cache'], 'md', True, False, (0, 2)),
+    'check_md_strict warm': (['check_md_strict.py'], 'md', True, True, (0, 2)),
+    'check_md_strict streamed': (['check_md_strict.py', '--no-cache', '--stream-above', '0'], 'md', True, False,
+                                 (0, 2)),
+    'fix_md_strict': (['fix_md_strict.py'], 'md', True, False, (0,)),
+    'fix_md_strict streamed': (['fix_md_strict.py', '--stream-above', '0'], 'md', True, False, (0,)),
+    'fix_bold_spaces': (['fix_bold_spaces.py'], 'md', False, False, (0,)),
+    'fix_bold_spaces streamed': (['fix_bold_spaces.py', '--stream-above', '0'], 'md', False, False, (0,)),
+    'convert_backslash_return': (['convert_backslash_return.py'], 'md', False, False, (0,)),
+    'md_pipeline': (['md_pipeline.py'], 'md', True, False, (0, 2)),
+    'md_pipeline streamed': (['md_pipeline.py', '--stream-above', '0'], 'md', True, False, (0, 2)),
+    'md_link_check': (['md_link_check.py'], 'md', True, False, (0, 1)),
+    'rename_start_to_index': (['rename_start_to_index.py'], 'md', False, False, (0,)),
+    'convert_txt_to_md': (['convert_txt_to_md.py', '--docs', 'docs', '--force'], 'txt', True, False, (0,)),
+    'docs_search cold': (['docs_search.py', '--docs', 'docs', '--rebuild'], 'md', True, False, (0,)),
+    'docs_search query': (['docs_search.py', '--docs', 'docs', 'dhcp', 'serv*', '--limit', '50'], 'md', True, True,
+                          (0, 1)),
+    'near_dupes cold': (['near_dupes.py', '--docs', 'docs', '--cold'], 'md', True, False, (0,)),
+    'near_dupes warm': (['near_dupes.py', '--docs', 'docs'], 'md', True, True, (0,)),
+    'link_check cold': (['link_check.py', '--no-cache'], 'html', True, False, (0, 1)),
+    'link_check warm': (['link_check.py'], 'html', True, True, (0, 1)),
+    'link_check html.parser': (['link_check.py', '--no-cache', '--parser', 'html'], 'html', True, False, (0, 1)),
+    'precompress cold': (['precompress.py', '--cold'], 'html', True, False, (0,)),
+    'precompress warm': (['precompress.py'], 'html', True, True, (0,)),
+}
+
+
+def count_inputs(root):
+    counts = {'md': 0, 'txt': 0, 'html': 0}
+    for dirpath, dirnames, filenames in os.walk(root):
+        for fn in filenames:
+            ext = fn.rsplit('.', 1)[-1].lower()
+            if ext in counts:
+                counts[ext] += 1
+    return counts
+
+
+def run(argv, cwd, log):
+    """Run one script; returns (wall seconds, peak RSS in bytes, exit code)."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(HERE), os.environ.get('PYTHONPATH')])))
+    fd, peak_file = tempfile.mkstemp(prefix='bench_peak_')
+    os.close(fd)
+    cmd = [sys.executable, '-c', PEAK_WRAPPER, peak_file] + [str(HERE / a) if a.endswith('.py') else a for a in argv]
+    try:
+        t0 = time.perf_counter()
+        code = subprocess.call(cmd, cwd=cwd, env=env, stdout=subprocess.DEVNULL, stderr=log)
+        wall = time.perf_counter() - t0
+        with open(peak_file) as f:
+            peak = int(f.read() or 0)
+    finally:
+        os.unlink(peak_file)
+    return wall, peak, code
+
+
+def bench_case(name, pristine, work, jobs, repeat):
+    argv, kind, takes_jobs, prime, ok_codes = CASES[name]
+    argv = list(argv) + (['--jobs', str(jobs)] if takes_jobs and jobs != 1 else [])
+    best = None
+    for _ in range(repeat):
+        if work.exists():
+            shutil.rmtree(work)
+        shutil.copytree(pristine, work)
+        with tempfile.TemporaryFile() as log:
+            if prime:
+                run(argv, work, log)
+            wall, rss, code = run(argv, work, log)
+            if code not in ok_codes:
+                log.seek(0)
+                err = log.read().decode('utf-8', 'replace').strip().splitlines()
+                return {'error': f'exit {code}: {err[-1] if err else "no output"}'}
+        if best is None or wall < best['wall']:
+            best = {'wall': wall, 'rss': rss}
+    best['kind'] = kind
+    return best
+
+
+def compare(results, baseline, tolerance):
+    """Return the list of regressions as (key, wall, baseline wall)."""
+    out = []
+    for key, r in results.items():
+        b = baseline.get(key)
+        if not b or 'wall' not in r or 'wall' not in b:
+            continue
+        if r['wall'] > MIN_FLAG_SECONDS and r['wall'] > b['wall'] * (1 + tolerance):
+            out.append((key, r['wall'], b['wall']))
+    return out
+
+
+def main():
+    ap = argparse.ArgumentParser(description='Benchmark the docs scripts on synthetic corpora')
+    ap.add_argument('--sizes', default='100,1000,5000', help='comma-separated page counts')
+    ap.add_argument('--only', action='append', help='benchmark only this script (repeatable, prefix match)')
+    ap.add_argument('--repeat', type=int, default=1, help='runs per script; the fastest is kept')
+    ap.add_argument('--jobs', type=int, default=1, help='--jobs passed to scripts that take it')
+    ap.add_argument('--seed', type=int, default=0)
+    ap.add_argument('--large-page', type=float, metavar='MB', help='add a page of this size to every corpus')
+    ap.add_argument('--baseline', default=str(BASELINE_PATH), help='baseline file to compare with')
+    ap.add_argument('--save-baseline', action='store_true', help='store these results as the new baseline')
+    ap.add_argument('--tolerance', type=float, default=0.2, help='allowed slowdown against the baseline')
+    ap.add_argument('--json', help='also write the results to this file')
+    ap.add_argument('--keep', help='generate the corpora in this folder and keep them')
+    args = ap.parse_args()
+
+    names = [n for n in CASES if not args.only or any(n.startswith(o) for o in args.only)]
+    sizes = [int(s) for s in args.sizes.split(',')]
+    baseline_path = Path(args.baseline)
+    baseline = {}
+    if baseline_path.exists():
+        baseline = json.loads(baseline_path.read_text(encoding='utf-8')).get('results', {})
+
+    root = Path(args.keep) if args.keep else Path(tempfile.mkdtemp(prefix='bench_scripts_'))
+    results = {}
+    errors = []
+    print(f'{"pages":>6}  {"script":<26}{"wall":>10}{"peak RSS":>11}{"files/s":>10}  baseline')
+    try:
+        for size in sizes:
+            pristine = root / (f'corpus_{size}' + (f'_{args.large_page:g}mb' if args.large_page else ''))
+            if not (pristine / 'docs').is_dir():
+                generate(pristine, size, args.seed)
+                if args.large_page:
+                    large_page(pristine / 'docs' / 'inventory.md', pristine / 'docs', args.large_page, args.seed)
+            counts = count_inputs(pristine)
+            for name in names:
+                key = f'{size}/{name}'
+                r = bench_case(name, pristine, root / 'work', args.jobs, args.repeat)
+                results[key] = r
+                if 'error' in r:
+                    errors.append(key)
+                    print(f'{size:>6}  {name:<26}  FAILED {r["error"]}')
+                    continue
+                rate = counts[r['kind']] / r['wall'] if r['wall'] else 0
+                b = baseline.get(key, {}).get('wall')
+                vs = f'{(r["wall"] / b - 1) * 100:+.0f}%' if b else '-'
+                print(f'{size:>6}  {name:<26}{r["wall"] * 1000:>8.0f}ms{r["rss"] / 2**20:>9.1f}MB{rate:>10.0f}  {vs}')
+    finally:
+        shutil.rmtree(root / 'work', ignore_errors=True)
+        if not args.keep:
+            shutil.rmtree(root, ignore_errors=True)
+
+    payload = {'python': sys.version.split()[0], 'jobs': args.jobs, 'seed': args.seed, 'results': results}
+    if args.json:
+        write_json_atomic(args.json, payload)
+    if args.save_baseline:
+        write_json_atomic(baseline_path, payload)
+        print(f'\nBaseline saved to {baseline_path}')
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f'\nSlower than the baseline by more than {args.tolerance:.0%}:')
+        for key, wall, base in regressions:
+            print(f'- {key}: {wall * 1000:.0f} ms (baseline {base * 1000:.0f} ms)')
+    raise SystemExit(1 if errors or regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -9,92 +9,279 @@ Finds:
 - MD058: blank lines around table blocks
 - MD007: unordered list indent multiples of 2
 
-Usage: python3 scripts/check_md_strict.py
+Findings are cached per file in .cache/check_md_strict.json, keyed by the
+file's content hash and the rule-set version, so a re-run only parses pages
+that changed. Entries for deleted pages are evicted on every run.
+--jobs N checks the changed files in N worker processes (0 = one per core);
+findings are always reported in file order.
+--profile REPORT times reading, hashing, tokenizing and every rule per file
+(see md_profile.py); files served from the cache are not timed, add --cold
+to time them all.
+Files of --stream-above MB or more are hashed in chunks and checked by
+check_stream(), one line at a time, instead of being loaded (see md_scan.py).
+
+Usage: python3 scripts/check_md_strict.py [--cold] [--no-cache] [--jobs N] [--profile REPORT] [--stream-above MB]
 """
+import argparse
 import re
+from heapq import merge
+from operator import itemgetter
 from pathlib import Path
 
-repo = Path('.').resolve()
-docs = repo / 'docs'
-
-heading_re = re.compile(r'^(#{1,6})\s+')
-list_re = re.compile(r'^(\s+)[\*-]\s+')
-
-errors = []
-for p in sorted(docs.rglob('*.md')):
-    rel = p.relative_to(repo)
-    text = p.read_text(encoding='utf-8')
-    # normalize
-    text = text.replace('\r\n','\n').replace('\r','\n')
-    lines = text.split('\n')
-
-    # Skip leading blank lines to find first non-blank (not in code fence)
-    first_nonblank = None
-    in_code = False
-    for i,l in enumerate(lines):
-        if l.strip().startswith('```') or l.strip().startswith('~~~'):
-            in_code = not in_code
-            continue
-        if in_code:
-            continue
-        if l.strip():
-            first_nonblank = (i+1,l)
-            break
-    if first_nonblank:
-        if not re.match(r'^#\s+\S', first_nonblank[1]):
-            errors.append((str(rel),'MD041','First non-blank line is not H1',first_nonblank[0]))
-    else:
-        errors.append((str(rel),'MD041','File is empty'))
+import md_profile
+from md_profile import FileTimer
+import md_scan
+from md_scan import (BLANK, CODE, FENCE, HEADING, LIST, TABLE, Doc, docs_files, iter_kinds, list_re, map_files,
+                     read_lines, streamed, with_next)
+from result_cache import ResultCache, digest, digest_file, source_version
+
+# bump when a rule changes behaviour; edits to this file or md_scan.py also invalidate the cache
+RULES_VERSION = '1'
+CACHE_PATH = Path('.cache') / 'check_md_strict.json'
+
+h1_re = re.compile(r'^#\s+\S')
+image_re = re.compile(r'!\[.*\]\(.*\)')
 
-    # check for hard tabs anywhere
-    for i,l in enumerate(lines, start=1):
-        if '\t' in l:
-            errors.append((str(rel),'MD010','Hard tab at line',i))
 
-    # trailing newline checks
+def rule_md041(rel, doc):
+    """First non-blank line outside code fences must be an H1."""
+    lines = doc.lines
+    for i, k in enumerate(doc.kinds):
+        if k is not FENCE and k is not CODE and k is not BLANK:
+            if not h1_re.match(lines[i]):
+                return [(rel,'MD041','First non-blank line is not H1',i+1)]
+            return []
+    return [(rel,'MD041','File is empty')]
+
+
+def rule_md010(rel, doc):
+    """Hard tabs anywhere, code included."""
+    if '\t' not in doc.text:
+        return []
+    return [(rel,'MD010','Hard tab at line',i) for i, l in enumerate(doc.lines, start=1) if '\t' in l]
+
+
+def rule_md047(rel, doc):
+    """The file ends with exactly one newline."""
+    text = doc.text
     if not text.endswith('\n'):
-        errors.append((str(rel),'MD047','File does not end with a single newline'))
-    else:
-        if text.endswith('\n\n'):
-            errors.append((str(rel),'MD047','File ends with multiple trailing newlines'))
+        return [(rel,'MD047','File does not end with a single newline')]
+    if text.endswith('\n\n'):
+        return [(rel,'MD047','File ends with multiple trailing newlines')]
+    return []
+
 
-    # check headings and tables while skipping fenced code blocks
-    in_code = False
+def rule_md022(rel, doc):
+    """Blank lines around headings."""
+    errors = []
+    lines = doc.lines
     n = len(lines)
-    for i,l in enumerate(lines, start=1):
-        stripped = l.strip()
-        if stripped.startswith('```') or stripped.startswith('~~~'):
-            in_code = not in_code
-            continue
-        if in_code:
-            continue
-        # heading
-        if heading_re.match(l):
-            # check previous non-code line
+    for i, k in enumerate(doc.kinds, start=1):
+        if k is HEADING:
             prev = lines[i-2] if i-2 >= 0 else ''
             nxt = lines[i] if i < n else ''
             if prev.strip() != '':
-                errors.append((str(rel),'MD022','No blank line before heading',i))
+                errors.append((rel,'MD022','No blank line before heading',i))
             if nxt.strip() != '':
-                errors.append((str(rel),'MD022','No blank line after heading',i))
-        # table detection: '|' in line and not image link or html
-        if '|' in l and not re.match(r'!\[.*\]\(.*\)', stripped) and not stripped.startswith('<'):
+                errors.append((rel,'MD022','No blank line after heading',i))
+    return errors
+
+
+def rule_md058(rel, doc):
+    """Blank lines around table blocks: '|' in a line that is not an image link or html."""
+    errors = []
+    lines = doc.lines
+    n = len(lines)
+    for i, (l, k) in enumerate(zip(lines, doc.kinds), start=1):
+        if k is FENCE or k is CODE or k is BLANK or '|' not in l:
+            continue
+        stripped = l.strip()
+        if not image_re.match(stripped) and not stripped.startswith('<'):
             prev = lines[i-2] if i-2 >= 0 else ''
             nxt = lines[i] if i < n else ''
             if prev.strip() != '' and '|' not in prev:
-                errors.append((str(rel),'MD058','No blank line before table',i))
+                errors.append((rel,'MD058','No blank line before table',i))
             if nxt.strip() != '' and '|' not in nxt:
-                errors.append((str(rel),'MD058','No blank line after table',i))
-        # unordered list indent
-        m = list_re.match(l)
-        if m:
-            sp = len(m.group(1))
-            if sp % 2 != 0:
-                errors.append((str(rel),'MD007','Unordered list indent not multiple of 2 spaces',i))
-
-if not errors:
-    print('OK')
-    raise SystemExit(0)
-for e in errors:
-    print(f"{e[0]}\t{e[1]}\t{e[2]}:{'' if len(e)<4 else e[3]}")
-raise SystemExit(2)
+                errors.append((rel,'MD058','No blank line after table',i))
+    return errors
+
+
+def rule_md007(rel, doc):
+    """Unordered list indent in multiples of 2 spaces."""
+    errors = []
+    for i, (l, k) in enumerate(zip(doc.lines, doc.kinds), start=1):
+        if k is LIST or k is TABLE:
+            m = list_re.match(l)
+            if m and len(m.group(1)) % 2 != 0:
+                errors.append((rel,'MD007','Unordered list indent not multiple of 2 spaces',i))
+    return errors
+
+
+# whole-file rules are reported first, then the per-line rules merged by line number
+FILE_RULES = [('MD041', rule_md041), ('MD010', rule_md010), ('MD047', rule_md047)]
+LINE_RULES = [('MD022', rule_md022), ('MD058', rule_md058), ('MD007', rule_md007)]
+
+
+def check_doc(rel, doc, timer=None):
+    """Return the list of findings for one tokenized file.
+
+    With a md_profile.FileTimer, the time of every rule is charged to its code.
+    """
+    errors = []
+    for code, rule in FILE_RULES:
+        errors.extend(rule(rel, doc))
+        if timer:
+            timer.lap(code)
+    per_line = []
+    for code, rule in LINE_RULES:
+        per_line.append(rule(rel, doc))
+        if timer:
+            timer.lap(code)
+    # merge() keeps LINE_RULES order for findings on the same line
+    errors.extend(merge(*per_line, key=itemgetter(3)))
+    return errors
+
+
+def check_stream(rel, pairs):
+    """check_doc() in one pass over (line, kind) pairs, e.g. iter_kinds(read_lines(path)).
+
+    Same findings in the same order; only the findings and the lines
+    around the current one are kept.
+    """
+    md041 = None
+    tabs = []
+    per_line = []
+    add = per_line.append
+    prev2 = prev = ''
+    i = 0
+    for i, ((l, k), (nxt, _)) in enumerate(with_next(pairs, ('', None)), start=1):
+        if md041 is None and k is not FENCE and k is not CODE and k is not BLANK:
+            md041 = [] if h1_re.match(l) else [(rel,'MD041','First non-blank line is not H1',i)]
+        if '\t' in l:
+            tabs.append((rel,'MD010','Hard tab at line',i))
+        if k is HEADING:
+            if prev.strip() != '':
+                add((rel,'MD022','No blank line before heading',i))
+            if nxt.strip() != '':
+                add((rel,'MD022','No blank line after heading',i))
+        if k is not FENCE and k is not CODE and k is not BLANK and '|' in l:
+            stripped = l.strip()
+            if not image_re.match(stripped) and not stripped.startswith('<'):
+                if prev.strip() != '' and '|' not in prev:
+                    add((rel,'MD058','No blank line before table',i))
+                if nxt.strip() != '' and '|' not in nxt:
+                    add((rel,'MD058','No blank line after table',i))
+        if k is LIST or k is TABLE:
+            m = list_re.match(l)
+            if m and len(m.group(1)) % 2 != 0:
+                add((rel,'MD007','Unordered list indent not multiple of 2 spaces',i))
+        prev2, prev = prev, l
+    # the text ends with a newline when its last line is empty (see Doc.lines)
+    if i < 2 or prev != '':
+        md047 = [(rel,'MD047','File does not end with a single newline')]
+    elif i > 2 and prev2 == '':
+        md047 = [(rel,'MD047','File ends with multiple trailing newlines')]
+    else:
+        md047 = []
+    return (md041 if md041 is not None else [(rel,'MD041','File is empty')]) + tabs + md047 + per_line
+
+
+def format_error(e):
+    return f"{e[0]}\t{e[1]}\t{e[2]}:{'' if len(e)<4 else e[3]}"
+
+
+def report(errors):
+    """Print findings in the checker's format and return the exit code."""
+    if not errors:
+        print('OK')
+        return 0
+    for e in errors:
+        print(format_error(e))
+    return 2
+
+
+def rules_version():
+    here = Path(__file__).resolve().parent
+    return source_version(here / 'check_md_strict.py', here / 'md_scan.py', tag=RULES_VERSION)
+
+
+def check_task(task):
+    """Worker: hash and check one file. Skips the check when the hash equals known_hash.
+
+    Returns (stat, hash, findings or None, phase times or None); phases are
+    only timed when the task's profile flag is set.
+    """
+    p, rel, known_hash, profile, stream_above = task
+    timer = FileTimer() if profile else None
+    st = p.stat()
+    if streamed(p, stream_above):
+        h = digest_file(p)
+        if timer:
+            timer.lap('hash')
+        if h == known_hash:
+            return st, h, None, timer and timer.times
+        res = [list(e[1:]) for e in check_stream(rel, iter_kinds(read_lines(p)))]
+        if timer:
+            timer.lap('stream')
+        return st, h, res, timer and timer.times
+    data = p.read_bytes()
+    if timer:
+        timer.lap('read')
+    h = digest(data)
+    if timer:
+        timer.lap('hash')
+    if h == known_hash:
+        return st, h, None, timer and timer.times
+    doc = Doc(data.decode('utf-8'), p)
+    if timer:
+        timer.lap('tokenize')
+    res = [list(e[1:]) for e in check_doc(rel, doc, timer)]
+    return st, h, res, timer and timer.times
+
+
+def main():
+    ap = argparse.ArgumentParser(description='Strict markdown checker for docs/')
+    ap.add_argument('--cold', action='store_true', help='ignore cached findings and re-check every file')
+    ap.add_argument('--no-cache', action='store_true', help='do not read or write the findings cache')
+    ap.add_argument('--jobs', type=int, default=1, help='worker processes (0 = one per core)')
+    md_profile.add_arguments(ap)
+    md_scan.add_stream_argument(ap)
+    args = ap.parse_args()
+
+    profile = md_profile.from_args(args)
+    repo = Path('.').resolve()
+    docs = repo / 'docs'
+    cache = None if args.no_cache else ResultCache(repo / CACHE_PATH, rules_version(), cold=args.cold)
+    found = {}
+    tasks = []
+    for p in docs_files(docs):
+        rel = str(p.relative_to(repo))
+        # reserve the slot so findings keep docs_files() order
+        found[rel] = None
+        if cache is not None:
+            hit, found[rel] = cache.fresh(rel, p.stat())
+            if hit:
+                continue
+        tasks.append((p, rel, cache.cached_hash(rel) if cache is not None else None, profile is not None,
+                      args.stream_above))
+    for (p, rel, *_), (st, h, res, times) in zip(tasks, map_files(check_task, tasks, args.jobs)):
+        if profile is not None:
+            profile.add(rel, times)
+        if cache is None:
+            found[rel] = res
+        elif res is None:
+            found[rel] = cache.match(rel, st, h)[1]
+        else:
+            cache.put(rel, st, h, res)
+            found[rel] = res
+    if cache is not None:
+        cache.save()
+    errors = [(rel, *e) for rel, res in found.items() for e in res]
+    code = report(errors)
+    if profile is not None:
+        profile.finish()
+    raise SystemExit(code)
+
+
+if __name__ == '__main__':
+    main()
@@ -8,12 +8,21 @@ Behavior:
 - Skip inline code (text inside backticks `...`)
 - Replace contiguous sequences of two or more backslashes ("\\\\") with a single newline
   inserted at that position.
+- Files of --stream-above MB or more are converted line by line and written through a
+  temp file instead of being loaded (see md_scan.py).
 
-Run: python3 scripts/convert_backslash_return.py
+Run: python3 scripts/convert_backslash_return.py [--profile REPORT] [--stream-above MB]  (see md_profile.py)
 """
+import argparse
 import re
 from pathlib import Path
-from typing import Tuple
+from typing import List, Tuple
+
+import md_profile
+from md_profile import FileTimer
+import md_scan
+from md_scan import (CODE, FENCE, Doc, iter_kinds, read_lines, repo_md_files, split_chunks, stream_rewrite, streamed,
+                     with_next, write_atomic)
 
 ROOT = Path('.')
 
@@ -32,41 +41,112 @@ def convert_text(text: str) -> Tuple[str, bool]:
     return '`'.join(parts), changed
 
 
+def convert_line(line: str, kind: str) -> Tuple[List[str], bool]:
+    """Convert one classified line (with its newline, if any). Return (output lines, changed)."""
+    if kind is FENCE or kind is CODE:
+        return [line], False
+    new_line, changed = convert_text(line)
+    # new_line may contain embedded newlines; preserve them as separate lines
+    return [ln + '\n' if not ln.endswith('\n') else ln for ln in new_line.splitlines()], changed
+
+
+def convert_doc(doc) -> Tuple[str, bool]:
+    """Convert backslash markers in one tokenized file. Return (new_text, changed)."""
+    lines = doc.lines
+    # doc.lines ends with '' when the text ends with a newline
+    last = len(lines) - 1
+    if lines[last] == '':
+        lines = lines[:last]
+        last -= 1
+    out_lines = []
+    changed_file = False
+    for i, (line, kind) in enumerate(zip(lines, doc.kinds)):
+        line = line if i == last and not doc.text.endswith('\n') else line + '\n'
+        new_lines, changed = convert_line(line, kind)
+        if changed:
+            changed_file = True
+        out_lines.extend(new_lines)
+
+    if not changed_file:
+        return doc.text, False
+    new_s = ''.join(out_lines)
+    # Normalize accidental double-newlines to single blank lines where appropriate
+    # (keep paragraphs separated by a single blank line)
+    return re.sub(r"\n{3,}", "\n\n", new_s), True
+
+
+def has_markers(pairs) -> bool:
+    """True if convert_doc() would convert anything in the file given as (line, kind) pairs."""
+    return any(convert_text(line)[1] for line, kind in pairs if kind is not FENCE and kind is not CODE)
+
+
+def convert_lines(pairs):
+    """Yield the lines of convert_doc()'s text for a file with markers, from streamed (line, kind) pairs."""
+    def pieces():
+        for (line, kind), (_, next_kind) in with_next(pairs, ('', None)):
+            if next_kind is None:
+                # the last line: '' when the text ends with a newline
+                if line:
+                    yield from convert_line(line, kind)[0]
+                return
+            yield from convert_line(line + '\n', kind)[0]
+
+    def collapsed():
+        # every piece ends with at most one newline: drop the third and later in a row,
+        # as the re.sub() in convert_doc() does
+        run = 0
+        for piece in pieces():
+            if piece == '\n':
+                run += 1
+                if run > 2:
+                    continue
+            else:
+                run = 1 if piece.endswith('\n') else 0
+            yield piece
+
+    return split_chunks(collapsed())
+
+
 def main():
-    md_files = [p for p in ROOT.glob('**/*.md') if '.git/' not in str(p) and 'site/' not in str(p) and 'scripts/.venv' not in str(p)]
-    modified = []
-    for p in md_files:
-        s = p.read_text(encoding='utf-8')
-        lines = s.splitlines(True)
-        out_lines = []
-        in_fence = False
-        changed_file = False
-        for line in lines:
-            stripped = line.lstrip()
-            if stripped.startswith('```') or stripped.startswith('~~~'):
-                in_fence = not in_fence
-                out_lines.append(line)
-                continue
-            if in_fence:
-                out_lines.append(line)
-                continue
-            new_line, changed = convert_text(line)
-            if changed:
-                changed_file = True
-            # new_line may contain embedded newlines; preserve them as separate lines
-            out_lines.extend([ln + '\n' if not ln.endswith('\n') else ln for ln in new_line.splitlines()])
+    ap = argparse.ArgumentParser(description='Convert double-backslash return markers into newlines')
+    md_profile.add_arguments(ap)
+    md_scan.add_stream_argument(ap)
+    args = ap.parse_args()
 
+    profile = md_profile.from_args(args)
+    modified = []
+    for p in repo_md_files(ROOT):
+        timer = FileTimer() if profile else None
+        if streamed(p, args.stream_above):
+            # a file without markers is left as it is, so only rewrite the ones with some
+            if has_markers(iter_kinds(read_lines(p))) and stream_rewrite(p, convert_lines):
+                modified.append(str(p))
+            if timer:
+                timer.lap('stream')
+                profile.add(p, timer)
+            continue
+        text = p.read_text(encoding='utf-8')
+        if timer:
+            timer.lap('read')
+        doc = Doc(text, p)
+        if timer:
+            timer.lap('tokenize')
+        new_s, changed_file = convert_doc(doc)
+        if timer:
+            timer.lap('convert')
         if changed_file:
-            new_s = ''.join(out_lines)
-            # Normalize accidental double-newlines to single blank lines where appropriate
-            # (keep paragraphs separated by a single blank line)
-            new_s = re.sub(r"\n{3,}", "\n\n", new_s)
-            p.write_text(new_s, encoding='utf-8')
+            write_atomic(p, new_s)
             modified.append(str(p))
+            if timer:
+                timer.lap('write')
+        if timer:
+            profile.add(p, timer)
 
     print(f"Files modified: {len(modified)}")
     for m in modified:
         print(" -", m)
+    if profile is not None:
+        profile.finish()
 
 
 if __name__ == '__main__':
@@ -5,21 +5,125 @@ Rules applied (conservative):
 - DokuWiki headings (== ... ==) -> Markdown # headings (level = number of =, capped at 6)
 - Links of form [[url|text]] -> [text](url)
 - Links of form [[url]] -> [url](url)
-- Other [[internal links]] -> plain text (internal links not rewritten)
+- Internal links [[page|text]], [[ns:page]], [[.:page#section]] -> [text](relative/page.md#section)
+  when the page is part of the import (or already a .md page); otherwise plain text, as before
 - Emphasis: //// -> ** (bold), //text// -> *text* (italic)
 - Convert simple horizontal rules of ---- to ---
 
 The script writes .md files next to the .txt files and leaves the .txt files unchanged.
+
+Import mode for large wikis:
+- the page-name index of the whole tree (every .txt and .md file) is built
+  from the file names before anything is converted, so resolving a link is
+  a dict lookup. Page ids follow DokuWiki: folders are namespaces, names
+  are lower-cased with spaces as `_`; `ns:page` is absolute, a bare `page`
+  is looked up in the current namespace and then by name anywhere (when
+  unique), `.:` / `..:` are relative, and `ns:`, `ns:start` or `ns:index`
+  is the namespace's start page, whichever of index.md / start.md it has
+- files whose .md is newer than the .txt are skipped (--force converts
+  everything; use it after adding pages that older pages link to)
+- files are converted one at a time in --jobs worker processes and written
+  atomically
+- the run ends with a summary of the internal links that did not resolve
+
+Usage: python3 scripts/convert_txt_to_md.py [--docs DIR] [--force] [--jobs N]
 """
 
+import argparse
 import os
+import posixpath
 import re
 from pathlib import Path
+from urllib.parse import quote
+
+from md_link_check import slugify
+from md_scan import map_files, write_atomic
 
 ROOT = Path(__file__).resolve().parents[1]
 DOCS = ROOT / 'docs'
 
-def convert_content(text: str) -> str:
+HEADING_RE = re.compile(r'^(=+)\s*(.*?)\s*\1\s*$', re.MULTILINE)
+LINK_RE = re.compile(r'\[\[([^\]|]+)(?:\|([^\]]*))?\]\]')
+EXTERNAL_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9+.-]*://')
+ITALIC_RE = re.compile(r'//([^/].*?)//', re.DOTALL)
+HR_RE = re.compile(r'^----+$', re.MULTILINE)
+# names DokuWiki and this repo use for a namespace's main page
+START_PAGES = ('index', 'start')
+
+
+def clean_id(name):
+    """DokuWiki-style page id component(s): lower case, whitespace as '_', '/' as ':'."""
+    return re.sub(r'\s+', '_', name.strip().lower().replace('/', ':'))
+
+
+class PageIndex:
+    """Page id -> docs-relative .md path for every page of the import."""
+
+    def __init__(self, rels):
+        self.ids = {}
+        by_name = {}
+        starts = []
+        for rel in sorted(rels):
+            base = posixpath.splitext(rel)[0]
+            md = base + '.md'
+            page_id = clean_id(base.replace('/', ':'))
+            self.ids.setdefault(page_id, md)
+            ns, _, name = page_id.rpartition(':')
+            by_name.setdefault(name, set()).add(md)
+            if name in START_PAGES:
+                starts.append((ns, md))
+        # `ns`, `ns:start` and `ns:index` all link to whichever start page the
+        # namespace has (after the exact ids, so a real start.md keeps its own)
+        for ns, md in starts:
+            for alias in [ns] + [f'{ns}:{name}' if ns else name for name in START_PAGES]:
+                self.ids.setdefault(alias, md)
+        self.names = {name: next(iter(mds)) for name, mds in by_name.items() if len(mds) == 1}
+
+    def resolve(self, target, ns):
+        """Return the .md path a link target in namespace ns points at, or None."""
+        target = clean_id(target)
+        if target.startswith('.'):
+            parts = ns.split(':') if ns else []
+            while True:
+                if target.startswith('..:'):
+                    parts = parts[:-1]
+                    target = target[3:]
+                elif target.startswith('.:'):
+                    target = target[2:]
+                else:
+                    break
+            page_id = ':'.join(parts + [target])
+        elif ':' in target:
+            # `ns:page` and `:ns:page` are absolute, `ns:` is the namespace's start page
+            page_id = target
+        else:
+            return (self.ids.get(f'{ns}:{target}' if ns else target) or self.ids.get(target)
+                    or self.names.get(target))
+        return self.ids.get(page_id.strip(':'))
+
+
+def internal_link(index, src_md, target, label, unresolved, line):
+    page, _, section = target.partition('#')
+    text = label if label else target
+    if not page.strip():
+        return f'[{text}](#{slugify(section.replace("_", " "))})' if section else text
+    ns = clean_id(posixpath.dirname(src_md).replace('/', ':'))
+    dst = index.resolve(page, ns)
+    if dst is None:
+        unresolved.append((line, target))
+        return text
+    url = quote(posixpath.relpath(dst, posixpath.dirname(src_md)), safe='/')
+    if section:
+        url += '#' + slugify(section.replace('_', ' '))
+    return f'[{text}]({url})'
+
+
+def convert_content(text: str, index=None, src_md=None, unresolved=None) -> str:
+    """Convert one page. Without an index, internal links become plain text.
+
+    src_md is the docs-relative path of the output page; unresolved (a list)
+    collects (line, target) for internal links the index could not resolve.
+    """
     # Headings: lines like "===== Title ====="
     def heading_repl(m):
         equals = m.group(1)
@@ -27,22 +131,33 @@ def convert_content(text: str) -> str:
         level = min(len(equals), 6)
         return f"{('#' * level)} {title}"
 
-    text = re.sub(r'^(=+)\s*(.*?)\s*\1\s*$', heading_repl, text, flags=re.MULTILINE)
+    text = HEADING_RE.sub(heading_repl, text)
+
+    # Links, in one pass: [[http...|Text]] -> [Text](http...), [[http...]] -> [http...](http...),
+    # internal [[Page|Label]] / [[Page]] -> relative link (or Label / Page when unresolved)
+    pos = 0
+    lineno = 1
+
+    def link_repl(m):
+        nonlocal pos, lineno
+        target = m.group(1)
+        label = m.group(2) or ''
+        if EXTERNAL_RE.match(target):
+            return f'[{label or target}]({target})'
+        if index is None:
+            return label or target
+        lineno += text.count('\n', pos, m.start())
+        pos = m.start()
+        return internal_link(index, src_md, target.strip(), label, unresolved, lineno)
 
-    # Links: [[http...|Text]] -> [Text](http...)
-    text = re.sub(r"\[\[(https?://[^\|\]]+)\|([^\]]+)\]\]", r"[\2](\1)", text)
-    # Links: [[http...]] -> [http...](http...)
-    text = re.sub(r"\[\[(https?://[^\]]+)\]\]", r"[\1](\1)", text)
-    # Other internal/wiki links [[Page|Label]] or [[Page]] -> Label or Page (no link)
-    text = re.sub(r"\[\[([^\]|]+)\|([^\]]+)\]\]", r"\2", text)
-    text = re.sub(r"\[\[([^\]]+)\]\]", r"\1", text)
+    text = LINK_RE.sub(link_repl, text)
 
     # Bold/italics: replace //// with ** first, then //...// -> *...*
     text = text.replace('////', '**')
-    text = re.sub(r'//([^/].*?)//', r'*\1*', text, flags=re.DOTALL)
+    text = ITALIC_RE.sub(r'*\1*', text)
 
     # Horizontal rule
-    text = re.sub(r'^----+$', '---', text, flags=re.MULTILINE)
+    text = HR_RE.sub('---', text)
 
     # Trim trailing spaces on lines
     text = '\n'.join([line.rstrip() for line in text.splitlines()]) + '\n'
@@ -50,24 +165,92 @@ def convert_content(text: str) -> str:
     return text
 
 
+_index = None
+_docs = None
+
+
+def init_worker(docs, index):
+    """Share the docs root and page index with the converting processes (set once per worker)."""
+    global _docs, _index
+    _docs = docs
+    _index = index
+
+
+def convert_task(rel):
+    """Worker: convert docs/<rel> (.txt) to .md. Returns (rel, unresolved, error)."""
+    src = _docs / rel
+    md_rel = posixpath.splitext(rel)[0] + '.md'
+    unresolved = []
+    try:
+        text = src.read_text(encoding='utf-8')
+        write_atomic(_docs / md_rel, convert_content(text, _index, md_rel, unresolved))
+    except Exception as e:
+        return rel, unresolved, str(e)
+    return rel, unresolved, None
+
+
 def main():
+    ap = argparse.ArgumentParser(description='Convert DokuWiki .txt pages under docs/ to Markdown')
+    ap.add_argument('--docs', default=str(DOCS), help='docs folder (default: the repo docs/)')
+    ap.add_argument('--force', action='store_true', help='convert files whose .md is already up to date')
+    ap.add_argument('--jobs', type=int, default=1, help='worker processes (0 = one per core)')
+    args = ap.parse_args()
+
+    docs = Path(args.docs)
+    if not docs.exists():
+        print(f'Docs directory not found at {docs}')
+        raise SystemExit(1)
+
+    pages = []
+    todo = []
+    skipped = 0
+    for dirpath, dirnames, filenames in os.walk(docs):
+        dirnames.sort()
+        rel_dir = os.path.relpath(dirpath, docs).replace(os.sep, '/')
+        names = set(filenames)
+        for fn in sorted(filenames):
+            low = fn.lower()
+            if not (low.endswith('.txt') or low.endswith('.md')):
+                continue
+            rel = posixpath.normpath(posixpath.join(rel_dir, fn))
+            pages.append(rel)
+            if not low.endswith('.txt'):
+                continue
+            md = fn[:-4] + '.md'
+            if not args.force and md in names:
+                try:
+                    if os.stat(os.path.join(dirpath, md)).st_mtime_ns >= os.stat(os.path.join(dirpath, fn)).st_mtime_ns:
+                        skipped += 1
+                        continue
+                except FileNotFoundError:
+                    pass
+            todo.append(rel)
+
+    index = PageIndex(pages)
     converted = 0
     errors = []
-    for dirpath, dirnames, filenames in os.walk(DOCS):
-        for fn in filenames:
-            if not fn.lower().endswith('.txt'):
-                continue
-            src = Path(dirpath) / fn
-            dst = src.with_suffix('.md')
-            try:
-                text = src.read_text(encoding='utf-8')
-                new = convert_content(text)
-                dst.write_text(new, encoding='utf-8')
-                converted += 1
-            except Exception as e:
-                errors.append((str(src), str(e)))
-
-    print(f'Converted {converted} .txt files to .md')
+    unresolved = []
+    for rel, missing, err in map_files(convert_task, todo, args.jobs, initializer=init_worker,
+                                       initargs=(docs, index)):
+        if err is not None:
+            errors.append((str(docs / rel), err))
+            continue
+        converted += 1
+        unresolved.extend((rel, line, target) for line, target in missing)
+
+    print(f'Converted {converted} .txt files to .md' + (f' ({skipped} up to date, skipped)' if skipped else ''))
+    if unresolved:
+        targets = {}
+        for _, _, target in unresolved:
+            targets[target] = targets.get(target, 0) + 1
+        print(f'\nUnresolved internal links: {len(unresolved)} (to {len(targets)} distinct pages), kept as plain text:')
+        for rel, line, target in unresolved[:200]:
+            print(f'- {docs / rel}:{line} -> [[{target}]]')
+        if len(unresolved) > 200:
+            print(f'  ... {len(unresolved) - 200} more')
+        print('Most linked missing pages:')
+        for target, n in sorted(targets.items(), key=lambda kv: (-kv[1], kv[0]))[:10]:
+            print(f'  {n:5d}  {target}')
     if errors:
         print('\nErrors:')
         for p, e in errors:
@@ -75,7 +258,4 @@ def main():
 
 
 if __name__ == '__main__':
-    if not DOCS.exists():
-        print(f'Docs directory not found at {DOCS}')
-        raise SystemExit(1)
     main()
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Registry of the device / model / deviation codes used in docs/.
+
+The device list, model and deviation pages (301-303, 401-403) name
+hardware with codes of the form (CAT = category: WOR workstation, PER
+peripheral, INF infrastructure):
+- CATIDEnn       device ID
+- CATMODnn       model
+- CATDEVmmnn     deviation nn of model mm
+- LLLCATiimmnn   device name: location code, category, device ID, model,
+                 deviation number (00 = manufacturer defaults)
+
+A device is declared by a line or table row holding its CATIDEnn followed
+by its model (and its deviation and name, when it has them), as in
+301_workstation_devicelist.md. A model or deviation is defined by an
+`... Identification: CODE` line, as in 302 / 303. Any other occurrence is
+a reference. Fenced code blocks and examples such as `(ex: INFMOD01)` are
+skipped.
+
+docs/ is scanned once; each page's codes are cached by content hash in
+.cache/device_registry.json next to docs/ (see result_cache.py), which also stores the
+assembled index: device -> model -> deviation -> location, plus the pages
+listing each of them. The checks flag:
+- codes with the wrong number of digits
+- devices declared twice, models / deviations defined on two pages
+- devices whose model or deviation has no page (dangling), references to
+  undefined devices, models or deviations
+- a deviation bound to another model than the device's, a name whose
+  category or digits disagree with the device's ID, model and deviation
+
+mkdocs_macros.py renders device tables from the registry
+({{ device_table('WOR') }}).
+
+Usage: python3 scripts/device_registry.py [--docs DIR] [--cold] [--jobs N] [--json PATH] [--list]
+Exit code 1 if problems were found.
+"""
+import argparse
+import os
+import posixpath
+import re
+from pathlib import Path
+
+from md_scan import CODE, FENCE, Doc, map_files
+from result_cache import ResultCache, digest, source_version, write_json_atomic
+
+ROOT = Path(__file__).resolve().parents[1]
+DOCS = ROOT / 'docs'
+CACHE_PATH = Path('.cache') / 'device_registry.json'
+# bump when the cached page records change shape
+INDEX_VERSION = '1'
+
+CATEGORIES = {'WOR': 'Workstation', 'PER': 'Peripheral', 'INF': 'Infrastructure'}
+_CAT = '|'.join(CATEGORIES)
+CODE_RE = re.compile(rf'\b(?:({_CAT})(IDE|MOD|DEV)([0-9]+)|([A-Z][A-Z0-9]{{2}})({_CAT})([0-9]+))\b')
+DEF_RE = re.compile(rf'Identification\b.*:\s*[*_`]*(({_CAT})(?:MOD|DEV)[0-9]+)[*_`]*\s*$')
+# "(ex: INFMOD01)" in the templates is an example, not a reference
+EXAMPLE_RE = re.compile(r'\((?:ex|e\.g\.|eg)\b[^)]*\)', re.I)
+DIGITS = {'IDE': 2, 'MOD': 2, 'DEV': 4, 'NAME': 6}
+KIND_NAMES = {'IDE': 'device ID', 'MOD': 'model', 'DEV': 'deviation', 'NAME': 'device name'}
+
+
+def registry_version():
+    here = Path(__file__).resolve().parent
+    return source_version(here / 'device_registry.py', here / 'md_scan.py', tag=INDEX_VERSION)
+
+
+def page_codes(text):
+    """Extract the codes of one page: {'devices', 'defs', 'refs', 'bad'}, all with 1-based line numbers.
+
+    devices: [line, id, model, deviation or None, name or None]
+    defs / refs: [line, code]; bad: [line, token, message]
+    """
+    doc = Doc(text)
+    out = {'devices': [], 'defs': [], 'refs': [], 'bad': []}
+    for i, (line, kind) in enumerate(zip(doc.lines, doc.kinds), 1):
+        if kind is FENCE or kind is CODE:
+            continue
+        tokens = []
+        examples = [m.span() for m in EXAMPLE_RE.finditer(line)]
+        for m in CODE_RE.finditer(line):
+            if any(s <= m.start() < e for s, e in examples):
+                continue
+            if m.group(1):
+                k, digits = m.group(2), m.group(3)
+            else:
+                k, digits = 'NAME', m.group(6)
+            if len(digits) != DIGITS[k]:
+                out['bad'].append([i, m.group(0), f'{KIND_NAMES[k]} needs {DIGITS[k]} digits'])
+                continue
+            tokens.append((k, m.group(0)))
+        if not tokens:
+            continue
+        d = DEF_RE.search(line)
+        if d:
+            out['defs'].append([i, d.group(1)])
+            tokens = [t for t in tokens if t[1] != d.group(1)]
+        # a device ID starts a declaration when a model follows it before the next ID
+        j = 0
+        while j < len(tokens):
+            k, code = tokens[j]
+            end = j + 1
+            while end < len(tokens) and tokens[end][0] != 'IDE':
+                end += 1
+            seg = tokens[j + 1:end]
+            if k == 'IDE' and seg and seg[0][0] == 'MOD':
+                first = {}
+                for sk, sc in seg[1:]:
+                    first.setdefault(sk, sc)
+                out['devices'].append([i, code, seg[0][1], first.get('DEV'), first.get('NAME')])
+                # anything after model, deviation and name in the segment is a plain reference
+                used = {seg[0][1], first.get('DEV'), first.get('NAME')}
+                out['refs'].extend([i, sc] for _, sc in seg[1:] if sc not in used)
+            else:
+                out['refs'].extend([i, c] for _, c in tokens[j:end])
+            j = end
+    return out
+
+
+def code_kind(code):
+    """'IDE', 'MOD', 'DEV' or 'NAME' for a well-formed code."""
+    return code[3:6] if code[3:6] in ('IDE', 'MOD', 'DEV') else 'NAME'
+
+
+def scan_task(task):
+    """Worker: hash one page and extract its codes unless the hash equals known_hash."""
+    p, known_hash = task
+    st = p.stat()
+    data = p.read_bytes()
+    h = digest(data)
+    if h == known_hash:
+        return st, h, None
+    return st, h, page_codes(data.decode('utf-8'))
+
+
+class Registry:
+    """Devices, models and deviations of docs/ with the pages that declare and reference them."""
+
+    def __init__(self, pages, rescanned=0):
+        self.pages = pages
+        self.rescanned = rescanned
+        # keyed by device name (IDs are only unique per location), by ID for unnamed devices
+        self.devices = {}
+        self.ids = set()
+        self.models = {}
+        self.deviations = {}
+        self.problems = []
+        self.refs = {}
+        for rel, codes in sorted(pages.items()):
+            for line, code in codes['defs']:
+                table = self.models if code_kind(code) == 'MOD' else self.deviations
+                if code in table:
+                    prev = table[code]
+                    self.problem(rel, line, f'{code} is already defined in docs/{prev["page"]}:{prev["line"]}')
+                    continue
+                entry = {'page': rel, 'line': line, 'devices': []}
+                if code_kind(code) == 'DEV':
+                    entry['model'] = code[:3] + 'MOD' + code[6:8]
+                else:
+                    entry['deviations'] = []
+                table[code] = entry
+            for line, token, message in codes['bad']:
+                self.problem(rel, line, f'malformed code {token}: {message}')
+            for line, code in codes['refs']:
+                self.refs.setdefault(code, []).append((rel, line))
+        seen = {}
+        for rel, codes in sorted(pages.items()):
+            for line, dev_id, model, deviation, name in codes['devices']:
+                location = name[:3] if name else None
+                if (location, dev_id) in seen:
+                    prev = self.devices[seen[location, dev_id]]
+                    where = f' at {location}' if location else ''
+                    self.problem(rel, line,
+                                 f'{dev_id}{where} is already declared in docs/{prev["page"]}:{prev["line"]}')
+                    continue
+                key = seen[location, dev_id] = name or dev_id
+                self.devices[key] = {'page': rel, 'line': line, 'id': dev_id, 'category': dev_id[:3],
+                                     'model': model, 'deviation': deviation, 'name': name, 'location': location}
+                self.ids.add(dev_id)
+                self._check_device(rel, line, key, model, deviation, name)
+        for code, dev in sorted(self.deviations.items()):
+            model = self.models.get(dev['model'])
+            if model is None:
+                self.problem(dev['page'], dev['line'], f'{code} extends model {dev["model"]}, which has no page')
+            else:
+                model['deviations'].append(code)
+        for code, where in sorted(self.refs.items()):
+            k = code_kind(code)
+            if k == 'NAME':
+                continue
+            known = {'IDE': self.ids, 'MOD': self.models, 'DEV': self.deviations}[k]
+            if code not in known:
+                for rel, line in where:
+                    self.problem(rel, line, f'reference to undefined {KIND_NAMES[k]} {code}')
+        self.problems.sort()
+
+    def problem(self, rel, line, message):
+        self.problems.append((rel, line, message))
+
+    def _check_device(self, rel, line, key, model, deviation, name):
+        dev_id = self.devices[key]['id']
+        cat = dev_id[:3]
+        for code in (model, deviation, name):
+            if code and (code[3:6] if code_kind(code) == 'NAME' else code[:3]) != cat:
+                self.problem(rel, line, f'{dev_id}: {code} belongs to another category')
+        if model in self.models:
+            self.models[model]['devices'].append(key)
+        else:
+            self.problem(rel, line, f'{dev_id}: model {model} has no page (dangling)')
+        if deviation:
+            if deviation[6:8] != model[6:8]:
+                self.problem(rel, line, f'{dev_id}: deviation {deviation} extends model {deviation[:3]}MOD'
+                                        f'{deviation[6:8]}, not {model}')
+            if deviation in self.deviations:
+                self.deviations[deviation]['devices'].append(key)
+            else:
+                self.problem(rel, line, f'{dev_id}: deviation {deviation} has no page (dangling)')
+        if name:
+            expected = dev_id[6:8] + model[6:8] + (deviation[8:10] if deviation else '00')
+            if name[6:] != expected:
+                self.problem(rel, line, f'{dev_id}: name {name} does not match ID/model/deviation '
+                                        f'(expected {name[:6]}{expected})')
+
+    def index(self):
+        """The assembled registry as a JSON-ready dict."""
+        locations = {}
+        for key, d in sorted(self.devices.items()):
+            if d['location']:
+                locations.setdefault(d['location'], []).append(key)
+        return {'devices': self.devices, 'models': self.models, 'deviations': self.deviations,
+                'locations': locations, 'problems': [list(p) for p in self.problems]}
+
+    def select(self, category=None, model=None, location=None):
+        """Devices (sorted by location, then ID) matching all the given filters."""
+        return [d for _, d in sorted(((d['location'] or '', d['id']), d) for d in self.devices.values())
+                if (category is None or d['category'] == category)
+                and (model is None or d['model'] == model)
+                and (location is None or d['location'] == location)]
+
+    def table(self, category=None, model=None, location=None, page=None):
+        """Markdown table of the selected devices; model / deviation cells link to their pages.
+
+        page is the docs-relative path of the page the table goes in (links are made relative to it).
+        """
+        base = posixpath.dirname(page) if page else ''
+
+        def link(code, table):
+            entry = table.get(code)
+            if entry is None:
+                return code
+            return f'[{code}](<{posixpath.relpath(entry["page"], base or ".")}>)'
+
+        rows = ['| Device | Name | Model | Deviation | Location |', '| --- | --- | --- | --- | --- |']
+        for d in self.select(category, model, location):
+            rows.append(f'| {d["id"]} | {d["name"] or ""} | {link(d["model"], self.models)} | '
+                        f'{link(d["deviation"], self.deviations) if d["deviation"] else "-"} | '
+                        f'{d["location"] or ""} |')
+        return '\n'.join(rows)
+
+
+def build(docs=DOCS, cache_path=None, cold=False, jobs=1):
+    """Scan docs/ (re-reading only changed pages) and return the Registry; the cache is saved."""
+    docs = Path(docs)
+    cache = ResultCache(cache_path or docs.resolve().parent / CACHE_PATH, registry_version(), cold=cold)
+    pages = {}
+    tasks = []
+    for dirpath, dirnames, filenames in os.walk(docs):
+        dirnames.sort()
+        rel_dir = os.path.relpath(dirpath, docs).replace(os.sep, '/')
+        for fn in sorted(filenames):
+            if not fn.endswith('.md'):
+                continue
+            rel = posixpath.normpath(posixpath.join(rel_dir, fn))
+            p = Path(dirpath) / fn
+            hit, codes = cache.fresh(rel, p.stat())
+            if hit:
+                pages[rel] = codes
+            else:
+                tasks.append((rel, p))
+    for (rel, p), (st, h, codes) in zip(tasks, map_files(scan_task, [(p, cache.cached_hash(rel)) for rel, p in tasks],
+                                                          jobs)):
+        if codes is None:
+            codes = cache.match(rel, st, h)[1]
+        else:
+            cache.put(rel, st, h, codes)
+        pages[rel] = codes
+    registry = Registry(pages, cache.misses)
+    cache.save(extra=registry.index())
+    return registry
+
+
+def main():
+    ap = argparse.ArgumentParser(description='Index and check the device / model / deviation codes in docs/')
+    ap.add_argument('--docs', default=str(DOCS), help='docs folder (default: the repo docs/)')
+    ap.add_argument('--cold', action='store_true', help='ignore the cache and re-read every page')
+    ap.add_argument('--jobs', type=int, default=1, help='worker processes (0 = one per core)')
+    ap.add_argument('--json', help='also write the assembled index to this file')
+    ap.add_argument('--list', action='store_true', help='print every device with its model, deviation and name')
+    args = ap.parse_args()
+
+    docs = Path(args.docs)
+    if not docs.is_dir():
+        print(f'Docs directory not found at {docs}')
+        raise SystemExit(2)
+    registry = build(docs, cold=args.cold, jobs=args.jobs)
+    if args.json:
+        write_json_atomic(args.json, registry.index())
+    if args.list:
+        for d in registry.select():
+            print(f'{d["id"]}  {d["model"]}  {d["deviation"] or "-"}  {d["name"] or "-"}'
+                  f'  (docs/{d["page"]}:{d["line"]})')
+    print(f'{len(registry.devices)} devices, {len(registry.models)} models, {len(registry.deviations)} deviations'
+          f' in {len(registry.pages)} pages ({registry.rescanned} re-read)')
+    if not registry.problems:
+        print('No problems found.')
+        raise SystemExit(0)
+    print('\nProblems:')
+    for rel, line, message in registry.problems:
+        print(f'- docs/{rel}:{line}: {message}')
+    raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
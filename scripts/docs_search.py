@@ -0,0 +1,534 @@
+#!/usr/bin/env python3
+"""
+Offline full-text search over docs/ from a terminal.
+
+    python3 scripts/docs_search.py dhcp lease
+    python3 scripts/docs_search.py '"zone transfer"' --path "500 Environments"
+    python3 scripts/docs_search.py 'vpn*' --limit 20
+
+Hits are sections (the text under a heading), ranked by BM25 with a boost
+for query terms in the heading, and printed as page#anchor with the
+heading and the first line that matches. All words must occur in a
+section (--any: at least one), "quoted words" must occur in that order,
+and word* matches every word starting with word (in `dns-serv*` only
+serv is a prefix; dns must occur as a whole word).
+
+The index, .cache/docs_search.idx, is one binary file of flat arrays: the
+page and section tables, the sorted term dictionary, and per term the
+sections it occurs in with its token positions in each (positional
+postings; positions below a section's title length are heading hits).
+A query memory-maps the file and reads the arrays in place: terms are
+found by binary search and postings are slices of the mapping, so nothing
+is loaded or parsed up front.
+
+Before a query the index is checked against the size and mtime of every
+page and updated if anything changed: pages whose content hash is
+unchanged reuse their tokenized sections from .cache/docs_search.json
+(see result_cache.py), only changed pages are read and tokenized again,
+and the arrays are rewritten. --no-update skips the check.
+
+Tokens are lowercased words (\\w+). Fenced code is indexed too (config
+snippets are a common thing to look up); link targets and HTML tags are
+not. Anchors follow the toc extension's slugs (md_link_check.py).
+
+Usage: python3 scripts/docs_search.py [QUERY ...] [--path PREFIX] [--any] [--limit 10]
+           [--docs DIR] [--rebuild] [--no-update] [--jobs N] [--json]
+With no query the index is only updated. Exit code 1 if nothing matched.
+"""
+import argparse
+import heapq
+import json
+import math
+import mmap
+import re
+import sys
+import time
+from array import array
+from pathlib import Path
+
+from md_link_check import ATTR_LIST_RE, SETEXT_RE, TAG_RE, heading_anchor
+from md_scan import CODE, FENCE, HEADING, TEXT, Doc, docs_files, heading_re, map_files
+from result_cache import RACY_NS, ResultCache, atomic_file, digest, source_version
+
+ROOT = Path(__file__).resolve().parents[1]
+DOCS = ROOT / 'docs'
+CACHE_PATH = Path('.cache') / 'docs_search.json'
+INDEX_PATH = Path('.cache') / 'docs_search.idx'
+MAGIC = b'DSIX'
+# bump when the .idx layout changes
+INDEX_VERSION = 1
+# bump when the cached sections change shape
+SECTIONS_VERSION = '2'
+
+WORD_RE = re.compile(r'\w+')
+LINK_TARGET_RE = re.compile(r'\]\([^)]*\)')
+CLOSING_HASHES_RE = re.compile(r'\s+#+$')
+QUERY_RE = re.compile(r'"([^"]*)"|(\S+)')
+K1 = 1.2
+B = 0.75
+TITLE_BOOST = 2.0
+# a prefix query uses at most this many terms
+MAX_PREFIX_TERMS = 1000
+SNIPPET_CHARS = 100
+
+
+def sections_version():
+    here = Path(__file__).resolve().parent
+    return source_version(here / 'docs_search.py', here / 'md_scan.py', here / 'md_link_check.py',
+                          tag=SECTIONS_VERSION)
+
+
+def tokenize(text):
+    return WORD_RE.findall(text.lower())
+
+
+def prose_tokens(line):
+    """Tokens of a line outside code: link targets and HTML tags left out."""
+    if ']' in line:
+        line = LINK_TARGET_RE.sub(']', line)
+    if '<' in line:
+        line = TAG_RE.sub(' ', line)
+    return tokenize(line)
+
+
+def section_record(anchor, title, level, line, n_title, words):
+    """[anchor, title, level, line, title tokens, tokens, {term: [positions]}] of one section."""
+    terms = {}
+    for pos, w in enumerate(words):
+        ps = terms.get(w)
+        if ps is None:
+            terms[w] = [pos]
+        else:
+            ps.append(pos)
+    return [anchor, title, level, line, n_title, len(words), terms]
+
+
+def page_sections(text):
+    """Split a page into its sections (see section_record()).
+
+    The text before the first heading is a section with anchor '' (when it
+    has any words); the tokens of a section start with its title's.
+    """
+    doc = Doc(text)
+    lines = doc.lines
+    kinds = doc.kinds
+    ids = set()
+    out = []
+    anchor, title, level, start, words = '', '', 0, 1, []
+    n_title = 0
+    skip = -1
+    for i, (line, kind) in enumerate(zip(lines, kinds)):
+        if i == skip:
+            continue
+        heading = None
+        if kind is HEADING:
+            m = heading_re.match(line)
+            heading = CLOSING_HASHES_RE.sub('', line[m.end():].rstrip())
+            new_level = m.group(1).count('#')
+        elif (kind is TEXT and i + 1 < len(lines) and kinds[i + 1] is TEXT and SETEXT_RE.match(lines[i + 1])
+              and line.strip()):
+            heading = line.strip()
+            new_level = 1 if lines[i + 1].strip().startswith('=') else 2
+            skip = i + 1
+        if heading is None:
+            if kind is CODE:
+                words.extend(tokenize(line))
+            elif kind is not FENCE:
+                words.extend(prose_tokens(line))
+            continue
+        if title or words:
+            out.append(section_record(anchor, title, level, start, n_title, words))
+        anchor = heading_anchor(heading, ids)
+        title = ATTR_LIST_RE.sub('', heading).strip()
+        words = prose_tokens(title)
+        n_title = len(words)
+        level = new_level
+        start = i + 1
+    if title or words:
+        out.append(section_record(anchor, title, level, start, n_title, words))
+    return out
+
+
+def index_task(task):
+    """Worker: hash one page and split it into sections unless the hash equals known_hash."""
+    p, known_hash = task
+    st = p.stat()
+    data = p.read_bytes()
+    h = digest(data)
+    if h == known_hash:
+        return st, h, None
+    return st, h, page_sections(data.decode('utf-8'))
+
+
+def _pad(n):
+    return -n % 8
+
+
+def narrow(arr):
+    """arr with the smallest unsigned typecode that holds all its values."""
+    top = max(arr, default=0)
+    for code in 'BHI':
+        if top < 1 << (8 * array(code).itemsize):
+            return arr if arr.typecode == code else array(code, arr)
+    return arr
+
+
+def write_index(path, pages, saved_ns):
+    """Write the binary index of pages, a list of (rel, stat, sections), atomically to path."""
+    strings = bytearray()
+    str_off = array('I', [0])
+
+    def add_string(s):
+        strings.extend(s.encode('utf-8'))
+        str_off.append(len(strings))
+
+    page_mtime = array('Q')
+    page_size = array('Q')
+    sec_page = array('I')
+    sec_line = array('I')
+    sec_level = array('B')
+    sec_len = array('I')
+    sec_title_len = array('I')
+    postings = {}
+    for rel, st, _ in pages:
+        add_string(rel)
+        page_mtime.append(st.st_mtime_ns)
+        page_size.append(st.st_size)
+    for p, (_, _, sections) in enumerate(pages):
+        for anchor, title, level, line, n_title, n_words, terms in sections:
+            s = len(sec_page)
+            add_string(anchor)
+            add_string(title)
+            sec_page.append(p)
+            sec_line.append(line)
+            sec_level.append(level)
+            sec_title_len.append(n_title)
+            sec_len.append(n_words)
+            for w, ps in terms.items():
+                e = postings.get(w)
+                if e is None:
+                    postings[w] = ([s], [ps])
+                else:
+                    e[0].append(s)
+                    e[1].append(ps)
+
+    terms = bytearray()
+    term_off = array('I', [0])
+    post_off = array('I', [0])
+    entry_sec = array('I')
+    entry_pos = array('I', [0])
+    positions = array('I')
+    # str order is code point order, which is also the order of the UTF-8 bytes the reader compares
+    for t in sorted(postings):
+        secs, plists = postings[t]
+        terms.extend(t.encode('utf-8'))
+        term_off.append(len(terms))
+        entry_sec.extend(secs)
+        for ps in plists:
+            positions.extend(ps)
+            entry_pos.append(len(positions))
+        post_off.append(len(entry_sec))
+
+    blocks = [('strings', array('B', bytes(strings))), ('str_off', narrow(str_off)),
+              ('page_mtime', page_mtime), ('page_size', page_size),
+              ('sec_page', narrow(sec_page)), ('sec_line', narrow(sec_line)), ('sec_level', sec_level),
+              ('sec_len', narrow(sec_len)), ('sec_title_len', narrow(sec_title_len)),
+              ('terms', array('B', bytes(terms))), ('term_off', narrow(term_off)), ('post_off', narrow(post_off)),
+              ('entry_sec', narrow(entry_sec)), ('entry_pos', narrow(entry_pos)), ('positions', narrow(positions))]
+    table = {}
+    off = 0
+    for name, arr in blocks:
+        table[name] = [off, arr.typecode, len(arr)]
+        off += len(arr) * arr.itemsize
+        off += _pad(off)
+    head = json.dumps({'version': INDEX_VERSION, 'byteorder': sys.byteorder, 'saved_ns': saved_ns,
+                       'pages': len(pages), 'sections': len(sec_page), 'terms': len(term_off) - 1,
+                       'tokens': sum(sec_len), 'blocks': table}).encode('utf-8')
+
+    with atomic_file(path) as f:
+        f.write(MAGIC + len(head).to_bytes(4, 'little') + head + bytes(_pad(8 + len(head))))
+        for _, arr in blocks:
+            arr.tofile(f)
+            f.write(bytes(_pad(len(arr) * arr.itemsize)))
+
+
+class SearchIndex:
+    """A memory-mapped index file; every array is a memoryview over the mapping."""
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.views = []
+        try:
+            if self.mm[:4] != MAGIC:
+                raise ValueError(f'{path} is not a docs_search index')
+            n = int.from_bytes(self.mm[4:8], 'little')
+            head = json.loads(self.mm[8:8 + n])
+            if head['version'] != INDEX_VERSION or head['byteorder'] != sys.byteorder:
+                raise ValueError(f'{path} was written by another version or platform')
+            base = 8 + n + _pad(8 + n)
+            view = memoryview(self.mm)
+            self.views.append(view)
+            for name, (off, code, count) in head['blocks'].items():
+                size = array(code).itemsize
+                v = view[base + off:base + off + count * size].cast(code)
+                self.views.append(v)
+                setattr(self, name, v)
+        except BaseException:
+            self.close()
+            raise
+        self.saved_ns = head['saved_ns']
+        self.n_pages = head['pages']
+        self.n_sections = head['sections']
+        self.n_terms = head['terms']
+        self.avg_len = head['tokens'] / max(1, self.n_sections)
+
+    def close(self):
+        for v in reversed(self.views):
+            v.release()
+        self.views = []
+        self.mm.close()
+
+    def string(self, i):
+        return bytes(self.strings[self.str_off[i]:self.str_off[i + 1]]).decode('utf-8')
+
+    def page(self, p):
+        return self.string(p)
+
+    def section(self, s):
+        """(page, anchor, title, level, line) of section s."""
+        k = self.n_pages + 2 * s
+        return self.page(self.sec_page[s]), self.string(k), self.string(k + 1), self.sec_level[s], self.sec_line[s]
+
+    def term(self, t):
+        return bytes(self.terms[self.term_off[t]:self.term_off[t + 1]])
+
+    def lower_bound(self, key):
+        """Index of the first term >= key (UTF-8 bytes)."""
+        lo, hi = 0, self.n_terms
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.term(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def term_ids(self, word, prefix=False):
+        key = word.encode('utf-8')
+        lo = self.lower_bound(key)
+        if prefix:
+            # 0xff never occurs in UTF-8, so every term starting with key sorts below key + b'\xff'
+            return range(lo, min(self.lower_bound(key + b'\xff'), lo + MAX_PREFIX_TERMS))
+        return range(lo, lo + 1) if lo < self.n_terms and self.term(lo) == key else range(0)
+
+    def postings(self, t):
+        """{section: positions} of term t."""
+        a, b = self.post_off[t], self.post_off[t + 1]
+        bounds = self.entry_pos[a:b + 1].tolist()
+        pos = self.positions[bounds[0]:bounds[-1]].tolist()
+        first = bounds[0]
+        return {s: pos[bounds[k] - first:bounds[k + 1] - first] for k, s in enumerate(self.entry_sec[a:b].tolist())}
+
+    def match_word(self, word, prefix=False):
+        """{section: (term frequency, heading hit)} of a word or prefix."""
+        hits = {}
+        title_len = self.sec_title_len
+        for t in self.term_ids(word, prefix):
+            a, b = self.post_off[t], self.post_off[t + 1]
+            bounds = self.entry_pos[a:b + 1].tolist()
+            firsts = self.positions[bounds[0]:bounds[-1]].tolist()
+            base = bounds[0]
+            for k, s in enumerate(self.entry_sec[a:b].tolist()):
+                tf = bounds[k + 1] - bounds[k]
+                title = firsts[bounds[k] - base] < title_len[s]
+                old = hits.get(s)
+                hits[s] = (tf, title) if old is None else (old[0] + tf, old[1] or title)
+        return hits
+
+    def match_phrase(self, words):
+        """{section: (occurrences, heading hit)} of consecutive words."""
+        order = []
+        for w in words:
+            ids = self.term_ids(w)
+            if not ids:
+                return {}
+            order.append(self.postings(ids[0]))
+        common = set(min(order, key=len)).intersection(*order)
+        hits = {}
+        for s in common:
+            # start positions: those of the first word, less those where a later word is missing
+            starts = set(order[0][s])
+            for k, p in enumerate(order[1:], 1):
+                starts.intersection_update([x - k for x in p[s]])
+                if not starts:
+                    break
+            if starts:
+                hits[s] = (len(starts), min(starts) < self.sec_title_len[s])
+        return hits
+
+    def search(self, query, limit=10, path=None, any_term=False):
+        """[(score, section)] of the best sections for a query string."""
+        items = []
+        for phrase, word in QUERY_RE.findall(query):
+            if phrase:
+                words = tokenize(phrase)
+                if len(words) > 1:
+                    items.append(self.match_phrase(words))
+                elif words:
+                    items.append(self.match_word(words[0]))
+            elif word.endswith('*') and tokenize(word):
+                # `a-b*`: the leading tokens are whole words, only the last one is a prefix
+                *whole, last = tokenize(word)
+                items.extend(self.match_word(w) for w in whole)
+                items.append(self.match_word(last, prefix=True))
+            else:
+                items.extend(self.match_word(w) for w in tokenize(word))
+        if not items:
+            return []
+        if any_term:
+            found = set().union(*items)
+        else:
+            found = set(min(items, key=len)).intersection(*items)
+        if path:
+            prefix = path.rstrip('/') + '/'
+            pages = {}
+            keep = set()
+            for s in found:
+                p = self.sec_page[s]
+                if p not in pages:
+                    rel = self.page(p)
+                    pages[p] = rel.startswith(prefix) or rel == path
+                if pages[p]:
+                    keep.add(s)
+            found = keep
+        n = self.n_sections
+        scored = []
+        for s in found:
+            norm = K1 * (1 - B + B * self.sec_len[s] / self.avg_len)
+            score = 0.0
+            for hits in items:
+                h = hits.get(s)
+                if h is None:
+                    continue
+                idf = math.log(1 + (n - len(hits) + 0.5) / (len(hits) + 0.5))
+                score += idf * h[0] * (K1 + 1) / (h[0] + norm)
+                if h[1]:
+                    score += idf * TITLE_BOOST
+            scored.append((score, -s))
+        return [(score, -neg) for score, neg in heapq.nlargest(limit, scored)]
+
+
+def stale(index, docs):
+    """True if a page was added, removed or touched since the index was written."""
+    files = docs_files(docs)
+    if len(files) != index.n_pages:
+        return True
+    known = {index.page(i): i for i in range(index.n_pages)}
+    for p in files:
+        i = known.get(p.relative_to(docs).as_posix())
+        if i is None:
+            return True
+        st = p.stat()
+        if (st.st_mtime_ns != index.page_mtime[i] or st.st_size != index.page_size[i]
+                or st.st_mtime_ns + RACY_NS >= index.saved_ns):
+            return True
+    return False
+
+
+def update(docs=DOCS, index_path=None, cache_path=None, cold=False, jobs=1):
+    """Re-index docs/, re-reading only changed pages. Returns (pages, pages re-read)."""
+    docs = Path(docs)
+    repo = docs.resolve().parent
+    cache = ResultCache(cache_path or repo / CACHE_PATH, sections_version(), cold=cold)
+    pages = []
+    tasks = []
+    for p in docs_files(docs):
+        rel = p.relative_to(docs).as_posix()
+        st = p.stat()
+        hit, sections = cache.fresh(rel, st)
+        pages.append([rel, st, sections])
+        if not hit:
+            tasks.append((len(pages) - 1, p))
+    work = [(p, cache.cached_hash(pages[k][0])) for k, p in tasks]
+    for (k, p), (st, h, sections) in zip(tasks, map_files(index_task, work, jobs)):
+        rel = pages[k][0]
+        if sections is None:
+            sections = cache.match(rel, st, h)[1]
+        else:
+            cache.put(rel, st, h, sections)
+        pages[k][1:] = [st, sections]
+    cache.save()
+    write_index(index_path or repo / INDEX_PATH, pages, time.time_ns())
+    return len(pages), cache.misses
+
+
+def snippet(docs, page, line, end, words):
+    """The first line of a section containing one of words (else its heading line), shortened."""
+    try:
+        lines = (Path(docs) / page).read_text(encoding='utf-8').splitlines()
+    except (OSError, UnicodeDecodeError):
+        return line, ''
+    body = range(line - 1, min(end, len(lines)))
+    pick = next((i for i in body if any(w in lines[i].lower() for w in words)), line - 1)
+    text = lines[pick].strip() if pick < len(lines) else ''
+    if len(text) > SNIPPET_CHARS:
+        text = text[:SNIPPET_CHARS].rsplit(' ', 1)[0] + ' …'
+    return pick + 1, text
+
+
+def main():
+    ap = argparse.ArgumentParser(description='Full-text search over docs/')
+    ap.add_argument('query', nargs='*', help='words, "a phrase" or prefix*; all must match unless --any')
+    ap.add_argument('--path', help='only pages under this docs-relative folder (e.g. "500 Environments")')
+    ap.add_argument('--any', action='store_true', help='match sections with any of the terms')
+    ap.add_argument('--limit', type=int, default=10, help='number of hits (default 10)')
+    ap.add_argument('--docs', default=str(DOCS), help='docs folder (default: the repo docs/)')
+    ap.add_argument('--rebuild', action='store_true', help='ignore the cache and re-read every page')
+    ap.add_argument('--no-update', action='store_true', help='query the index as it is, without checking docs/')
+    ap.add_argument('--jobs', type=int, default=1, help='worker processes for updating (0 = one per core)')
+    ap.add_argument('--json', action='store_true', help='print the hits as JSON')
+    args = ap.parse_args()
+
+    docs = Path(args.docs)
+    index_path = docs.resolve().parent / INDEX_PATH
+    index = None
+    if not args.rebuild:
+        try:
+            index = SearchIndex(index_path)
+        except (OSError, ValueError):
+            index = None
+    if index is None or (not args.no_update and stale(index, docs)):
+        if index is not None:
+            index.close()
+        t0 = time.perf_counter()
+        n, read = update(docs, index_path, cold=args.rebuild, jobs=args.jobs)
+        print(f'Indexed {n} pages ({read} read) in {time.perf_counter() - t0:.2f} s.', file=sys.stderr)
+        index = SearchIndex(index_path)
+    if not args.query:
+        return
+
+    query = ' '.join(args.query)
+    hits = index.search(query, args.limit, args.path, args.any)
+    words = [w.rstrip('*') for w in tokenize(query)]
+    out = []
+    for score, s in hits:
+        page, anchor, title, level, line = index.section(s)
+        nxt = s + 1
+        end = index.sec_line[nxt] - 1 if nxt < index.n_sections and index.sec_page[nxt] == index.sec_page[s] else 1 << 30
+        at, text = snippet(docs, page, line, end, words)
+        out.append({'page': page, 'anchor': anchor, 'title': title, 'line': at, 'score': round(score, 3),
+                    'snippet': text})
+    index.close()
+    if args.json:
+        print(json.dumps(out, ensure_ascii=False, indent=1))
+    else:
+        for h in out:
+            target = h['page'] + ('#' + h['anchor'] if h['anchor'] else '')
+            print(f"{h['score']:6.2f}  {target}")
+            print(f"        {h['title'] or '(top of page)'}  ·  {h['line']}: {h['snippet']}")
+    raise SystemExit(0 if out else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Asynchronous checker for external http(s) links, used by `link_check.py --external`.
+
+- every URL is probed once per run, however many pages link to it (the
+  #fragment is ignored)
+- one asyncio task per URL over plain HTTP/1.1 keep-alive connections:
+  each host gets a small pool of connections that are reused between
+  requests, at most --per-host requests in flight and at least --delay
+  seconds between the start of two requests; --concurrency caps the total
+- HEAD first; when the server answers HEAD with an error status (many
+  reject or mishandle it), the URL is tried again with GET; a body over
+  64 kB is not downloaded (the connection is closed instead)
+- redirects are followed (up to MAX_REDIRECTS); 429 and 503 with a short
+  Retry-After are retried once
+- results are kept in .cache/external_links.json with the time they were
+  checked: working URLs are re-probed after --ttl days, failing ones after
+  a day, so a re-run only probes new and expired URLs
+
+Only the standard library is used. Any http:// URL works, including a local
+stand-in server (tests/test_scripts.py runs some).
+"""
+import asyncio
+import json
+import os
+import ssl
+import time
+from urllib.parse import quote, urljoin, urlsplit
+
+from result_cache import write_json_atomic
+
+CACHE_PATH = os.path.join('.cache', 'external_links.json')
+CACHE_VERSION = 1
+DAY = 86400
+MAX_REDIRECTS = 5
+MAX_RETRY_AFTER = 10
+USER_AGENT = 'Mozilla/5.0 (compatible; netdna-link-check/1.0)'
+# characters left as they are in the request target; '%' keeps existing escapes
+TARGET_SAFE = "/%:@!$&'()*+,;=?~"
+
+
+class HTTPError(Exception):
+    pass
+
+
+def split_url(url):
+    """(scheme, host, port, request target) of an http(s) URL, without the fragment.
+
+    The host is IDNA-encoded and the path and query are percent-encoded as
+    UTF-8 (escapes already in the URL are kept), so the request is ASCII.
+    """
+    parts = urlsplit(url)
+    if parts.scheme not in ('http', 'https') or not parts.hostname:
+        raise HTTPError(f'unsupported URL {url}')
+    try:
+        host = parts.hostname.encode('idna').decode('ascii')
+    except UnicodeError:
+        raise HTTPError(f'bad host name in {url}') from None
+    port = parts.port or (443 if parts.scheme == 'https' else 80)
+    target = quote(parts.path or '/', safe=TARGET_SAFE)
+    if parts.query:
+        target += '?' + quote(parts.query, safe=TARGET_SAFE)
+    return parts.scheme, host, port, target
+
+
+class Host:
+    """Idle keep-alive connections, in-flight limit and request spacing for one scheme://host:port."""
+
+    def __init__(self, per_host, delay):
+        self.slots = asyncio.Semaphore(per_host)
+        self.idle = []
+        self.delay = delay
+        self.next_start = 0.0
+        self.lock = asyncio.Lock()
+        self.opened = 0
+
+    async def pace(self):
+        async with self.lock:
+            now = time.monotonic()
+            wait = self.next_start - now
+            self.next_start = max(now, self.next_start) + self.delay
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class Prober:
+    def __init__(self, per_host=4, concurrency=64, delay=0.0, timeout=15.0):
+        self.per_host = per_host
+        self.delay = delay
+        self.timeout = timeout
+        self.total = asyncio.Semaphore(concurrency)
+        self.hosts = {}
+        self.ssl = ssl.create_default_context()
+        self.requests = 0
+
+    def host(self, key):
+        h = self.hosts.get(key)
+        if h is None:
+            h = self.hosts[key] = Host(self.per_host, self.delay)
+        return h
+
+    async def connect(self, scheme, host, port, pool):
+        """Open a connection (TLS handshake included) within the timeout."""
+        pool.opened += 1
+        tls = scheme == 'https'
+        return await asyncio.wait_for(
+            asyncio.open_connection(host, port, ssl=self.ssl if tls else None, server_hostname=host if tls else None,
+                                    ssl_handshake_timeout=self.timeout if tls else None),
+            self.timeout)
+
+    async def request(self, method, url):
+        """Send one request; returns (status, headers). Reuses an idle connection to the host if there is one."""
+        scheme, host, port, target = split_url(url)
+        pool = self.host((scheme, host, port))
+        # the host's slot first: tasks queued for one busy host must not hold the global slots
+        async with pool.slots, self.total:
+            await pool.pace()
+            self.requests += 1
+            for attempt in (0, 1):
+                reused = bool(pool.idle) and attempt == 0
+                reader, writer = pool.idle.pop() if reused else await self.connect(scheme, host, port, pool)
+                try:
+                    status, headers, reusable = await asyncio.wait_for(
+                        self.exchange(reader, writer, method, host, port, scheme, target), self.timeout)
+                except (OSError, asyncio.IncompleteReadError, HTTPError):
+                    writer.close()
+                    # a kept-alive connection the server has closed meanwhile: once more on a new one
+                    if reused:
+                        continue
+                    raise
+                except BaseException:
+                    writer.close()
+                    raise
+                if reusable:
+                    pool.idle.append((reader, writer))
+                else:
+                    writer.close()
+                return status, headers
+
+    async def exchange(self, reader, writer, method, host, port, scheme, target):
+        default_port = 443 if scheme == 'https' else 80
+        # an IPv6 literal goes back in brackets
+        host_header = f'[{host}]' if ':' in host else host
+        if port != default_port:
+            host_header += f':{port}'
+        writer.write((f'{method} {target} HTTP/1.1\r\nHost: {host_header}\r\nUser-Agent: {USER_AGENT}\r\n'
+                      'Accept: */*\r\nConnection: keep-alive\r\n\r\n').encode('latin-1'))
+        await writer.drain()
+        while True:
+            line = await reader.readuntil(b'\r\n')
+            try:
+                version, status = line.split(None, 2)[:2]
+                status = int(status)
+            except ValueError:
+                raise HTTPError(f'bad status line {line[:60]!r}') from None
+            headers = {}
+            while True:
+                line = await reader.readuntil(b'\r\n')
+                if line == b'\r\n':
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                headers[name.strip().lower()] = value.strip()
+            if status >= 200 or status == 101:
+                break
+        # HEAD, 204 and 304 have no body; anything else is only kept alive when its length is known
+        if method == 'HEAD' or status in (204, 304):
+            reusable = True
+        elif 'content-length' in headers and 'chunked' not in headers.get('transfer-encoding', ''):
+            length = int(headers['content-length'])
+            reusable = length <= 1 << 16
+            if reusable:
+                await reader.readexactly(length)
+        else:
+            reusable = False
+        if headers.get('connection', '').lower() == 'close' or version == b'HTTP/1.0':
+            reusable = False
+        return status, headers, reusable
+
+    async def fetch(self, method, url):
+        """Follow redirects; returns (final status, final URL)."""
+        for _ in range(MAX_REDIRECTS + 1):
+            status, headers = await self.request(method, url)
+            if status in (429, 503):
+                retry = headers.get('retry-after', '')
+                if retry.isdigit() and int(retry) <= MAX_RETRY_AFTER:
+                    await asyncio.sleep(int(retry))
+                    status, headers = await self.request(method, url)
+            if status in (301, 302, 303, 307, 308) and 'location' in headers:
+                url = urljoin(url, headers['location'])
+                continue
+            return status, url
+        raise HTTPError('too many redirects')
+
+    async def probe(self, url):
+        """Return {'status': int or None, 'error': str or None, 'final': URL} for one URL."""
+        try:
+            status, final = await self.fetch('HEAD', url)
+            if status >= 400:
+                status, final = await self.fetch('GET', url)
+            return {'status': status, 'error': None, 'final': final}
+        except asyncio.TimeoutError:
+            return {'status': None, 'error': 'timeout', 'final': url}
+        except (OSError, asyncio.IncompleteReadError, HTTPError, ValueError) as e:
+            return {'status': None, 'error': str(e) or type(e).__name__, 'final': url}
+
+    async def close(self):
+        for pool in self.hosts.values():
+            for _, writer in pool.idle:
+                writer.close()
+            pool.idle.clear()
+
+
+def is_ok(result):
+    return result['status'] is not None and result['status'] < 400
+
+
+class LinkCache:
+    """Persistent URL -> result cache; entries expire after ttl (ok) or fail_ttl (failed) seconds."""
+
+    def __init__(self, path=CACHE_PATH, ttl=7 * DAY, fail_ttl=DAY, cold=False):
+        self.path = path
+        self.ttl = ttl
+        self.fail_ttl = fail_ttl
+        self.urls = {} if cold else self._read()
+
+    def _read(self):
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data.get('urls', {}) if data.get('version') == CACHE_VERSION else {}
+
+    def get(self, url, now):
+        r = self.urls.get(url)
+        if r is None:
+            return None
+        ttl = self.ttl if is_ok(r) else self.fail_ttl
+        # rate limited or unavailable: ask again next run
+        if r['status'] in (429, 503):
+            ttl = 0
+        return r if now - r['checked'] < ttl else None
+
+    def save(self, keep):
+        write_json_atomic(self.path, {'version': CACHE_VERSION,
+                                      'urls': {u: r for u, r in self.urls.items() if u in keep}})
+
+
+def check_urls(urls, cache=None, per_host=4, concurrency=64, delay=0.0, timeout=15.0):
+    """Probe every URL not fresh in cache. Returns ({url: result}, stats)."""
+    now = time.time()
+    urls = sorted(set(urls))
+    results = {}
+    todo = []
+    for url in urls:
+        r = cache.get(url, now) if cache is not None else None
+        if r is None:
+            todo.append(url)
+        else:
+            results[url] = r
+
+    async def run():
+        prober = Prober(per_host, concurrency, delay, timeout)
+        try:
+            done = await asyncio.gather(*(prober.probe(u) for u in todo))
+        finally:
+            await prober.close()
+        return done, prober
+
+    stats = {'urls': len(urls), 'probed': len(todo), 'requests': 0, 'connections': 0, 'hosts': 0}
+    if todo:
+        done, prober = asyncio.run(run())
+        checked = time.time()
+        for url, r in zip(todo, done):
+            r['checked'] = checked
+            results[url] = r
+            if cache is not None:
+                cache.urls[url] = r
+        stats.update(requests=prober.requests, hosts=len(prober.hosts),
+                     connections=sum(h.opened for h in prober.hosts.values()))
+    if cache is not None:
+        cache.save(set(urls))
+    return results, stats
+
+
+def describe(result):
+    if result['error']:
+        return result['error']
+    return f"HTTP {result['status']}"
@@ -2,87 +2,187 @@
 """
 Fix spaced emphasis markers in Markdown files.
 
-Converts patterns like:
+Meant for patterns like:
   - `** text **` -> `**text**`
   - `* text *` -> `*text*`
   - `*** text ***` -> `***text***`
+but the rules, kept as they always were, only rewrite whitespace-only spans
+between markers (`**   **` -> `****`); text between markers, table cells
+(`| * | * |`) and operator stars (`2 * 3`) are left alone.
 
 The script skips fenced code blocks (``` / ~~~) and inline code (text enclosed in backticks).
+Each line takes linear time; tests/test_scripts.py checks the output against the
+original regex rules, on generated lines and a generated wiki.
+Files of --stream-above MB or more are fixed line by line and written through a temp file
+instead of being loaded (see md_scan.py).
 
-Usage: python3 scripts/fix_bold_spaces.py
+Usage: python3 scripts/fix_bold_spaces.py [--profile REPORT] [--stream-above MB]  (see md_profile.py)
 """
+import argparse
 import re
 from pathlib import Path
 from typing import Tuple
 
+import md_profile
+from md_profile import FileTimer
+import md_scan
+from md_scan import CODE, FENCE, Doc, repo_md_files, stream_rewrite, streamed, write_atomic, split_inline
+
 ROOT = Path('.')
 
-# Prepare regexes. Order matters: handle triple-asterisk first, then bold, then italic.
-TRIPLE_PAT = re.compile(r"\*\*\*\s+(.+?)\s+\*\*\*")
-BOLD_PAT = re.compile(r"\*\*\s+(.+?)\s+\*\*")
-ITALIC_PAT = re.compile(r"(?<!\*)\*\s+(.+?)\s+\*(?!\*)")
+STAR_RUN = re.compile(r"\*+")
+# the rules only ever rewrite a span of 3+ whitespace characters between two stars
+SPACED_GAP = re.compile(r"\*\s{3,}\*")
+
+
+def _fits(k: int, m: int) -> bool:
+    """Whether a run of k stars holds the marker of length m (a lone `*` for italics)."""
+    return k == 1 if m == 1 else k >= m
+
+
+def _rule_pass(text: str, m: int) -> str:
+    r"""One `re.sub` pass of the rule for m-star markers, in linear time.
+
+    The rules are `\*{m}\s+(.+?)\s+\*{m}` (italic: a lone `*` on both
+    sides), replacing each match by itself with group 1 swapped for
+    group 1 stripped. Group 1 starts and ends with a non-space character,
+    so a match changes nothing, unless the opener has no closer anywhere
+    after the text that follows its whitespace: then the regex backtracks
+    into the whitespace and, if it is 3+ characters long and followed by
+    the marker, matches `marker + whitespace + marker` with group 1 a
+    single whitespace character, whose every copy the replacement removes.
+    """
+    n = len(text)
+    runs = [mm.span() for mm in STAR_RUN.finditer(text)]
+    run_end = dict(runs)
+    # closers in order: (start of the whitespace, start of the marker)
+    closers = []
+    for s, e in runs:
+        if _fits(e - s, m) and s > 0 and text[s-1].isspace():
+            x = s - 1
+            while x > 0 and text[x-1].isspace():
+                x -= 1
+            closers.append((x, s))
+    out = []
+    last = pos = c = 0
+    for s, t in runs:
+        if not _fits(t - s, m) or t >= n or not text[t].isspace() or t - m < pos:
+            continue
+        a = t
+        while a < n and text[a].isspace():
+            a += 1
+        # group 1 starts at a; the lazy match ends at the first closer whose whitespace starts after it
+        while c < len(closers) and closers[c][0] <= a:
+            c += 1
+        if c < len(closers):
+            pos = closers[c][1] + m
+        elif a - t >= 3 and a in run_end and _fits(run_end[a] - a, m):
+            out.append(text[last:t - m])
+            out.append(text[t - m:t] + text[t:a].replace(text[a - 2], '') + text[a:a + m])
+            last = pos = a + m
+    if not out:
+        return text
+    out.append(text[last:])
+    return ''.join(out)
+
 
 def fix_line_outside_code(text: str) -> Tuple[str, bool]:
-    """Fix emphasis spacing in a text piece outside inline code. Returns (new_text, changed)."""
-    changed = False
+    """Fix emphasis spacing in a text piece outside inline code. Returns (new_text, changed).
+
+    Same output as the TRIPLE / BOLD / ITALIC regexes this replaced, each
+    re-applied until the text stopped changing, but without their lazy
+    `(.+?)` scans, which made lines with many unmatched markers quadratic
+    per pass. As before, only whitespace-only spans between markers are
+    rewritten (`**   **` -> `****`); tests/test_scripts.py checks the
+    output against the old rules.
+    """
+    if '*' not in text or not SPACED_GAP.search(text):
+        return text, False
     new = text
-    # Apply repeatedly until stable for each pattern
-    for pat in (TRIPLE_PAT, BOLD_PAT, ITALIC_PAT):
+    for m in (3, 2, 1):
         while True:
-            new2 = pat.sub(lambda m: pat_repl(m), new)
+            new2 = _rule_pass(new, m)
             if new2 == new:
                 break
             new = new2
-            changed = True
-    return new, changed
+    return new, new != text
+
+
+def fix_line(line: str, kind: str) -> Tuple[str, bool]:
+    """Fix emphasis spacing in one classified line. Returns (new_line, changed)."""
+    # leave fenced code blocks (``` / ~~~) untouched
+    if kind is FENCE or kind is CODE:
+        return line, False
+    # only transform outside inline code
+    parts = split_inline(line)
+    changed_line = False
+    for i in range(0, len(parts), 2):
+        new_part, changed = fix_line_outside_code(parts[i])
+        if changed:
+            parts[i] = new_part
+            changed_line = True
+    return ('`'.join(parts), True) if changed_line else (line, False)
+
+
+def fix_lines(pairs):
+    """Yield the fixed lines for (line, kind) pairs, e.g. streamed with md_scan.iter_kinds()."""
+    for line, kind in pairs:
+        yield fix_line(line, kind)[0]
+
 
-def pat_repl(m):
-    inner = m.group(1)
-    # strip only surrounding spaces (already matched) but keep inner spacing
-    return m.group(0).replace(m.group(1), inner.strip())
+def fix_doc(doc) -> Tuple[str, bool]:
+    """Fix emphasis spacing in one tokenized file. Returns (new_text, changed)."""
+    out_lines = []
+    changed_file = False
+    for line, kind in zip(doc.lines, doc.kinds):
+        line, changed = fix_line(line, kind)
+        if changed:
+            changed_file = True
+        out_lines.append(line)
+    if not changed_file:
+        return doc.text, False
+    return '\n'.join(out_lines), True
 
 
 def main():
-    md_files = list(ROOT.glob('**/*.md'))
-    md_files = [p for p in md_files if '.git/' not in str(p) and 'site/' not in str(p) and 'scripts/.venv' not in str(p)]
+    ap = argparse.ArgumentParser(description='Fix spaced emphasis markers in Markdown files')
+    md_profile.add_arguments(ap)
+    md_scan.add_stream_argument(ap)
+    args = ap.parse_args()
 
+    profile = md_profile.from_args(args)
     modified = []
-    for p in md_files:
-        s = p.read_text(encoding='utf-8')
-        lines = s.splitlines(True)
-        out_lines = []
-        in_fence = False
-        changed_file = False
-        for line in lines:
-            stripped = line.lstrip()
-            # detect fenced code blocks starting with ``` or ~~~
-            if stripped.startswith('```') or stripped.startswith('~~~'):
-                in_fence = not in_fence
-                out_lines.append(line)
-                continue
-            if in_fence:
-                out_lines.append(line)
-                continue
-            # handle inline code by splitting on backticks and only transforming outside inline code
-            parts = line.split('`')
-            for i in range(0, len(parts)):
-                if i % 2 == 0:
-                    new_part, changed = fix_line_outside_code(parts[i])
-                    if changed:
-                        parts[i] = new_part
-                        changed_file = True
-                else:
-                    # inside inline code - leave as-is
-                    pass
-            out_lines.append('`'.join(parts))
-        new_s = ''.join(out_lines)
+    for p in repo_md_files(ROOT):
+        timer = FileTimer() if profile else None
+        if streamed(p, args.stream_above):
+            if stream_rewrite(p, fix_lines):
+                modified.append(str(p))
+            if timer:
+                timer.lap('stream')
+                profile.add(p, timer)
+            continue
+        text = p.read_text(encoding='utf-8')
+        if timer:
+            timer.lap('read')
+        doc = Doc(text, p)
+        if timer:
+            timer.lap('tokenize')
+        new_s, changed_file = fix_doc(doc)
+        if timer:
+            timer.lap('fix')
         if changed_file:
-            p.write_text(new_s, encoding='utf-8')
+            write_atomic(p, new_s)
             modified.append(str(p))
+            if timer:
+                timer.lap('write')
+        if timer:
+            profile.add(p, timer)
 
     print(f"Files modified: {len(modified)}")
     for m in modified:
         print(" -", m)
+    if profile is not None:
+        profile.finish()
 
 
 if __name__ == '__main__':
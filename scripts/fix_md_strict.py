@@ -8,29 +8,37 @@ Fix common Markdown mechanical style issues across docs/:
 
 This script is conservative: it only promotes an existing heading to H1
 and never invents headings for files that start with content.
+
+Files are written atomically; --jobs N shards the files across N worker
+processes (0 = one per core) without changing the output order.
+--profile REPORT times read / tokenize / fix / write per file (see md_profile.py).
+Files of --stream-above MB or more are fixed line by line and written
+through a temp file instead of being loaded (see md_scan.py).
+
+Usage: python3 scripts/fix_md_strict.py [--jobs N] [--profile REPORT] [--stream-above MB]
 """
+import argparse
 import re
+from functools import partial
 from pathlib import Path
 
-docs = Path('docs')
-md_files = sorted(docs.rglob('*.md'))
-changed_files = []
+import md_profile
+from md_profile import FileTimer
+import md_scan
+from md_scan import (CODE, FENCE, HEADING, TABLE, Doc, docs_files, map_files, stream_rewrite, streamed, with_next,
+                     write_atomic)
 
 heading_re = re.compile(r'^(#{1,6})\s+(.*)$')
-code_fence_re = re.compile(r'^(```|~~~)')
 
-for p in md_files:
-    text = p.read_text(encoding='utf-8')
-    # Normalize line endings
-    text = text.replace('\r\n', '\n').replace('\r', '\n')
-    lines = text.split('\n')
-    orig_lines = list(lines)
-    changed = False
+
+def fix_doc(doc):
+    """Return the fixed text for one tokenized file."""
+    lines = list(doc.lines)
+    kinds = doc.kinds
 
     # Remove trailing blank lines at EOF
     while len(lines) > 0 and lines[-1].strip() == '':
         lines.pop()
-        changed = True
     # Ensure single trailing newline later when writing
 
     # Find first non-blank line
@@ -46,74 +54,162 @@ for p in md_files:
             # If it's a heading but not H1, promote to H1
             if m.group(1) != '#':
                 lines[first_idx] = '# ' + m.group(2).strip()
-                changed = True
 
     # Ensure blank lines around headings and tables, avoid modifying inside code fences
     out = []
-    in_code = False
     i = 0
     n = len(lines)
     while i < n:
         line = lines[i]
-        if code_fence_re.match(line.strip()):
-            # toggle code fence
-            in_code = not in_code
+        k = kinds[i]
+        if k is FENCE or k is CODE:
+            out.append(line)
+            i += 1
+            continue
+        # Heading handling: ensure blank line before and after
+        if k is HEADING:
+            if len(out) > 0 and out[-1].strip() != '':
+                out.append('')
             out.append(line)
+            # If next line exists and is non-empty, insert blank
+            # (a blank line is preferred between consecutive headings too)
+            if i+1 < n and lines[i+1].strip() != '':
+                out.append('')
             i += 1
             continue
-        if not in_code:
-            # Heading handling: ensure blank line before and after
-            if heading_re.match(line):
-                # before
-                if len(out) > 0 and out[-1].strip() != '':
-                    out.append('')
-                    changed = True
-                out.append(line)
-                # after: lookahead to next non-empty line
-                # If next line exists and is non-empty and not a heading, insert blank
-                if i+1 < n and lines[i+1].strip() != '':
-                    # If next is a heading, we still prefer a blank line between headings
-                    out.append('')
-                    changed = True
-                i += 1
-                continue
-            # Table handling: detect blocks with '|' that are not in a list or code
-            if '|' in line:
-                # crude table detection: at least one '|' and not image/link-only
-                # find contiguous block
-                # ensure previous line is blank
-                # We'll collect the block
-                j = i
-                block = []
-                while j < n and '|' in lines[j]:
-                    block.append(lines[j])
-                    j += 1
-                # before block
-                if len(out) > 0 and out[-1].strip() != '':
-                    out.append('')
-                    changed = True
-                out.extend(block)
-                # after block
-                if j < n and lines[j].strip() != '':
-                    out.append('')
-                    changed = True
-                i = j
-                continue
+        # Table handling: treat a run of table lines as one block
+        if k is TABLE:
+            j = i
+            while j < n and kinds[j] is TABLE:
+                j += 1
+            # ensure blank line before and after the block
+            if len(out) > 0 and out[-1].strip() != '':
+                out.append('')
+            out.extend(lines[i:j])
+            if j < n and lines[j].strip() != '':
+                out.append('')
+            i = j
+            continue
         # default
         out.append(line)
         i += 1
 
     # Ensure file ends with a single newline
-    final = '\n'.join(out).rstrip('\n') + '\n'
+    return '\n'.join(out).rstrip('\n') + '\n'
+
+
+def fix_lines(pairs):
+    """fix_doc() for streamed (line, kind) pairs: yields lines that, joined with '\\n', are the fixed text.
+
+    Needs one line of lookahead (md_scan.with_next()); only a run of blank
+    lines is held back until it is known whether more content follows.
+    tests/test_scripts.py checks that both give the same files.
+    """
+    blanks = []         # [line, repeat] runs of blank lines not yet written
+    out = False         # anything written yet
+    out_blank = False   # the last line written is blank
+    first = True
+    prev_kind = None
+    for (line, k), (nxt, next_kind) in with_next(pairs, ('', None)):
+        # Remove trailing blank lines at EOF: hold them back until content follows
+        if line.strip() == '':
+            if blanks and blanks[-1][0] == line:
+                blanks[-1][1] += 1
+            else:
+                blanks.append([line, 1])
+            prev_kind = k
+            continue
+        if blanks:
+            for b, repeat in blanks:
+                for _ in range(repeat):
+                    yield b
+            blanks = []
+            out = out_blank = True
+
+        if first:
+            first = False
+            m = heading_re.match(line)
+            # If the first non-blank line is a heading but not H1, promote to H1
+            if m and m.group(1) != '#':
+                line = '# ' + m.group(2).strip()
+
+        # Ensure blank lines around headings and tables (a run of table lines
+        # is one block), avoid modifying inside code fences
+        if k is HEADING or (k is TABLE and prev_kind is not TABLE):
+            if out and not out_blank:
+                yield ''
+        yield line
+        out = True
+        out_blank = False
+        # If next line exists and is non-empty, insert blank
+        # (a blank line is preferred between consecutive headings too)
+        if k is HEADING or (k is TABLE and next_kind is not TABLE):
+            if nxt.strip() != '':
+                yield ''
+                out_blank = True
+        prev_kind = k
+
+    # Ensure file ends with a single newline
+    if not out:
+        yield ''
+    yield ''
+
+
+def fix_file(p, profile=False, stream_above=md_scan.STREAM_MB):
+    """Fix one file in place. Returns (rewritten, phase times or None).
+
+    Phases (read / tokenize / fix / write) are only timed when profile is set;
+    a streamed file is timed as one 'stream' phase.
+    """
+    timer = FileTimer() if profile else None
+    if streamed(p, stream_above):
+        changed = stream_rewrite(p, fix_lines)
+        if timer:
+            timer.lap('stream')
+        return changed, timer and timer.times
+    text = p.read_text(encoding='utf-8')
+    if timer:
+        timer.lap('read')
+    doc = Doc(text, p)
+    if timer:
+        timer.lap('tokenize')
+    final = fix_doc(doc)
+    if timer:
+        timer.lap('fix')
+    changed = final != doc.text
+    if changed:
+        write_atomic(p, final)
+        if timer:
+            timer.lap('write')
+    return changed, timer and timer.times
+
+
+def main():
+    ap = argparse.ArgumentParser(description='Fix mechanical Markdown style issues in docs/')
+    ap.add_argument('--jobs', type=int, default=1, help='worker processes (0 = one per core)')
+    md_profile.add_arguments(ap)
+    md_scan.add_stream_argument(ap)
+    args = ap.parse_args()
+
+    profile = md_profile.from_args(args)
+    files = docs_files(Path('docs'))
+    changed_files = []
+    work = partial(fix_file, profile=profile is not None, stream_above=args.stream_above)
+    for p, (changed, times) in zip(files, map_files(work, files, args.jobs)):
+        if changed:
+            changed_files.append(str(p))
+        if profile is not None:
+            profile.add(p, times)
 
-    if final != text:
-        p.write_text(final, encoding='utf-8')
-        changed_files.append(str(p))
+    print('Fixed files:', len(changed_files))
+    for f in changed_files[:200]:
+        print(f)
 
-print('Fixed files:', len(changed_files))
-for f in changed_files[:200]:
-    print(f)
+    if len(changed_files) == 0:
+        print('No files needed changes.')
+    if profile is not None:
+        profile.finish()
 
-if len(changed_files) == 0:
-    print('No files needed changes.')
 
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+Generate a deterministic synthetic wiki for benchmarking the scripts.
+
+Writes OUT/docs/ and a matching OUT/site/ (the layout `mkdocs build` gives
+with directory URLs):
+- section folders named like the real tree (`500 Environments`), nested a
+  few levels deep (`500 Environments/510 Site 1/511 Rack 1`), each with an
+  index.md (a few with start.md instead, for rename_start_to_index.py)
+- pages with headings, large pipe tables, fenced code, lists, emphasis
+  noise (`** spaced **`, `**Note**`, `2*3`), `\\\\` return markers and style
+  issues the fixers repair (missing blank lines, H2 as first heading)
+- cross-links to other pages' headings, with a small share pointing at
+  missing pages or anchors so the link checkers have something to report
+- DokuWiki .txt sources next to some pages, for convert_txt_to_md.py
+- one HTML page per Markdown page with ids for the headings, a section
+  nav and the cross-links rewritten to directory URLs
+- with --large-page MB, docs/inventory.md: MB megabytes of generated pages
+  run together, with hard tabs, spaced emphasis, "\\\\" markers and
+  missing blank lines sprinkled in, like a generated inventory page (the
+  input of the scripts' streaming mode)
+
+The same --pages and --seed always give byte-identical output.
+
+Usage: python3 scripts/gen_corpus.py OUT [--pages N] [--seed S] [--large-page MB]
+"""
+import argparse
+import html
+import posixpath
+import random
+import shutil
+from pathlib import Path
+from urllib.parse import quote
+
+from md_link_check import slugify, unique
+
+SECTIONS = ['000 Non-Network Information', '100 Infrastructure', "200 Servers & VM's", '300 Workstations',
+            '400 Peripherals', '500 Environments', '600 Applications', '700 Elements',
+            '800 Standards & Policies', "How To's & Tasks"]
+WORDS = ('switch router vlan subnet gateway firewall backup server rack patch cable port uplink dns dhcp '
+         'domain policy schedule vendor license warranty contact location model serial asset').split()
+TOPICS = ['Overview', 'Configuration', 'Inventory', 'Contacts', 'Maintenance', 'Backups', 'Licensing',
+          'Troubleshooting', 'Change Log', 'Network Layout']
+TABLE_COLS = ['Device', 'Model', 'Serial', 'IP Address', 'Location', 'Owner', 'Notes']
+DEFECTS = ['Port\tspeed\tduplex', 'Uplink ** primary ** path', 'Rack A \\\\ Rack B', '## Inline heading',
+           '| Device | Port |', 'Plain line right after a table', '   * odd indent', '', '', '']
+
+
+def words(rng, lo, hi):
+    return ' '.join(rng.choice(WORDS) for _ in range(rng.randint(lo, hi)))
+
+
+def make_folders(rng, pages):
+    """Return the folder list: every section, plus nested subfolders for larger corpora."""
+    folders = list(SECTIONS)
+    wanted = max(len(SECTIONS), pages // 12)
+    while len(folders) < wanted:
+        parent = rng.choice(folders)
+        if parent.count('/') >= 3:
+            continue
+        base = parent.rsplit('/', 1)[-1]
+        num = base.split(' ', 1)[0]
+        num = int(num) if num.isdigit() else 900
+        n = sum(1 for f in folders if f.startswith(parent + '/')) + 1
+        depth = parent.count('/') + 1
+        label = ['Site', 'Rack', 'Shelf'][depth - 1]
+        folders.append(f'{parent}/{num + n * 10 ** (2 - min(depth, 2)):03d} {label} {n}')
+    return sorted(folders)
+
+
+def plan(rng, pages):
+    """Return [(rel, title, headings)] for every page, index pages first in each folder."""
+    folders = make_folders(rng, pages)
+    out = []
+    for f in folders:
+        name = 'start.md' if rng.random() < 0.05 else 'index.md'
+        out.append((f'{f}/{name}', f.rsplit('/', 1)[-1]))
+    for i in range(pages - len(out)):
+        f = rng.choice(folders)
+        topic = rng.choice(TOPICS)
+        out.append((f'{f}/{i:05d}_{slugify(topic, "_")}.md', f'{i:05d}: {topic}'))
+    result = []
+    for rel, title in sorted(out):
+        heads = [f'{rng.choice(TOPICS)} {words(rng, 1, 2).title()}' for _ in range(rng.randint(2, 6))]
+        result.append((rel, title, heads))
+    return result
+
+
+def rel_link(src, dst):
+    return posixpath.relpath(dst, posixpath.dirname(src))
+
+
+def anchors_for(title, heads):
+    """Heading ids as the toc extension assigns them (the title takes the first slot)."""
+    ids = set()
+    unique(slugify(title), ids)
+    return [unique(slugify(h), ids) for h in heads]
+
+
+def table(rng, rows):
+    cols = rng.sample(TABLE_COLS, rng.randint(3, len(TABLE_COLS)))
+    lines = ['| ' + ' | '.join(cols) + ' |', '|' + '|'.join('---' for _ in cols) + '|']
+    for r in range(rows):
+        cells = [f'{c.lower()}-{r}' if c != 'Notes' else words(rng, 0, 6) for c in cols]
+        if rng.random() < 0.1:
+            cells[-1] = f'** {cells[-1] or "note"} **'
+        lines.append('| ' + ' | '.join(cells) + ' |')
+    return lines
+
+
+def paragraph(rng, links):
+    parts = []
+    for _ in range(rng.randint(3, 8)):
+        r = rng.random()
+        if r < 0.1:
+            parts.append(f'** {words(rng, 1, 3)} **')
+        elif r < 0.15:
+            parts.append(f'* {words(rng, 1, 2)} *')
+        elif r < 0.25:
+            parts.append(f'**{words(rng, 1, 2)}**')
+        elif r < 0.3:
+            parts.append(f'`{words(rng, 1, 2)} * 2*3`')
+        elif r < 0.45 and links:
+            label, url = rng.choice(links)
+            parts.append(f'[{label}]({url})')
+        else:
+            parts.append(words(rng, 4, 12).capitalize() + '.')
+    text = ' '.join(parts)
+    if rng.random() < 0.2:
+        text += ' \\\\ ' + words(rng, 2, 6)
+    return text
+
+
+def page_md(rng, rel, title, heads, targets):
+    """Return (markdown, [(label, target_rel, anchor)]) for one page."""
+    links = []
+    for _ in range(rng.randint(1, 6)):
+        t_rel, t_title, t_heads = rng.choice(targets)
+        anchor = rng.choice(anchors_for(t_title, t_heads)) if rng.random() < 0.6 else ''
+        if rng.random() < 0.02:
+            anchor = 'missing-anchor'
+        if rng.random() < 0.01:
+            t_rel = posixpath.join(posixpath.dirname(t_rel), 'missing_page.md')
+        links.append((t_title, t_rel, anchor))
+    md_links = [(label, quote(rel_link(rel, t)) + (f'#{a}' if a else '')) for label, t, a in links]
+
+    out = []
+    # a few pages start with an H2 or have no blank line after the title (fix_md_strict work)
+    out.append(('## ' if rng.random() < 0.05 else '# ') + title)
+    if rng.random() > 0.1:
+        out.append('')
+    out.append(paragraph(rng, md_links))
+    for h in heads:
+        out.append('')
+        out.append(f'## {h}')
+        if rng.random() > 0.1:
+            out.append('')
+        kind = rng.random()
+        if kind < 0.35:
+            out.extend(table(rng, rng.choice([5, 10, 40, 200])))
+            if rng.random() > 0.1:
+                out.append('')
+            out.append(paragraph(rng, md_links))
+        elif kind < 0.5:
+            out.append('```text')
+            out.extend(f'{words(rng, 1, 4)} ** {i} ** | x' for i in range(rng.randint(3, 15)))
+            out.append('```')
+        elif kind < 0.65:
+            for _ in range(rng.randint(2, 8)):
+                out.append(f'{"  " if rng.random() < 0.3 else ""}* {words(rng, 2, 6)}')
+        else:
+            for _ in range(rng.randint(1, 4)):
+                out.append(paragraph(rng, md_links))
+                out.append('')
+    text = '\n'.join(out).rstrip('\n') + '\n'
+    if rng.random() < 0.05:
+        text += '\n'
+    return text, links
+
+
+def page_txt(rng, title, heads, targets):
+    out = [f'====== {title} ======', '']
+    for h in heads:
+        out.append(f'===== {h} =====')
+        for _ in range(rng.randint(1, 3)):
+            t_rel, t_title, _ = rng.choice(targets)
+            page = posixpath.splitext(posixpath.basename(t_rel))[0]
+            out.append(f'{words(rng, 4, 10).capitalize()} //{words(rng, 1, 2)}// see [[{page}|{t_title}]] '
+                       f'and [[https://example.com/{page}|vendor]].')
+        out.append('----')
+    return '\n'.join(out) + '\n'
+
+
+def page_url(rel):
+    """Site path of the HTML file for a docs page, as mkdocs lays it out with directory URLs."""
+    base = posixpath.splitext(rel)[0]
+    name = posixpath.basename(base)
+    if name in ('index', 'README'):
+        return posixpath.join(posixpath.dirname(base), 'index.html')
+    return base + '/index.html'
+
+
+def page_html(rel, title, heads, links, section_pages):
+    here = page_url(rel)
+    d = posixpath.dirname(here)
+
+    def href(target_rel, anchor=''):
+        url = posixpath.relpath(posixpath.dirname(page_url(target_rel)), d) + '/'
+        return quote(url if url != './' else './') + (f'#{anchor}' if anchor else '')
+
+    root = posixpath.relpath('.', d)
+    out = ['<!doctype html>', '<html><head>', f'<title>{html.escape(title)}</title>',
+           f'<link rel="stylesheet" href="{root}/assets/style.css">', '</head><body>',
+           '<nav class="md-nav"><ul>']
+    for p_rel, p_title in section_pages:
+        out.append(f'<li><a href="{href(p_rel)}" class="md-nav__link">{html.escape(p_title)}</a></li>')
+    out.append('</ul></nav>')
+    out.append(f'<article><h1 id="{slugify(title)}">{html.escape(title)}</h1>')
+    for h, a in zip(heads, anchors_for(title, heads)):
+        out.append(f'<h2 id="{a}">{html.escape(h)}<a class="headerlink" href="#{a}">&para;</a></h2>')
+        out.append('<p>' + ' '.join(f'<a href="{href(t, anc)}">{html.escape(label)}</a>'
+                                    for label, t, anc in links) + '</p>')
+    out.append(f'<p><a href="{root}/index.html">Home</a> <a href="https://example.com/">external</a></p>')
+    out.append('</article></body></html>')
+    return '\n'.join(out) + '\n'
+
+
+def generate(out, pages, seed=0):
+    """Write docs/ and site/ under out. Returns (md_pages, txt_pages, html_pages)."""
+    rng = random.Random(seed)
+    out = Path(out)
+    for sub in ('docs', 'site'):
+        if (out / sub).exists():
+            shutil.rmtree(out / sub)
+    specs = plan(rng, pages)
+    by_folder = {}
+    for rel, title, _ in specs:
+        by_folder.setdefault(posixpath.dirname(rel), []).append((rel, title))
+
+    txt = 0
+    for rel, title, heads in specs:
+        md, links = page_md(rng, rel, title, heads, specs)
+        p = out / 'docs' / rel
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(md, encoding='utf-8')
+        if rng.random() < 0.1:
+            p.with_suffix('.txt').write_text(page_txt(rng, title, heads, specs), encoding='utf-8')
+            txt += 1
+        h = out / 'site' / page_url(rel)
+        h.parent.mkdir(parents=True, exist_ok=True)
+        h.write_text(page_html(rel, title, heads, [l for l in links if not l[1].endswith('missing_page.md')],
+                               by_folder[posixpath.dirname(rel)][:50]), encoding='utf-8')
+    (out / 'site' / 'assets').mkdir(parents=True, exist_ok=True)
+    (out / 'site' / 'assets' / 'style.css').write_text('body { margin: 0 }\n', encoding='utf-8')
+    if not (out / 'site' / 'index.html').exists():
+        (out / 'site' / 'index.html').write_text('<html><body><h1 id="home">Home</h1></body></html>\n',
+                                                 encoding='utf-8')
+    return len(specs), txt, len(specs)
+
+
+def large_page(path, docs, mb, seed=0):
+    """Write roughly mb megabytes of Markdown to path from the pages under docs."""
+    rng = random.Random(seed)
+    pages = [p.read_text(encoding='utf-8') for p in sorted(Path(docs).rglob('*.md'))]
+    target = int(mb * 1e6)
+    size = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('## Inventory\n')
+        while size < target:
+            lines = rng.choice(pages).split('\n')
+            for _ in range(len(lines) // 20):
+                lines.insert(rng.randrange(len(lines)), rng.choice(DEFECTS))
+            chunk = '\n'.join(lines) + '\n'
+            f.write(chunk)
+            size += len(chunk.encode('utf-8'))
+
+
+def main():
+    ap = argparse.ArgumentParser(description='Generate a synthetic docs/ + site/ corpus')
+    ap.add_argument('out', help='output folder (docs/ and site/ inside it are replaced)')
+    ap.add_argument('--pages', type=int, default=1000)
+    ap.add_argument('--seed', type=int, default=0)
+    ap.add_argument('--large-page', type=float, metavar='MB', help='also write docs/inventory.md of this size')
+    args = ap.parse_args()
+
+    md, txt, html_pages = generate(args.out, args.pages, args.seed)
+    if args.large_page:
+        large_page(Path(args.out) / 'docs' / 'inventory.md', Path(args.out) / 'docs', args.large_page, args.seed)
+    print(f'Wrote {md} Markdown pages, {txt} .txt sources and {html_pages} HTML pages to {args.out}')
+
+
+if __name__ == '__main__':
+    main()
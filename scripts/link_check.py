@@ -6,127 +6,461 @@ Lightweight internal link and anchor checker for MkDocs-generated site/
 - Checks all internal <a href="..."> links: that target file exists, and fragment anchors exist
 - Skips external links (http(s)://, //), mailto:, tel:, javascript:
 
+The walk over site/ also builds an in-memory index of every file and
+directory, so link resolution never touches the filesystem, and each
+(source dir, href) pair is resolved only once. --jobs N parses the HTML
+files in N worker processes (0 = one per core).
+
+ids and hrefs are pulled out of the raw bytes with precompiled patterns
+(extract_fast). Files the patterns cannot parse exactly like html.parser
+would (unusual attribute syntax, unterminated comments or scripts,
+non-UTF-8 bytes) and very large files are streamed through IdHrefParser
+instead. Both skip the content of <script>, <style>, <title> and
+<textarea>, whatever the Python version's html.parser does with the
+last two. --parser html forces IdHrefParser for every file;
+tests/test_scripts.py compares both engines.
+
+Each page's ids, hrefs, resolved link targets and findings are kept in
+.cache/link_check.json with the page's content hash. A re-run only parses
+pages that changed, and only re-validates links out of those pages or into
+targets that changed (found through a reverse index of the link graph);
+all other findings are replayed. --cold ignores the cache, --no-cache
+neither reads nor writes it.
+
+--external also probes every http(s) link found in the site, with the
+asyncio checker in external_links.py: each URL once, keep-alive connections
+and a request limit per host, HEAD with a GET fallback, and results cached
+in .cache/external_links.json for --ttl days.
+
 Usage: run after `mkdocs build` so site/ is present.
+  python3 scripts/link_check.py [--jobs N] [--parser fast|html] [--cold] [--no-cache]
+      [--external [--per-host N] [--delay S] [--timeout S] [--ttl DAYS]]
 """
+import argparse
+import codecs
 import os
+import posixpath
+import re
 import sys
+from functools import partial
+from html import unescape
 from html.parser import HTMLParser
-from urllib.parse import urlparse, urldefrag, unquote
+from urllib.parse import urlparse, unquote
+
+from external_links import DAY, LinkCache, check_urls, describe, is_ok
+from md_scan import map_files
+from result_cache import ResultCache, digest, digest_file, source_version
+
+SKIP_SCHEMES = ('http','https','mailto','tel','javascript','file')
+CACHE_PATH = os.path.join('.cache', 'link_check.json')
+CHUNK_SIZE = 1 << 16
+# larger files are streamed through IdHrefParser instead of read whole
+FAST_MAX_BYTES = 64 << 20
+
+# start tag with well-formed, whitespace-separated attributes; group 3 is
+# empty when the tag is not closed the way the pattern expects
+TAG_RE = re.compile(rb"""<([a-zA-Z][^\t\n\r\f />\x00]*)
+    ((?:\s+[^\s"'>/=\x00]+(?:\s*=\s*(?:"[^"]*"|'[^']*'|[^\s"'=<>`]+))?)*)
+    \s*(/?>)?""", re.X)
+ATTR_RE = re.compile(rb"""\s+([^\s"'>/=\x00]+)(?:(\s*=\s*)(?:"([^"]*)"|'([^']*)'|([^\s"'=<>`]+)))?""")
+# raw text elements whose content is never scanned for tags; html.parser only
+# knows script / style, title / textarea (RCDATA in HTML) are added on top
+RAW_TEXT_ELEMENTS = ('script', 'style', 'title', 'textarea')
+# regions html.parser does not scan for tags: comments, raw text elements,
+# marked sections (<![CDATA[...]]>, group 2), and end tags, processing
+# instructions and declarations, which end at the first '>' (only those
+# holding a '<' could hide a start tag)
+SKIP_RE = re.compile(rb'<!--|<(script|style|title|textarea)(?=[\t\n\r\f />])|<(!\[)|<[/?!][^>]*<', re.I)
+COMMENT_END_RE = re.compile(rb'--\s*>')
+CDATA_END_RE = {name.encode(): re.compile(rb'</\s*%s\s*>' % name.encode(), re.I) for name in RAW_TEXT_ELEMENTS}
 
-ROOT = os.path.join(os.getcwd(), 'site')
-if not os.path.isdir(ROOT):
-    print('site/ directory not found; run `mkdocs build` first', file=sys.stderr)
-    sys.exit(2)
 
 class IdHrefParser(HTMLParser):
+    """ids and <a> hrefs of a page, by html.parser.
+
+    Newer html.parser releases treat <title> and <textarea> as RCDATA (no
+    tags inside), older ones parse tags in them; on those, handle_starttag
+    switches to raw text mode itself, so the results, and extract_fast(),
+    agree on every Python version. Checked against html.parser of Python
+    3.10.13 to 3.13.5.
+    """
+
     def __init__(self):
         super().__init__()
         self.ids = set()
-        self.hrefs = []  # list of (href, lineno)
+        self.hrefs = []
+
     def handle_starttag(self, tag, attrs):
+        self.handle_startendtag(tag, attrs)
+        if tag in RAW_TEXT_ELEMENTS and tag not in self.CDATA_CONTENT_ELEMENTS and \
+                tag not in getattr(self, 'RCDATA_CONTENT_ELEMENTS', ()):
+            self.set_cdata_mode(tag)
+
+    def handle_startendtag(self, tag, attrs):
         ad = dict(attrs)
         if 'id' in ad:
             self.ids.add(ad['id'])
         if tag == 'a' and 'href' in ad:
             self.hrefs.append(ad['href'])
 
-# gather ids and hrefs per file
-file_ids = {}
-file_hrefs = {}
-html_files = []
-for dirpath,dirnames,filenames in os.walk(ROOT):
-    for fn in filenames:
-        if fn.lower().endswith('.html'):
-            path = os.path.join(dirpath, fn)
-            html_files.append(path)
-            data = open(path,'rb').read()
-            try:
-                text = data.decode('utf-8')
-            except UnicodeDecodeError:
-                try:
-                    text = data.decode('latin-1')
-                except Exception:
-                    text = ''
-            p = IdHrefParser()
+
+def _feed(path, encoding):
+    p = IdHrefParser()
+    decoder = codecs.getincrementaldecoder(encoding)()
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(CHUNK_SIZE)
+            text = decoder.decode(chunk, final=not chunk)
             try:
                 p.feed(text)
             except Exception:
-                pass
-            rel = os.path.relpath(path, ROOT)
-            file_ids[rel] = p.ids
-            file_hrefs[rel] = p.hrefs
-
-# helper to resolve a link href relative to an html file
-def resolve_target(source_rel, href):
-    href = unquote(href.split('#',1)[0])
-    if href.strip() == '':
-        return source_rel, ''
-    # if href is fragment-only
-    if href.startswith('#'):
-        return source_rel, href[1:]
-    # skip absolute urls
-    parsed = urlparse(href)
-    if parsed.scheme in ('http','https','mailto','tel','javascript','file') or href.startswith('//'):
-        return None, None
-    # make path relative to source; handle root-relative paths starting with '/'
-    src_dir = os.path.dirname(source_rel)
-    path = parsed.path
-    if path.startswith('/'):
-        # root-relative: drop leading slash
-        candidate = os.path.normpath(path.lstrip('/'))
-    else:
-        candidate = os.path.normpath(os.path.join(src_dir, path))
-    # If candidate is directory, append index.html
-    # Normalize slashes for consistent keys
-    candidate = candidate.replace('\\', '/')
-
-    full_candidate = os.path.join(ROOT, candidate)
-    # If candidate is a directory, use its index.html
-    if os.path.isdir(full_candidate):
-        candidate = os.path.join(candidate, 'index.html')
-        full_candidate = os.path.join(ROOT, candidate)
-
-    # If no extension, try candidate + '.html'
-    if not os.path.splitext(candidate)[1]:
-        if os.path.exists(full_candidate + '.html'):
-            candidate = candidate + '.html'
-            full_candidate = os.path.join(ROOT, candidate)
-
-    # If candidate doesn't exist, try candidate + '/index.html'
-    if not os.path.exists(full_candidate):
-        if os.path.exists(os.path.join(ROOT, candidate, 'index.html')):
-            candidate = os.path.join(candidate, 'index.html')
-            full_candidate = os.path.join(ROOT, candidate)
-
-    return candidate.replace('\\','/'), (href.split('#',1)[1] if '#' in href else '')
-
-broken = []
-checked = 0
-for src, hrefs in file_hrefs.items():
-    for h in hrefs:
-        checked += 1
-        tgt, frag = resolve_target(src, h)
-        if tgt is None and frag is None:
-            # external link; skip
+                break
+            if not chunk:
+                break
+    return p
+
+
+def parse_html_stream(path):
+    """Return (ids, hrefs) for one HTML file, feeding IdHrefParser in chunks."""
+    try:
+        p = _feed(path, 'utf-8')
+    except UnicodeDecodeError:
+        p = _feed(path, 'latin-1')
+    return p.ids, p.hrefs
+
+
+def _add_tag(name, attrs, ids, hrefs):
+    is_a = name == b'a' or name == b'A'
+    ad = {}
+    for an, eq, dq, sq, uq in ATTR_RE.findall(attrs):
+        an = an.lower()
+        if an == b'id' or an == b'href':
+            if not eq:
+                ad[an] = None
+            else:
+                v = (dq or sq or uq).decode('utf-8')
+                ad[an] = unescape(v) if '&' in v else v
+    if b'id' in ad:
+        ids.add(ad[b'id'])
+    if is_a and b'href' in ad:
+        hrefs.append(ad[b'href'])
+
+
+def _scan_tags(data, start, end, ids, hrefs):
+    for name, attrs, close in TAG_RE.findall(data, start, end):
+        if not close:
+            raise ValueError('unsupported start tag syntax')
+        # only <a> and tags with an id attribute matter
+        if name == b'a' or name == b'A' or b'id' in attrs or b'ID' in attrs or b'Id' in attrs or b'iD' in attrs:
+            _add_tag(name, attrs, ids, hrefs)
+
+
+def extract_fast(data):
+    """Return (ids, hrefs) from raw HTML bytes, like IdHrefParser would.
+
+    Raises ValueError (or UnicodeDecodeError) when the buffer needs the full
+    html.parser treatment.
+    """
+    if not data.isascii():
+        data.decode('utf-8')
+    ids = set()
+    hrefs = []
+    pos = 0
+    n = len(data)
+    while True:
+        m = SKIP_RE.search(data, pos)
+        _scan_tags(data, pos, m.start() if m else n, ids, hrefs)
+        if m is None:
+            return ids, hrefs
+        if m.group(2):
+            raise ValueError('marked section')
+        if m.group(1) is None:
+            if m.group(0) == b'<!--':
+                c = COMMENT_END_RE.search(data, m.end())
+                if c is None:
+                    raise ValueError('unterminated comment')
+                pos = c.end()
+            else:
+                c = data.find(b'>', m.start() + 2)
+                if c < 0:
+                    raise ValueError('unterminated ' + m.group(0)[:2].decode())
+                pos = c + 1
             continue
-        if tgt is None:
+        # a raw text element: report the tag itself, then skip its content
+        t = TAG_RE.match(data, m.start())
+        if not t.group(3):
+            raise ValueError('unsupported start tag syntax')
+        _add_tag(t.group(1), t.group(2), ids, hrefs)
+        pos = t.end()
+        if t.group(3) == b'>':
+            c = CDATA_END_RE[m.group(1).lower()].search(data, pos)
+            if c is None:
+                raise ValueError('unterminated ' + m.group(1).decode())
+            pos = c.end()
+
+
+def parse_html(path, parser='fast', data=None):
+    """Return (ids, hrefs) for one HTML file; data may hold its bytes already."""
+    if parser == 'fast' and (data is not None or os.path.getsize(path) <= FAST_MAX_BYTES):
+        if data is None:
+            with open(path, 'rb') as f:
+                data = f.read()
+        try:
+            return extract_fast(data)
+        except ValueError:
+            # UnicodeDecodeError is a ValueError too
+            pass
+    return parse_html_stream(path)
+
+
+def parse_task(task, parser='fast'):
+    """Worker: hash and parse one HTML file. Skips parsing when the hash equals known_hash.
+
+    Returns (stat, hash, {'ids': [...], 'hrefs': [...]} or None).
+    """
+    path, known_hash = task
+    st = os.stat(path)
+    data = None
+    if st.st_size <= FAST_MAX_BYTES:
+        with open(path, 'rb') as f:
+            data = f.read()
+        h = digest(data)
+    else:
+        h = digest_file(path)
+    if h == known_hash:
+        return st, h, None
+    ids, hrefs = parse_html(path, parser, data)
+    return st, h, {'ids': list(ids), 'hrefs': hrefs}
+
+
+class SiteIndex:
+    """Every file and directory under site/, as '/'-separated relative paths."""
+
+    def __init__(self, files, dirs):
+        self.files = files
+        self.dirs = dirs
+        self._memo = {}
+
+    def exists(self, rel):
+        return rel in self.files or rel in self.dirs
+
+    def resolve(self, source_rel, href):
+        """Resolve href found in source_rel to (target_rel, fragment).
+
+        Returns (None, None) for external links.
+        """
+        path, _, frag = href.partition('#')
+        frag = unquote(frag)
+        path = unquote(path)
+        if path.strip() == '':
+            # fragment-only or empty href points at the source page itself
+            return source_rel, frag
+        key = (posixpath.dirname(source_rel), path)
+        try:
+            target = self._memo[key]
+        except KeyError:
+            target = self._memo[key] = self._resolve_path(*key)
+        if target is None:
+            return None, None
+        return target, frag
+
+    def _resolve_path(self, src_dir, path):
+        parsed = urlparse(path)
+        if parsed.scheme in SKIP_SCHEMES or path.startswith('//'):
+            return None
+        # make path relative to source; handle root-relative paths starting with '/'
+        path = parsed.path.replace('\\', '/')
+        if path.startswith('/'):
+            candidate = posixpath.normpath(path.lstrip('/') or '.')
+        else:
+            candidate = posixpath.normpath(posixpath.join(src_dir, path))
+        # If candidate is a directory, use its index.html
+        if candidate in self.dirs:
+            return posixpath.normpath(posixpath.join(candidate, 'index.html'))
+        # If no extension, try candidate + '.html'
+        if not posixpath.splitext(candidate)[1] and candidate + '.html' in self.files:
+            return candidate + '.html'
+        return candidate
+
+
+def walk_site(root):
+    """Walk site/ once. Returns (SiteIndex, [(path, rel) of every HTML file])."""
+    files = set()
+    dirs = set()
+    html = []
+    for dirpath,dirnames,filenames in os.walk(root):
+        dirnames.sort()
+        rel_dir = os.path.relpath(dirpath, root).replace(os.sep, '/')
+        dirs.add(rel_dir)
+        for fn in sorted(filenames):
+            rel = posixpath.normpath(posixpath.join(rel_dir, fn))
+            files.add(rel)
+            if fn.lower().endswith('.html'):
+                html.append((os.path.join(dirpath, fn), rel))
+    return SiteIndex(files, dirs), html
+
+
+def affected_targets(path):
+    """Link targets whose resolution can change when `path` appears or disappears."""
+    out = {path, path + '.html', path + '/index.html'}
+    if path.endswith('.html'):
+        out.add(path[:-5])
+    return out
+
+
+def check_site(root, jobs=1, parser='fast', cache=None):
+    """Check every internal link under root.
+
+    With a cache, only changed HTML files are parsed and only links out of
+    changed pages, or into pages/paths that changed, are re-validated; all
+    other findings are replayed. Returns (pages, checked, broken, stats).
+    """
+    index, html = walk_site(root)
+    old_html = set(cache.old) if cache is not None else set()
+    old_paths = set(cache.extra.get('paths', ())) if cache is not None else set()
+
+    # per-page state: ids, hrefs, resolved internal targets and findings
+    pages = {}
+    tasks = []
+    for path, rel in html:
+        pages[rel] = None
+        if cache is not None:
+            hit, pages[rel] = cache.fresh(rel, os.stat(path))
+            if hit:
+                continue
+        tasks.append((path, rel, cache.cached_hash(rel) if cache is not None else None))
+    changed = set()
+    results = map_files(partial(parse_task, parser=parser), [(p, h) for p, _, h in tasks], jobs)
+    for (path, rel, _), (st, h, res) in zip(tasks, results):
+        if res is None:
+            pages[rel] = cache.match(rel, st, h)[1]
             continue
-        tgt_path = os.path.join(ROOT, tgt) if tgt else os.path.join(ROOT, src)
-        tgt_rel = tgt if tgt else src
-        if not os.path.exists(tgt_path):
-            broken.append((src, h, 'target-not-found', tgt_rel))
+        pages[rel] = res
+        changed.add(rel)
+        if cache is not None:
+            cache.put(rel, st, h, res)
+
+    # targets whose existence or anchors may differ from the previous run
+    touched = changed | (old_html - set(pages))
+    if old_paths:
+        for p in old_paths.symmetric_difference(index.files | index.dirs):
+            touched |= affected_targets(p)
+
+    # reverse link index: target -> pages linking to it
+    linked_from = {}
+    for rel, page in pages.items():
+        if rel not in changed:
+            for t in page['targets']:
+                linked_from.setdefault(t, []).append(rel)
+    recheck = {src for t in touched for src in linked_from.get(t, ())}
+
+    ids_cache = {}
+    def ids_of(t):
+        try:
+            return ids_cache[t]
+        except KeyError:
+            page = pages.get(t)
+            ids = ids_cache[t] = set(page['ids']) if page is not None else set()
+            return ids
+
+    revalidated = 0
+    for rel, page in pages.items():
+        full = rel in changed
+        if not full and rel not in recheck:
             continue
-        if frag:
-            ids = file_ids.get(tgt_rel.replace('\\','/'), set())
-            if frag not in ids:
-                broken.append((src, h, 'anchor-not-found', tgt_rel + '#' + frag))
-
-# report
-print(f'Scanned {len(html_files)} HTML files, checked {checked} links.')
-if not broken:
-    print('No broken internal links or anchors found.')
-    sys.exit(0)
-print('\nBroken links and anchors:')
-for b in broken:
-    print(f'- In {b[0]} -> "{b[1]}" => {b[2]} ({b[3]})')
-sys.exit(1)
+        old = {b[0]: b for b in page.get('broken', ())}
+        targets = set()
+        broken = []
+        for h in page['hrefs']:
+            tgt, frag = index.resolve(rel, h)
+            if tgt is None:
+                # external link; skip
+                continue
+            targets.add(tgt)
+            if not full and tgt not in touched:
+                if h in old:
+                    broken.append(old[h])
+                continue
+            revalidated += 1
+            if not index.exists(tgt):
+                broken.append([h, 'target-not-found', tgt])
+            elif frag and frag not in ids_of(tgt):
+                broken.append([h, 'anchor-not-found', tgt + '#' + frag])
+        page['targets'] = sorted(targets)
+        page['broken'] = broken
+
+    if cache is not None:
+        cache.save({'paths': sorted(index.files | index.dirs)})
+    checked = sum(len(page['hrefs']) for page in pages.values())
+    broken = [(rel, *b) for rel, page in pages.items() for b in page['broken']]
+    return len(pages), checked, broken, {'parsed': len(changed), 'revalidated': revalidated,
+                                         'external': external_links(pages)}
+
+
+def external_links(pages):
+    """{http(s) URL without fragment: [pages linking to it]}."""
+    out = {}
+    for rel, page in pages.items():
+        for h in page['hrefs']:
+            if h.startswith(('http://', 'https://')):
+                out.setdefault(h.partition('#')[0], []).append(rel)
+    return out
+
+
+def main():
+    ap = argparse.ArgumentParser(description='Internal link and anchor checker for site/')
+    ap.add_argument('--jobs', type=int, default=1, help='worker processes for HTML parsing (0 = one per core)')
+    ap.add_argument('--parser', choices=('fast', 'html'), default='fast', help='id/href extraction engine')
+    ap.add_argument('--cold', action='store_true', help='ignore the link graph cache and re-check everything')
+    ap.add_argument('--no-cache', action='store_true', help='do not read or write the link graph cache')
+    ap.add_argument('--external', action='store_true', help='also check external http(s) links')
+    ap.add_argument('--per-host', type=int, default=4, help='external mode: requests in flight per host')
+    ap.add_argument('--delay', type=float, default=0.0, help='external mode: seconds between requests to a host')
+    ap.add_argument('--timeout', type=float, default=15.0, help='external mode: seconds per request')
+    ap.add_argument('--ttl', type=float, default=7, help='external mode: days before a working URL is probed again')
+    args = ap.parse_args()
+
+    root = os.path.join(os.getcwd(), 'site')
+    if not os.path.isdir(root):
+        print('site/ directory not found; run `mkdocs build` first', file=sys.stderr)
+        sys.exit(2)
+    cache = None
+    if not args.no_cache:
+        # the extractor is part of the key: a graph built with one is not reused with the other
+        version = source_version(os.path.abspath(__file__), tag=root + ':' + args.parser)
+        cache = ResultCache(CACHE_PATH, version, cold=args.cold)
+    n_pages, checked, broken, stats = check_site(root, args.jobs, args.parser, cache)
+
+    # report
+    print(f'Scanned {n_pages} HTML files, checked {checked} links.')
+    if cache is not None:
+        print(f"Re-parsed {stats['parsed']} changed files, re-validated {stats['revalidated']} links.")
+    failed = False
+    if not broken:
+        print('No broken internal links or anchors found.')
+    else:
+        failed = True
+        print('\nBroken links and anchors:')
+        for b in broken:
+            print(f'- In {b[0]} -> "{b[1]}" => {b[2]} ({b[3]})')
+    if args.external:
+        linked = stats['external']
+        url_cache = None if args.no_cache else LinkCache(ttl=args.ttl * DAY, cold=args.cold)
+        results, ext = check_urls(linked, url_cache, args.per_host, delay=args.delay, timeout=args.timeout)
+        print(f"\nExternal: {ext['urls']} URLs, probed {ext['probed']} ({ext['requests']} requests over "
+              f"{ext['connections']} connections to {ext['hosts']} hosts), {ext['urls'] - ext['probed']} from cache.")
+        dead = [u for u in sorted(results) if not is_ok(results[u])]
+        if dead:
+            failed = True
+            print('\nBroken external links:')
+            for u in dead:
+                pages = linked[u]
+                more = f' and {len(pages) - 3} more' if len(pages) > 3 else ''
+                print(f"- {u} => {describe(results[u])} (in {', '.join(pages[:3])}{more})")
+        else:
+            print('No broken external links found.')
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
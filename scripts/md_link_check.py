@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Source-level link and anchor checker for docs/ (no `mkdocs build` needed).
+
+- Builds the anchor index of every page from its headings, using the toc
+  extension's slug rules (its slugify when Markdown is installed, and the
+  _1, _2 suffixes for repeated headings) on the heading's rendered text,
+  plus explicit ids from attr_list (`{#id}`) and raw HTML (`id=` / `name=`)
+- Collects Markdown links, images, reference definitions and HTML
+  href/src attributes, skipping fenced and inline code
+- Resolves relative links against the page's folder and root-relative
+  links against docs/; a link to a folder resolves to its index.md (the
+  layout rename_start_to_index.py sets up)
+- Reports targets that do not exist and #anchors missing from the target page
+- Skips external links (any scheme such as http:, mailto:, and //)
+
+Usage: python3 scripts/md_link_check.py [--jobs N]
+Exit code 1 if broken links or anchors were found.
+"""
+import argparse
+import html
+import os
+import posixpath
+import re
+import unicodedata
+from pathlib import Path
+from urllib.parse import unquote
+
+try:
+    # the slug function of the toc extension MkDocs renders with
+    from markdown.extensions.toc import slugify as toc_slugify
+except ImportError:
+    toc_slugify = None
+
+from md_scan import BLANK, CODE, FENCE, HEADING, TEXT, Doc, heading_re, map_files, split_inline
+
+INLINE_LINK_RE = re.compile(r'!?\[(?:[^\[\]]|\[[^\[\]]*\])*\]\(\s*<?([^)\s>]*)>?(?:\s+(?:"[^"]*"|\'[^\']*\'|\([^)]*\)))?\s*\)')
+REF_DEF_RE = re.compile(r'^ {0,3}\[[^\]]+\]:\s*<?([^\s>]+)>?')
+HTML_URL_RE = re.compile(r'''\b(?:href|src)\s*=\s*(["'])(.*?)\1''', re.I)
+HTML_ID_RE = re.compile(r'''\b(?:id|name)\s*=\s*(["'])(.*?)\1''', re.I)
+ATTR_LIST_RE = re.compile(r'\s*\{:?([^}]*)\}\s*$')
+ATTR_ID_RE = re.compile(r'#([^\s}#.]+)')
+SETEXT_RE = re.compile(r'^ {0,3}(=+|-+)\s*$')
+SCHEME_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9+.-]*:')
+IDCOUNT_RE = re.compile(r'^(.*)_([0-9]+)$')
+
+# inline markup removed from heading text before slugging, as Python-Markdown renders it:
+# code spans keep their text; `_` only delimits emphasis at word boundaries (ip_address
+# stays as it is), while `*` and other punctuation are dropped by slugify anyway
+CODE_SPAN_RE = re.compile(r'(?<![\\`])(`+)(?!`)(.+?)(?<!`)\1(?!`)')
+CODE_MARK_RE = re.compile(r'\x02(\d+)\x03')
+ESCAPE_RE = re.compile(r'\\([\\`*_{}\[\]()>#+\-.!])')
+IMAGE_RE = re.compile(r'!\[[^\]]*\]\([^)]*\)')
+LINK_TEXT_RE = re.compile(r'\[([^\]]*)\]\([^)]*\)')
+TAG_RE = re.compile(r'<[^>]+>')
+UNDERSCORE_EM_RE = re.compile(r'(?<!\w)(_{1,3})(?!_)(.+?)(?<!_)\1(?!\w)')
+
+
+def slugify(value, separator='-'):
+    """markdown.extensions.toc.slugify; the same rules when Markdown is not installed."""
+    if toc_slugify is not None:
+        return toc_slugify(value, separator)
+    value = unicodedata.normalize('NFKD', value).encode('ascii', 'ignore').decode('ascii')
+    value = re.sub(r'[^\w\s-]', '', value).strip().lower()
+    return re.sub(r'[{}\s]+'.format(separator), separator, value)
+
+
+def unique(id, ids):
+    """Same rules as markdown.extensions.toc.unique."""
+    while id in ids or not id:
+        m = IDCOUNT_RE.match(id)
+        if m:
+            id = '%s_%d' % (m.group(1), int(m.group(2)) + 1)
+        else:
+            id = '%s_%d' % (id, 1)
+    ids.add(id)
+    return id
+
+
+def heading_anchor(text, ids):
+    """Return the id the toc extension gives a heading with this source text."""
+    text = text.strip()
+    m = ATTR_LIST_RE.search(text)
+    if m:
+        explicit = ATTR_ID_RE.findall(m.group(1))
+        text = text[:m.start()]
+        if explicit:
+            ids.add(explicit[-1])
+            return explicit[-1]
+    return unique(slugify(heading_text(text)), ids)
+
+
+def heading_text(text):
+    """The plain text of a heading's inline Markdown, the text the toc extension slugs."""
+    codes = []
+
+    def stash(m):
+        codes.append(m.group(2).strip())
+        return f'\x02{len(codes) - 1}\x03'
+
+    text = CODE_SPAN_RE.sub(stash, text) if '`' in text else text
+    # an escaped underscore is never an emphasis delimiter; \x01 holds its place
+    text = ESCAPE_RE.sub(lambda m: '\x01' if m.group(1) == '_' else m.group(1), text)
+    text = IMAGE_RE.sub('', text)
+    text = LINK_TEXT_RE.sub(r'\1', text)
+    text = TAG_RE.sub('', text)
+    while '_' in text:
+        new = UNDERSCORE_EM_RE.sub(r'\2', text)
+        if new == text:
+            break
+        text = new
+    text = html.unescape(text.replace('\x01', '_'))
+    return CODE_MARK_RE.sub(lambda m: codes[int(m.group(1))], text) if codes else text
+
+
+def line_links(line):
+    """Return ([(start, end, url)], is_ref_def) for the link URLs in one line outside inline code.
+
+    start/end are the URL's columns in line; a reference definition line
+    holds nothing else.
+    """
+    m = REF_DEF_RE.match(line)
+    if m:
+        return [(m.start(1), m.end(1), m.group(1))], True
+    spans = []
+    offset = 0
+    for k, text in enumerate(split_inline(line)):
+        if k % 2 == 0:
+            for m in INLINE_LINK_RE.finditer(text):
+                spans.append((offset + m.start(1), offset + m.end(1), m.group(1)))
+            if '<' in text:
+                for m in HTML_URL_RE.finditer(text):
+                    spans.append((offset + m.start(2), offset + m.end(2), m.group(2)))
+        offset += len(text) + 1
+    return spans, False
+
+
+def page_info(doc):
+    """Return (anchors, links) for one page; links are (line number, url) pairs."""
+    anchors = set()
+    links = []
+    lines = doc.lines
+    kinds = doc.kinds
+    for i, (line, kind) in enumerate(zip(lines, kinds)):
+        if kind is FENCE or kind is CODE or kind is BLANK:
+            continue
+        if kind is HEADING:
+            text = line[heading_re.match(line).end():].rstrip()
+            text = re.sub(r'\s+#+$', '', text)
+            heading_anchor(text, anchors)
+        elif kind is TEXT and SETEXT_RE.match(line) and i > 0 and kinds[i-1] is TEXT:
+            heading_anchor(lines[i-1], anchors)
+        spans, is_ref_def = line_links(line)
+        links.extend((i+1, url) for _, _, url in spans)
+        if is_ref_def:
+            continue
+        parts = split_inline(line)
+        for text in parts[::2]:
+            if '<' in text:
+                for m in HTML_ID_RE.finditer(text):
+                    anchors.add(m.group(2))
+            if '{' in text and kind is not HEADING:
+                m = ATTR_LIST_RE.search(text)
+                if m:
+                    anchors.update(ATTR_ID_RE.findall(m.group(1)))
+    return anchors, links
+
+
+def page_task(task):
+    """Worker: read and scan one page. Returns (anchors, links)."""
+    return page_info(Doc(task.read_text(encoding='utf-8'), task))
+
+
+class DocsIndex:
+    """Files and folders under docs/ plus the anchors and links of every page."""
+
+    def __init__(self, files, dirs, pages):
+        self.files = files
+        self.dirs = dirs
+        self.pages = pages
+
+    def resolve(self, source_rel, url):
+        """Resolve url found in source_rel to (target_rel, fragment), or (None, None) if external."""
+        if url.startswith('//') or SCHEME_RE.match(url) or url.startswith('{{'):
+            return None, None
+        path, _, frag = url.partition('#')
+        path = unquote(path.split('?', 1)[0])
+        frag = unquote(frag)
+        if path == '':
+            return source_rel, frag
+        if path.startswith('/'):
+            target = posixpath.normpath(path.lstrip('/') or '.')
+        else:
+            target = posixpath.normpath(posixpath.join(posixpath.dirname(source_rel), path))
+        if target in self.dirs:
+            target = posixpath.normpath(posixpath.join(target, 'index.md'))
+        return target, frag
+
+    def check(self, rels=None):
+        """Return broken links as (source, line, url, kind, where); rels limits the sources checked."""
+        broken = []
+        for src in (self.pages if rels is None else rels):
+            for line, url in self.pages[src][1]:
+                tgt, frag = self.resolve(src, url)
+                if tgt is None:
+                    continue
+                if tgt not in self.files:
+                    broken.append((src, line, url, 'target-not-found', tgt))
+                elif frag and tgt in self.pages and frag not in self.pages[tgt][0]:
+                    broken.append((src, line, url, 'anchor-not-found', tgt + '#' + frag))
+        return broken
+
+
+def scan_docs(docs, jobs=1):
+    """Walk docs/ once and scan every page. Returns a DocsIndex with docs-relative paths."""
+    files = set()
+    dirs = set()
+    md = []
+    for dirpath, dirnames, filenames in os.walk(docs):
+        dirnames.sort()
+        rel_dir = os.path.relpath(dirpath, docs).replace(os.sep, '/')
+        dirs.add(rel_dir)
+        for fn in sorted(filenames):
+            rel = posixpath.normpath(posixpath.join(rel_dir, fn))
+            files.add(rel)
+            if fn.endswith('.md'):
+                md.append((Path(dirpath) / fn, rel))
+    infos = map_files(page_task, [p for p, _ in md], jobs)
+    return DocsIndex(files, dirs, {rel: info for (_, rel), info in zip(md, infos)})
+
+
+def format_broken(b, prefix='docs/'):
+    return f'- In {prefix}{b[0]}:{b[1]} -> "{b[2]}" => {b[3]} ({b[4]})'
+
+
+def main():
+    ap = argparse.ArgumentParser(description='Check links and anchors in docs/ without building the site')
+    ap.add_argument('--jobs', type=int, default=1, help='worker processes (0 = one per core)')
+    args = ap.parse_args()
+
+    docs = Path('docs')
+    if not docs.is_dir():
+        print('docs/ directory not found')
+        raise SystemExit(2)
+    index = scan_docs(docs, args.jobs)
+    broken = index.check()
+    checked = sum(len(links) for _, links in index.pages.values())
+    print(f'Scanned {len(index.pages)} Markdown files, checked {checked} links.')
+    if not broken:
+        print('No broken links or anchors found.')
+        raise SystemExit(0)
+    print('\nBroken links and anchors:')
+    for b in broken:
+        print(format_broken(b))
+    raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Move or rename pages (or whole folders) under docs/ and fix the links to them.
+
+Keeps a backlink index in .cache/md_backlinks.json: for every Markdown page,
+the byte spans of its internal link URLs (Markdown links, images, reference
+definitions, HTML href/src) grouped by the page or file they point at.
+Entries are keyed by content hash like the other caches (see
+result_cache.py), so only pages edited since the last run are re-read; the
+target -> referring pages mapping is rebuilt from it in memory.
+
+A move then touches only:
+- the pages that link to a moved file (their URLs are rewritten in place at
+  the recorded byte offsets, keeping #fragments, ?queries, root-relative
+  `/...` style and folder-style `dir/` links)
+- the moved pages themselves, whose relative links change with their folder
+
+All new contents are staged before anything on disk changes, then the moves
+and rewrites are applied as one batch; if any step fails, the files already
+moved or rewritten are restored.
+
+Usage: python3 scripts/md_move.py SRC DST [SRC DST ...] [--dry-run] [--cold] [--jobs N]
+  SRC / DST are paths in docs/ (the docs/ prefix is optional); moving a
+  folder moves everything in it. e.g.
+  python3 scripts/md_move.py "500 Environments/security.md" "800 Standards & Policies/security.md"
+"""
+import argparse
+import os
+import posixpath
+import re
+import tempfile
+from pathlib import Path
+from urllib.parse import quote
+
+from md_link_check import DocsIndex, line_links
+from md_scan import BLANK, CODE, FENCE, Doc, map_files
+from result_cache import ResultCache, digest, source_version
+
+# bump when the stored spans change meaning; edits to the scanner files also invalidate the index
+INDEX_VERSION = '1'
+CACHE_PATH = Path('.cache') / 'md_backlinks.json'
+NEWLINE_RE = re.compile(rb'\r\n|\r|\n')
+URL_SPLIT_RE = re.compile(r'([^?#]*)(.*)', re.S)
+
+# resolves without folder -> index.md mapping, so stored targets stay valid when folders appear;
+# the mapping is applied when the index is loaded
+RAW = DocsIndex(set(), set(), {})
+
+
+def index_version():
+    here = Path(__file__).resolve().parent
+    return source_version(here / 'md_move.py', here / 'md_link_check.py', here / 'md_scan.py',
+                          tag=INDEX_VERSION)
+
+
+def page_links(rel, data):
+    """Return {target: [[start, end], ...]}: byte spans of the internal link URLs in one page."""
+    doc = Doc(data.decode('utf-8'))
+    starts = [0]
+    starts.extend(m.end() for m in NEWLINE_RE.finditer(data))
+    out = {}
+    for i, (line, kind) in enumerate(zip(doc.lines, doc.kinds)):
+        if kind is FENCE or kind is CODE or kind is BLANK:
+            continue
+        if '](' not in line and ']:' not in line and '<' not in line:
+            continue
+        for s, e, url in line_links(line)[0]:
+            if not URL_SPLIT_RE.match(url).group(1):
+                # #fragment-only links never change
+                continue
+            target, _ = RAW.resolve(rel, url)
+            if target is None:
+                continue
+            start = starts[i] + len(line[:s].encode('utf-8'))
+            out.setdefault(target, []).append([start, start + len(url.encode('utf-8'))])
+    return out
+
+
+def index_task(task):
+    """Worker: hash one page and extract its link spans unless the hash equals known_hash."""
+    p, rel, known_hash = task
+    st = p.stat()
+    data = p.read_bytes()
+    h = digest(data)
+    if h == known_hash:
+        return st, h, None
+    return st, h, page_links(rel, data)
+
+
+class Backlinks:
+    """Files and folders of docs/ plus every page's outgoing link spans."""
+
+    def __init__(self, docs, cache, jobs=1):
+        self.docs = Path(docs)
+        self.cache = cache
+        self.files = set()
+        self.dirs = set()
+        self.forward = {}
+        tasks = []
+        for dirpath, dirnames, filenames in os.walk(self.docs):
+            dirnames.sort()
+            rel_dir = os.path.relpath(dirpath, self.docs).replace(os.sep, '/')
+            self.dirs.add(rel_dir)
+            for fn in sorted(filenames):
+                rel = posixpath.normpath(posixpath.join(rel_dir, fn))
+                self.files.add(rel)
+                if not fn.endswith('.md'):
+                    continue
+                p = Path(dirpath) / fn
+                hit, links = cache.fresh(rel, p.stat())
+                if hit:
+                    self.forward[rel] = links
+                else:
+                    tasks.append((p, rel, cache.cached_hash(rel)))
+        for (p, rel, _), (st, h, links) in zip(tasks, map_files(index_task, tasks, jobs)):
+            if links is None:
+                links = cache.match(rel, st, h)[1]
+            else:
+                cache.put(rel, st, h, links)
+            self.forward[rel] = links
+        self.reverse = {}
+        for src, links in self.forward.items():
+            for t in links:
+                self.reverse.setdefault(self.target(t), set()).add(src)
+
+    def target(self, raw):
+        """Map a stored link target to the file it resolves to (a folder means its index.md)."""
+        if raw in self.dirs:
+            return posixpath.normpath(posixpath.join(raw, 'index.md'))
+        return raw
+
+    def refresh(self, rels):
+        """Re-index the given pages after they were written or moved."""
+        for rel in rels:
+            p = self.docs / rel
+            data = p.read_bytes()
+            self.cache.put(rel, p.stat(), digest(data), page_links(rel, data))
+
+
+def rewrite_url(url, old_src, new_src, old_target, new_target, dirs):
+    """Return url as it must read in new_src to reach new_target (url itself if it still works)."""
+    path, suffix = URL_SPLIT_RE.match(url).groups()
+    raw, _ = RAW.resolve(new_src, url)
+    if raw is not None and (raw == new_target or posixpath.join(raw, 'index.md') == new_target):
+        return url
+    folder_style = RAW.resolve(old_src, url)[0] in dirs
+    dest = new_target
+    if folder_style and posixpath.basename(new_target) == 'index.md':
+        dest = posixpath.dirname(new_target) or '.'
+    if path.startswith('/'):
+        new = '/' + ('' if dest == '.' else dest)
+    else:
+        new = posixpath.relpath(dest, posixpath.dirname(new_src) or '.')
+    if folder_style and path.endswith('/') and not new.endswith('/'):
+        new += '/'
+    if '%' in path or re.search(r'[\s()<>]', new):
+        new = quote(new, safe='/')
+    return new + suffix
+
+
+class MovePlan:
+    """The file moves plus the new contents of every page whose links change."""
+
+    def __init__(self, index, moves):
+        self.index = index
+        self.moves = {}
+        self.dir_moves = []
+        self.writes = {}
+        self.originals = {}
+        self.links = 0
+        for src, dst in moves:
+            if src in index.files:
+                self.moves[src] = dst
+            elif src in index.dirs and src != '.':
+                if dst in index.dirs or dst in index.files or dst.startswith(src + '/'):
+                    raise ValueError(f'cannot move folder {src} to {dst}')
+                self.dir_moves.append((src, dst))
+                prefix = src + '/'
+                for f in sorted(index.files):
+                    if f.startswith(prefix):
+                        self.moves[f] = dst + f[len(src):]
+            else:
+                raise ValueError(f'not found in docs/: {src}')
+        taken = set(index.files) - set(self.moves)
+        for src, dst in self.moves.items():
+            if dst in taken or dst in index.dirs:
+                raise ValueError(f'target exists: {dst}')
+            taken.add(dst)
+        self._plan_rewrites()
+
+    def new_path(self, rel):
+        if rel in self.moves:
+            return self.moves[rel]
+        for src, dst in self.dir_moves:
+            if rel.startswith(src + '/'):
+                return dst + rel[len(src):]
+        return rel
+
+    def _plan_rewrites(self):
+        index = self.index
+        sources = {src for src in self.moves if src.endswith('.md')}
+        for old in self.moves:
+            sources |= index.reverse.get(old, set())
+        for src, dst in self.dir_moves:
+            # links into a moved folder that resolve to nothing still follow it
+            for t, refs in index.reverse.items():
+                if t.startswith(src + '/'):
+                    sources |= refs
+        for src in sorted(sources):
+            new_src = self.new_path(src)
+            p = index.docs / src
+            data = p.read_bytes()
+            edits = []
+            for raw, spans in index.forward.get(src, {}).items():
+                old_t = index.target(raw)
+                new_t = self.new_path(old_t)
+                if new_t == old_t and new_src == src:
+                    continue
+                for s, e in spans:
+                    url = data[s:e].decode('utf-8')
+                    new_url = rewrite_url(url, src, new_src, old_t, new_t, index.dirs)
+                    if new_url != url:
+                        edits.append((s, e, new_url.encode('utf-8')))
+            if not edits:
+                continue
+            out = []
+            last = 0
+            for s, e, b in sorted(edits):
+                out.append(data[last:s])
+                out.append(b)
+                last = e
+            out.append(data[last:])
+            self.writes[src] = b''.join(out)
+            self.originals[src] = data
+            self.links += len(edits)
+
+    def apply(self):
+        """Stage every new file, then move and rewrite them; undo everything on failure."""
+        docs = self.index.docs
+        staged = {}
+        made_dirs = []
+        done = []
+        try:
+            for dst in self.moves.values():
+                parent = (docs / dst).parent
+                missing = []
+                while not parent.exists():
+                    missing.append(parent)
+                    parent = parent.parent
+                for d in reversed(missing):
+                    d.mkdir()
+                    made_dirs.append(d)
+            for src, data in self.writes.items():
+                final = docs / self.new_path(src)
+                fd, tmp = tempfile.mkstemp(dir=final.parent, prefix='.' + final.name + '.', suffix='.tmp')
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+                os.chmod(tmp, (docs / src).stat().st_mode & 0o7777)
+                staged[src] = tmp
+            for src, dst in self.moves.items():
+                os.rename(docs / src, docs / dst)
+                done.append(('move', src, dst))
+            for src, tmp in list(staged.items()):
+                os.replace(tmp, docs / self.new_path(src))
+                del staged[src]
+                done.append(('write', src, None))
+        except BaseException:
+            for op, src, dst in reversed(done):
+                if op == 'write':
+                    (docs / self.new_path(src)).write_bytes(self.originals[src])
+                else:
+                    os.rename(docs / dst, docs / src)
+            for tmp in staged.values():
+                os.unlink(tmp)
+            for d in reversed(made_dirs):
+                d.rmdir()
+            raise
+        # drop the folders a directory move emptied
+        for src, _ in self.dir_moves:
+            for dirpath, dirnames, filenames in os.walk(docs / src, topdown=False):
+                if not os.listdir(dirpath):
+                    os.rmdir(dirpath)
+
+
+def docs_rel(path):
+    path = path.replace(os.sep, '/').strip('/')
+    if path == 'docs' or path.startswith('docs/'):
+        path = path[5:]
+    return posixpath.normpath(path or '.')
+
+
+def main():
+    ap = argparse.ArgumentParser(description='Move or rename pages in docs/ and fix the links to them')
+    ap.add_argument('paths', nargs='+', metavar='SRC DST', help='pairs of source and destination paths')
+    ap.add_argument('--dry-run', action='store_true', help='show what would change without touching any file')
+    ap.add_argument('--cold', action='store_true', help='rebuild the backlink index from scratch')
+    ap.add_argument('--jobs', type=int, default=1, help='worker processes for indexing (0 = one per core)')
+    args = ap.parse_args()
+    if len(args.paths) % 2:
+        ap.error('paths must come in SRC DST pairs')
+
+    repo = Path('.').resolve()
+    docs = repo / 'docs'
+    if not docs.is_dir():
+        print('docs/ directory not found')
+        raise SystemExit(2)
+    cache = ResultCache(repo / CACHE_PATH, index_version(), cold=args.cold)
+    index = Backlinks(docs, cache, args.jobs)
+    pairs = [(docs_rel(a), docs_rel(b)) for a, b in zip(args.paths[::2], args.paths[1::2])]
+    try:
+        plan = MovePlan(index, pairs)
+    except ValueError as e:
+        cache.save()
+        print(f'Error: {e}')
+        raise SystemExit(1)
+
+    for src, dst in plan.moves.items():
+        print(f'{"Would move" if args.dry_run else "Moved"} docs/{src} -> docs/{dst}')
+    print(f'{"Would update" if args.dry_run else "Updated"} {plan.links} links in {len(plan.writes)} files'
+          f' ({len(index.forward)} pages indexed, {cache.misses} re-read)')
+    for src in plan.writes:
+        print(f'- docs/{plan.new_path(src)}')
+    if not args.dry_run:
+        plan.apply()
+        for src in plan.moves:
+            cache.entries.pop(src, None)
+        index.refresh(sorted({plan.new_path(src) for src in plan.writes} |
+                             {dst for dst in plan.moves.values() if dst.endswith('.md')}))
+    cache.save()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Fix everything, then check: run all Markdown fixers and the strict checker
+over docs/ in one pass.
+
+Each file is read and tokenized once (see md_scan.py), then goes through:
+- convert_backslash_return: "\\\\" return markers -> newlines
+- fix_bold_spaces: whitespace-only emphasis spans, `**   **` -> `****`
+- fix_md_strict: MD047 / MD041 / MD022 / MD058 fixes
+- check_md_strict: remaining findings
+
+A stage only re-tokenizes when the previous stage changed the text, and a
+file is written at most once (atomically), after all fixers ran.
+--profile REPORT times every stage and check rule per file (see md_profile.py).
+
+Files of --stream-above MB or more are never loaded: the stages are
+chained as line generators (see md_scan.py) and the checker and a compare
+with the file run on the result in one pass; only a changed file is read
+a second time, to write it through a temp file.
+
+Usage: python3 scripts/md_pipeline.py [--dry-run] [--jobs N] [--profile REPORT] [--stream-above MB]
+"""
+import argparse
+from functools import partial
+from pathlib import Path
+
+import check_md_strict
+import convert_backslash_return
+import fix_bold_spaces
+import fix_md_strict
+import md_profile
+from md_profile import FileTimer
+import md_scan
+from md_scan import Doc, LineDiff, docs_files, iter_kinds, map_files, read_lines, streamed, write_atomic, write_lines
+
+
+def process(doc, rel, timer=None):
+    """Run every fixer and the checker on one Doc. Returns (fixed_text, errors).
+
+    With a md_profile.FileTimer, each fixer (including the re-tokenize after
+    it) and each check rule is timed separately.
+    """
+    text, _ = convert_backslash_return.convert_doc(doc)
+    doc = doc.with_text(text)
+    if timer:
+        timer.lap('convert_backslash_return')
+    text, _ = fix_bold_spaces.fix_doc(doc)
+    doc = doc.with_text(text)
+    if timer:
+        timer.lap('fix_bold_spaces')
+    doc = doc.with_text(fix_md_strict.fix_doc(doc))
+    if timer:
+        timer.lap('fix_md_strict')
+    return doc.text, check_md_strict.check_doc(rel, doc, timer)
+
+
+def stream_stages(p, convert=True):
+    """The fixed lines of file p, produced lazily by chaining every fixer's line generator."""
+    pairs = iter_kinds(read_lines(p))
+    if convert:
+        pairs = iter_kinds(convert_backslash_return.convert_lines(pairs))
+    pairs = iter_kinds(fix_bold_spaces.fix_lines(pairs))
+    return fix_md_strict.fix_lines(pairs)
+
+
+def process_stream(p, rel, dry_run=False):
+    """process_file() for a file too large to load. Returns (changed, errors)."""
+    # convert_backslash_return leaves a file without markers exactly as it is
+    convert = convert_backslash_return.has_markers(iter_kinds(read_lines(p)))
+    final = LineDiff(stream_stages(p, convert), p)
+    errors = check_md_strict.check_stream(rel, iter_kinds(final))
+    if final.changed and not dry_run:
+        write_lines(p, stream_stages(p, convert))
+    return final.changed, errors
+
+
+def process_file(task, dry_run=False, profile=False, stream_above=md_scan.STREAM_MB):
+    """Fix and check one (path, rel) task. Returns (changed, errors, phase times or None)."""
+    p, rel = task
+    timer = FileTimer() if profile else None
+    if streamed(p, stream_above):
+        changed, errors = process_stream(p, rel, dry_run)
+        if timer:
+            timer.lap('stream')
+        return changed, errors, timer and timer.times
+    text = p.read_text(encoding='utf-8')
+    if timer:
+        timer.lap('read')
+    doc = Doc(text, p)
+    if timer:
+        timer.lap('tokenize')
+    final, errors = process(doc, rel, timer)
+    changed = final != doc.text
+    if changed and not dry_run:
+        write_atomic(p, final)
+        if timer:
+            timer.lap('write')
+    return changed, errors, timer and timer.times
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    ap.add_argument('--dry-run', action='store_true', help='report files that would change without writing them')
+    ap.add_argument('--jobs', type=int, default=1, help='worker processes (0 = one per core)')
+    md_profile.add_arguments(ap)
+    md_scan.add_stream_argument(ap)
+    args = ap.parse_args()
+
+    profile = md_profile.from_args(args)
+    repo = Path('.').resolve()
+    tasks = [(p, str(p.relative_to(repo))) for p in docs_files(repo / 'docs')]
+    changed_files = []
+    errors = []
+    work = partial(process_file, dry_run=args.dry_run, profile=profile is not None, stream_above=args.stream_above)
+    for (p, rel), (changed, errs, times) in zip(tasks, map_files(work, tasks, args.jobs)):
+        if changed:
+            changed_files.append(rel)
+        errors.extend(errs)
+        if profile is not None:
+            profile.add(rel, times)
+
+    print(('Would fix' if args.dry_run else 'Fixed') + ' files:', len(changed_files))
+    for f in changed_files[:200]:
+        print(f)
+    code = check_md_strict.report(errors)
+    if profile is not None:
+        profile.finish()
+    raise SystemExit(code)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Opt-in per-file / per-phase profiling for the docs maintenance scripts.
+
+check_md_strict.py, fix_md_strict.py, fix_bold_spaces.py,
+convert_backslash_return.py and md_pipeline.py take:
+  --profile REPORT   time every file's phases (read, tokenize, each check
+                     rule such as MD022 / MD058, each fixer, write) and write
+                     them to REPORT: CSV if it ends in .csv, JSON otherwise
+  --profile-top N    how many of the slowest files and phases to list (10)
+  --cprofile PATH    also dump cProfile stats of the main process
+                     (view with `python3 -m pstats PATH`)
+
+A script creates a FileTimer per file only when profiling, and every lap
+is guarded with `if timer:`, so the mode costs one None test per phase when
+it is off. Timings travel back from --jobs workers as plain dicts; cProfile
+only sees the main process. The top-N summary goes to stderr so the
+scripts' normal output is unchanged.
+"""
+import cProfile
+import csv
+import json
+import sys
+from pathlib import Path
+from time import perf_counter
+
+
+class FileTimer:
+    """Accumulates the time spent in named phases of one file."""
+
+    __slots__ = ('times', '_t')
+
+    def __init__(self):
+        self.times = {}
+        self._t = perf_counter()
+
+    def lap(self, phase):
+        """Charge the time since the previous lap (or creation) to phase."""
+        now = perf_counter()
+        self.times[phase] = self.times.get(phase, 0.0) + now - self._t
+        self._t = now
+
+
+class Profile:
+    """Per-file timings of one run, plus an optional cProfile session."""
+
+    def __init__(self, path=None, top=10, cprofile=None):
+        self.path = path
+        self.top = top
+        self.files = {}
+        self.cprofile_path = cprofile
+        self.cprofile = None
+        self.t0 = perf_counter()
+        if cprofile:
+            self.cprofile = cProfile.Profile()
+            self.cprofile.enable()
+
+    def add(self, rel, times):
+        """Record the phase times of one file (a FileTimer or its .times dict)."""
+        if isinstance(times, FileTimer):
+            times = times.times
+        if times:
+            self.files[str(rel)] = times
+
+    def summary(self):
+        """Return the report as a dict: per-file phases, phase totals and the top-N lists."""
+        phases = {}
+        for times in self.files.values():
+            for phase, s in times.items():
+                total, count = phases.get(phase, (0.0, 0))
+                phases[phase] = (total + s, count + 1)
+        files = sorted(((rel, sum(t.values()), t) for rel, t in self.files.items()), key=lambda f: -f[1])
+        return {
+            'wall': perf_counter() - self.t0,
+            'files': [{'file': rel, 'total': total, 'phases': t} for rel, total, t in files],
+            'phases': {p: {'total': total, 'files': count} for p, (total, count) in
+                       sorted(phases.items(), key=lambda kv: -kv[1][0])},
+            'top_files': [rel for rel, _, _ in files[:self.top]],
+            'top_phases': [p for p, _ in sorted(phases.items(), key=lambda kv: -kv[1][0])[:self.top]],
+        }
+
+    def finish(self):
+        """Stop cProfile, write the report and print the top-N summary to stderr."""
+        if self.cprofile is not None:
+            self.cprofile.disable()
+            self.cprofile.dump_stats(self.cprofile_path)
+        report = self.summary()
+        if self.path:
+            write_report(self.path, report)
+        err = sys.stderr
+        print(f'\nProfile: {len(report["files"])} files timed, {report["wall"]:.3f}s wall', file=err)
+        print('Slowest phases:', file=err)
+        for p in report['top_phases']:
+            ph = report['phases'][p]
+            print(f'  {ph["total"] * 1000:10.1f} ms  {p} ({ph["files"]} files)', file=err)
+        print('Slowest files:', file=err)
+        for f in report['files'][:self.top]:
+            worst = max(f['phases'].items(), key=lambda kv: kv[1])
+            print(f'  {f["total"] * 1000:10.1f} ms  {f["file"]} (most in {worst[0]})', file=err)
+        if self.path:
+            print(f'Report written to {self.path}', file=err)
+        if self.cprofile_path:
+            print(f'cProfile stats written to {self.cprofile_path}', file=err)
+
+
+def write_report(path, report):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix.lower() == '.csv':
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            w = csv.writer(f)
+            w.writerow(['file', 'phase', 'seconds'])
+            for entry in report['files']:
+                for phase, s in entry['phases'].items():
+                    w.writerow([entry['file'], phase, f'{s:.6f}'])
+    else:
+        path.write_text(json.dumps(report, indent=1), encoding='utf-8')
+
+
+def add_arguments(ap):
+    ap.add_argument('--profile', metavar='REPORT',
+                    help='time read/tokenize/rule/write phases per file and write a JSON (or .csv) report')
+    ap.add_argument('--profile-top', type=int, default=10, metavar='N', help='slowest files and phases to list')
+    ap.add_argument('--cprofile', metavar='PATH', help='also dump cProfile stats of the main process to PATH')
+
+
+def from_args(args):
+    """Return a Profile when --profile or --cprofile was given, else None."""
+    if not args.profile and not args.cprofile:
+        return None
+    return Profile(args.profile, args.profile_top, args.cprofile)
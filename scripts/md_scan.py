@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Shared single-pass Markdown scanner for the docs maintenance scripts.
+
+A file is read once, its line endings are normalized, and every line is
+classified in a single pass into one of:
+- fence:   a ``` / ~~~ fence marker line
+- code:    a line inside a fenced code block
+- heading: an ATX heading (# .. ######)
+- table:   a line containing '|'
+- list:    an indented unordered list item
+- blank:   an empty or whitespace-only line
+- text:    anything else
+
+Inline code is handled with split_inline(): even parts are outside
+backticks, odd parts are inside.
+
+check_md_strict.py, fix_md_strict.py, fix_bold_spaces.py and
+convert_backslash_return.py all work off a Doc, so md_pipeline.py can run
+every fixer and the checker with one read and at most one write per file.
+Fixers write through write_atomic() and can shard files across processes
+with map_files().
+
+Files of --stream-above MB or more (generated inventory pages can be
+hundreds of megabytes) are never loaded whole: read_lines() yields the
+same lines a Doc would hold, iter_kinds() classifies them as they come,
+with_next() gives the one line of lookahead the rules need, and fixers
+write through an AtomicWriter. stream_rewrite() runs a fixer that way:
+a first pass compares its output with the file, and only a changed file
+is read again and written. Memory stays at a few lines, plus whatever a
+fixer has to hold back (fix_md_strict: a run of blank lines).
+"""
+import os
+import re
+import tempfile
+from collections import deque
+from pathlib import Path
+
+FENCE = 'fence'
+CODE = 'code'
+HEADING = 'heading'
+TABLE = 'table'
+LIST = 'list'
+BLANK = 'blank'
+TEXT = 'text'
+
+heading_re = re.compile(r'^(#{1,6})\s+')
+list_re = re.compile(r'^(\s+)[\*-]\s+')
+
+# paths skipped by the repo-wide walks (fix_bold_spaces / convert_backslash_return)
+SKIP_PARTS = ('.git/', 'site/', 'scripts/.venv')
+
+# files of at least this many MB are streamed instead of loaded (--stream-above)
+STREAM_MB = 32
+
+
+def is_fence(line):
+    s = line.lstrip()
+    return s.startswith('```') or s.startswith('~~~')
+
+
+def classify(lines):
+    """Return the kind of every line, tracking fenced code blocks."""
+    kinds = []
+    append = kinds.append
+    in_code = False
+    for line in lines:
+        if is_fence(line):
+            in_code = not in_code
+            append(FENCE)
+        elif in_code:
+            append(CODE)
+        elif heading_re.match(line):
+            append(HEADING)
+        elif '|' in line:
+            append(TABLE)
+        elif list_re.match(line):
+            append(LIST)
+        elif line.strip() == '':
+            append(BLANK)
+        else:
+            append(TEXT)
+    return kinds
+
+
+def iter_kinds(lines):
+    """Yield (line, kind) for every line of an iterable; the streaming form of classify()."""
+    in_code = False
+    for line in lines:
+        if is_fence(line):
+            in_code = not in_code
+            yield line, FENCE
+        elif in_code:
+            yield line, CODE
+        elif heading_re.match(line):
+            yield line, HEADING
+        elif '|' in line:
+            yield line, TABLE
+        elif list_re.match(line):
+            yield line, LIST
+        elif line.strip() == '':
+            yield line, BLANK
+        else:
+            yield line, TEXT
+
+
+def with_next(items, last):
+    """Yield (item, next item) pairs; the final item is paired with last."""
+    it = iter(items)
+    for prev in it:
+        break
+    else:
+        return
+    for item in it:
+        yield prev, item
+        prev = item
+    yield prev, last
+
+
+def split_inline(line):
+    """Split a line on backticks; even indexes are outside inline code."""
+    return line.split('`')
+
+
+def normalize(text):
+    return text.replace('\r\n', '\n').replace('\r', '\n')
+
+
+class Doc:
+    """A tokenized Markdown file: normalized text, lines and line kinds."""
+
+    __slots__ = ('path', 'text', 'lines', 'kinds')
+
+    def __init__(self, text, path=None):
+        self.path = path
+        self.text = normalize(text)
+        self.lines = self.text.split('\n')
+        self.kinds = classify(self.lines)
+
+    def regions(self):
+        """Group consecutive lines of the same kind into (kind, start, end) spans."""
+        out = []
+        start = 0
+        kinds = self.kinds
+        for i in range(1, len(kinds) + 1):
+            if i == len(kinds) or kinds[i] != kinds[start]:
+                out.append((kinds[start], start, i))
+                start = i
+        return out
+
+    def with_text(self, text):
+        """Return self if text is unchanged, otherwise a re-tokenized Doc."""
+        if text == self.text:
+            return self
+        return Doc(text, self.path)
+
+
+def load(path):
+    return Doc(Path(path).read_text(encoding='utf-8'), Path(path))
+
+
+def read_lines(path):
+    """Yield the lines Doc(path's text).lines would hold, reading the file incrementally."""
+    # universal newlines mode normalizes line endings as normalize() does
+    with open(path, encoding='utf-8') as f:
+        line = ''
+        for line in f:
+            yield line[:-1] if line.endswith('\n') else line
+        if line == '' or line.endswith('\n'):
+            yield ''
+
+
+def split_chunks(chunks):
+    """Yield the lines of ''.join(chunks).split('\\n') without joining the chunks."""
+    tail = ''
+    for chunk in chunks:
+        if '\n' not in chunk:
+            tail += chunk
+            continue
+        parts = chunk.split('\n')
+        parts[0] = tail + parts[0]
+        tail = parts.pop()
+        yield from parts
+    yield tail
+
+
+def add_stream_argument(ap):
+    ap.add_argument('--stream-above', type=float, default=STREAM_MB, metavar='MB',
+                    help=f'stream files of at least MB megabytes line by line instead of loading them '
+                         f'(default {STREAM_MB}, 0 = every file)')
+
+
+def streamed(path, stream_above):
+    """True if path is at least stream_above MB, i.e. should not be loaded into a Doc."""
+    return os.path.getsize(path) >= stream_above * 1e6
+
+
+def docs_files(docs):
+    return sorted(Path(docs).rglob('*.md'))
+
+
+def repo_md_files(root):
+    return [p for p in Path(root).glob('**/*.md') if not any(s in str(p) for s in SKIP_PARTS)]
+
+
+class AtomicWriter:
+    """A text file written incrementally to a temp file in the same directory.
+
+    Leaving the with-block renames it into place (keeping the old file's
+    mode); an exception or discard() removes it and leaves path untouched.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        fd, self.tmp = tempfile.mkstemp(dir=self.path.parent, prefix='.' + self.path.name + '.', suffix='.tmp')
+        self.file = os.fdopen(fd, 'w', encoding='utf-8')
+        self.write = self.file.write
+        self.keep = True
+
+    def discard(self):
+        self.keep = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            self.file.close()
+            if exc_type is None and self.keep:
+                try:
+                    os.chmod(self.tmp, self.path.stat().st_mode & 0o7777)
+                except FileNotFoundError:
+                    pass
+                os.replace(self.tmp, self.path)
+                return False
+        except BaseException:
+            self._remove()
+            raise
+        self._remove()
+        return False
+
+    def _remove(self):
+        try:
+            os.unlink(self.tmp)
+        except FileNotFoundError:
+            pass
+
+
+def write_atomic(path, text):
+    """Write text via a temp file in the same directory and rename it into place."""
+    with AtomicWriter(path) as f:
+        f.write(text)
+
+
+def write_lines(path, lines):
+    """write_atomic(path, '\\n'.join(lines)) without building the text."""
+    with AtomicWriter(path) as f:
+        write = f.write
+        sep = ''
+        for line in lines:
+            write(sep)
+            write(line)
+            sep = '\n'
+
+
+class LineDiff:
+    """Iterates over a stream of output lines, noting in .changed whether they differ from path's lines."""
+
+    def __init__(self, lines, path):
+        self.lines = lines
+        self.path = path
+        self.changed = False
+
+    def __iter__(self):
+        orig = read_lines(self.path)
+        try:
+            for line in self.lines:
+                if not self.changed and next(orig, None) != line:
+                    self.changed = True
+                yield line
+            if not self.changed and next(orig, None) is not None:
+                self.changed = True
+        finally:
+            orig.close()
+
+
+def stream_rewrite(path, transform, dry_run=False):
+    """Run transform, mapping (line, kind) pairs to output lines, over a file without loading it.
+
+    The first pass only compares the output with the file; a changed file
+    is then streamed through transform again into an AtomicWriter (unless
+    dry_run). Returns whether the file changed.
+    """
+    out = LineDiff(transform(iter_kinds(read_lines(path))), path)
+    deque(out, 0)
+    if out.changed and not dry_run:
+        write_lines(path, transform(iter_kinds(read_lines(path))))
+    return out.changed
+
+
+def map_files(func, items, jobs=1, initializer=None, initargs=()):
+    """Return [func(x) for x in items], sharded across `jobs` processes (0 = all cores).
+
+    Results keep the order of items, so output stays deterministic.
+    initializer(*initargs) runs once per worker (or once in this process when
+    running serially), for state too large to send with every item.
+    """
+    items = list(items)
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    if jobs <= 1 or len(items) < 2:
+        if initializer is not None:
+            initializer(*initargs)
+        return [func(x) for x in items]
+    # imported here: it pulls in multiprocessing, which serial runs (and docs_search.py queries) never need
+    from concurrent.futures import ProcessPoolExecutor
+    chunksize = max(1, len(items) // (jobs * 8))
+    with ProcessPoolExecutor(min(jobs, len(items)), initializer=initializer, initargs=initargs) as ex:
+        return list(ex.map(func, items, chunksize=chunksize))
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Watch docs/ and re-check (and optionally re-fix) only the files that changed.
+
+Keeps every page's strict-check findings, anchors and links in memory.
+When files change it:
+- re-reads only the changed pages and re-runs check_md_strict on them
+  (with --fix, runs md_pipeline's fixers first and writes the result;
+  the initial load fixes the whole tree once)
+- updates the source-level link index (see md_link_check.py) and
+  re-validates links out of the changed pages and links pointing at them
+- prints the new findings for those files
+
+Changes are picked up through watchdog (installed with mkdocs) when it is
+available, otherwise by polling file stats; bursts of events are debounced.
+
+Usage: python3 scripts/md_watch.py [--fix] [--poll] [--interval S] [--debounce S]
+  e.g. next to `mkdocs serve`: docker compose exec mkdocs python3 scripts/md_watch.py
+"""
+import argparse
+import os
+import posixpath
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+import check_md_strict
+import md_link_check
+import md_pipeline
+from md_scan import load, write_atomic
+
+
+def affected_targets(rel):
+    """Link targets whose resolution can change when rel appears, changes or disappears."""
+    out = {rel}
+    if posixpath.basename(rel) == 'index.md':
+        out.add(posixpath.dirname(rel) or '.')
+    return out
+
+
+class Corpus:
+    """In-memory state of docs/: file stats, strict findings and the link index."""
+
+    def __init__(self, docs, fix=False):
+        self.docs = Path(docs)
+        self.prefix = str(self.docs).replace(os.sep, '/').rstrip('/') + '/'
+        self.fix = fix
+        self.stats = {}
+        self.findings = {}
+        self.index = md_link_check.DocsIndex(set(), {'.'}, {})
+        self.targets = {}
+        self.linked_from = {}
+
+    def snapshot(self):
+        snap = {}
+        for dirpath, dirnames, filenames in os.walk(self.docs):
+            rel_dir = os.path.relpath(dirpath, self.docs).replace(os.sep, '/')
+            for fn in filenames:
+                rel = posixpath.normpath(posixpath.join(rel_dir, fn))
+                snap[rel] = self._stat(rel)
+        return snap
+
+    def _stat(self, rel):
+        try:
+            st = os.stat(self.docs / rel)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def changed(self, candidates=None):
+        """Return the paths whose stats differ from the last update (all paths if candidates is None)."""
+        if candidates is None:
+            snap = self.snapshot()
+            keys = snap.keys() | self.stats.keys()
+        else:
+            snap = {rel: self._stat(rel) for rel in candidates}
+            keys = snap.keys()
+        return {rel for rel in keys if snap.get(rel) != self.stats.get(rel)}
+
+    def update(self, rels):
+        """Re-process the given docs-relative paths. Returns (findings, broken) for the affected files."""
+        pages = self.index.pages
+        touched = set()
+        changed_pages = []
+        for rel in sorted(rels):
+            st = self._stat(rel)
+            touched |= affected_targets(rel)
+            if st is None:
+                self.stats.pop(rel, None)
+                self.index.files.discard(rel)
+                self.findings.pop(rel, None)
+                self._set_targets(rel, set())
+                pages.pop(rel, None)
+                parent = posixpath.dirname(rel)
+                while parent and not (self.docs / parent).is_dir():
+                    self.index.dirs.discard(parent)
+                    touched |= {parent, parent + '/index.md'}
+                    parent = posixpath.dirname(parent)
+                continue
+            self.index.files.add(rel)
+            parent = posixpath.dirname(rel)
+            while parent and parent not in self.index.dirs:
+                self.index.dirs.add(parent)
+                touched |= {parent, parent + '/index.md'}
+                parent = posixpath.dirname(parent)
+            if rel.endswith('.md'):
+                self._read_page(rel)
+                changed_pages.append(rel)
+            self.stats[rel] = self._stat(rel)
+
+        recheck = set(changed_pages)
+        for t in touched:
+            recheck |= self.linked_from.get(t, set())
+        recheck &= pages.keys()
+        for src in recheck:
+            targets = set()
+            for _, url in pages[src][1]:
+                t, _ = self.index.resolve(src, url)
+                if t is not None:
+                    targets.add(t)
+            self._set_targets(src, targets)
+        broken = self.index.check(sorted(recheck))
+        return {rel: self.findings[rel] for rel in changed_pages}, broken
+
+    def _read_page(self, rel):
+        path = self.docs / rel
+        doc = load(path)
+        shown = self.prefix + rel
+        if self.fix:
+            final, errors = md_pipeline.process(doc, shown)
+            if final != doc.text:
+                write_atomic(path, final)
+                doc = doc.with_text(final)
+        else:
+            errors = check_md_strict.check_doc(shown, doc)
+        self.findings[rel] = errors
+        self.index.pages[rel] = md_link_check.page_info(doc)
+
+    def _set_targets(self, src, targets):
+        for t in self.targets.get(src, ()):
+            if t not in targets:
+                self.linked_from[t].discard(src)
+        for t in targets:
+            self.linked_from.setdefault(t, set()).add(src)
+        if targets:
+            self.targets[src] = targets
+        else:
+            self.targets.pop(src, None)
+
+
+def report(findings, broken, prefix):
+    for rel, errors in findings.items():
+        if not errors:
+            print(f'{prefix}{rel}: OK')
+        for e in errors:
+            print(check_md_strict.format_error(e))
+    for b in broken:
+        print(md_link_check.format_broken(b, prefix))
+
+
+def start_observer(docs, pending, lock, wake):
+    """Start a watchdog observer feeding pending; returns None when watchdog is missing.
+
+    A None entry in pending means a directory changed and a full stat sweep is needed.
+    """
+    try:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+    except ImportError:
+        return None
+
+    class Handler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            with lock:
+                if event.is_directory:
+                    pending.add(None)
+                else:
+                    for p in (event.src_path, getattr(event, 'dest_path', '')):
+                        if p:
+                            pending.add(os.path.relpath(os.fsdecode(p), docs).replace(os.sep, '/'))
+            wake.set()
+
+    observer = Observer()
+    observer.schedule(Handler(), str(docs), recursive=True)
+    observer.start()
+    return observer
+
+
+def main():
+    ap = argparse.ArgumentParser(description='Watch docs/ and re-check changed files')
+    ap.add_argument('--fix', action='store_true', help='run the md_pipeline fixers on changed files')
+    ap.add_argument('--poll', action='store_true', help='poll file stats even if watchdog is installed')
+    ap.add_argument('--interval', type=float, default=0.5, help='seconds between polls')
+    ap.add_argument('--debounce', type=float, default=0.1, help='quiet seconds before a batch is processed')
+    args = ap.parse_args()
+
+    docs = Path('docs')
+    if not docs.is_dir():
+        print('docs/ directory not found')
+        raise SystemExit(2)
+    corpus = Corpus(docs, fix=args.fix)
+    t0 = time.perf_counter()
+    findings, broken = corpus.update(corpus.changed())
+    report({rel: e for rel, e in findings.items() if e}, broken, corpus.prefix)
+    print(f'Watching {docs}/: {len(corpus.index.pages)} pages loaded in {time.perf_counter() - t0:.2f}s '
+          f'({sum(map(len, corpus.findings.values()))} strict findings, {len(broken)} broken links)')
+
+    pending = set()
+    lock = threading.Lock()
+    wake = threading.Event()
+    observer = None if args.poll else start_observer(docs, pending, lock, wake)
+    try:
+        while True:
+            if observer is None:
+                time.sleep(args.interval)
+                rels = corpus.changed()
+                if rels:
+                    # debounce: let a burst of saves settle
+                    time.sleep(args.debounce)
+                    rels |= corpus.changed()
+            else:
+                wake.wait()
+                # debounce: wait until events stop arriving
+                while wake.is_set():
+                    wake.clear()
+                    time.sleep(args.debounce)
+                with lock:
+                    batch = set(pending)
+                    pending.clear()
+                rels = corpus.changed(None if None in batch else batch)
+            if not rels:
+                continue
+            t0 = time.perf_counter()
+            findings, broken = corpus.update(rels)
+            ms = (time.perf_counter() - t0) * 1000
+            print(f'\n[{datetime.now():%H:%M:%S}] {len(rels)} changed, {len(findings)} pages re-checked in {ms:.0f} ms')
+            report(findings, broken, corpus.prefix)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if observer is not None:
+            observer.stop()
+            observer.join()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Find near-duplicate pages in docs/ and copies of the page templates that have drifted.
+
+Many pages start as a copy of a template (How To's & Tasks/901/template.md,
+600 Applications/601_appname.md, the *_template.md device pages) and then
+drift. Instead of diffing every pair of pages, each page is reduced once
+to a MinHash signature:
+- shingles: every run of --shingle consecutive words (lowercased) of the
+  page outside fenced code blocks (md_scan's line kinds; --with-code
+  keeps the code)
+- signature: one-permutation MinHash with --num-perm bins: each shingle is
+  hashed once (blake2b), its hash picks a bin and the bin keeps the
+  smallest value; empty bins borrow from the next filled bin to the right
+  (densification), so short pages get full signatures too. The share of
+  equal bins of two signatures estimates the Jaccard similarity of their
+  shingle sets.
+Signatures and shingle counts are cached by content hash in
+.cache/near_dupes.json (see result_cache.py), so a re-run only hashes
+changed pages.
+
+Pairs are found with an LSH index: the signature is cut into bands and two
+pages become candidates when a whole band matches, so the work grows with
+the number of pages and candidates, not with its square. The bands are
+chosen for --threshold (lsh_params()); every candidate pair is then
+checked against it with the signature estimate, and pages joined by
+checked pairs form a cluster. A very large bucket (a template copied
+hundreds of times) is only paired with its first page.
+
+Templates (--template GLOB, repeatable; default TEMPLATES) are compared
+with every page directly. A filled-in copy has far more text than its
+template, so copies are measured by containment, the share of the
+template's shingles still in the page (estimated from the similarity and
+both shingle counts): pages containing at least --copy-threshold of a
+template are listed as its copies, least complete (most drifted) first.
+
+tests/test_scripts.py checks the clusters against exact pairwise
+Jaccard on a generated wiki with planted copies.
+
+Usage: python3 scripts/near_dupes.py [--docs DIR] [--threshold 0.8] [--copy-threshold 0.5]
+           [--template GLOB] [--num-perm 128] [--shingle 3] [--with-code] [--cold] [--jobs N] [--json PATH]
+"""
+import argparse
+import json
+import os
+import re
+from array import array
+from fnmatch import fnmatch
+from hashlib import blake2b
+from operator import eq
+from pathlib import Path
+
+from md_scan import CODE, FENCE, Doc, docs_files, map_files
+from result_cache import ResultCache, digest, source_version
+
+ROOT = Path(__file__).resolve().parents[1]
+DOCS = ROOT / 'docs'
+CACHE_PATH = Path('.cache') / 'near_dupes.json'
+# bump when signatures change meaning
+SIGNATURE_VERSION = '1'
+NUM_PERM = 128
+SHINGLE_WORDS = 3
+TEMPLATES = ('*template*.md', '600 Applications/601_appname.md')
+# how much more a missed pair weighs than a false candidate when choosing the LSH bands
+MISS_WEIGHT = 9
+# buckets larger than this are only paired with their first page
+MAX_BUCKET_PAIRS = 64
+
+WORD_RE = re.compile(r'\w+')
+EMPTY = 1 << 32
+MASK = EMPTY - 1
+# odd constant mixed into a borrowed bin value per bin of distance
+GOLDEN = 0x9E3779B1
+
+
+def signature_version(num_perm, k, code):
+    here = Path(__file__).resolve().parent
+    return source_version(here / 'near_dupes.py', here / 'md_scan.py',
+                          tag=f'{SIGNATURE_VERSION}:{num_perm}:{k}:{int(code)}')
+
+
+def shingles(text, k=SHINGLE_WORDS, code=False):
+    """The set of k-word shingles of a page, skipping fenced code unless code is set."""
+    doc = Doc(text)
+    words = []
+    for line, kind in zip(doc.lines, doc.kinds):
+        if kind is FENCE or (kind is CODE and not code):
+            continue
+        words.extend(WORD_RE.findall(line.lower()))
+    if len(words) < k:
+        return {' '.join(words)} if words else set()
+    return {' '.join(words[i:i + k]) for i in range(len(words) - k + 1)}
+
+
+def minhash(shingle_set, num_perm=NUM_PERM):
+    """One-permutation MinHash signature (array of num_perm 32-bit values), or None for no shingles."""
+    if not shingle_set:
+        return None
+    mins = [EMPTY] * num_perm
+    for s in shingle_set:
+        h = int.from_bytes(blake2b(s.encode('utf-8'), digest_size=8).digest(), 'little')
+        b = h % num_perm
+        v = h >> 32
+        if v < mins[b]:
+            mins[b] = v
+    sig = array('I', [0]) * num_perm
+    # densify: walk right to left twice, so an empty bin near the end borrows from the start
+    nxt = None
+    dist = 0
+    for i in range(2 * num_perm - 1, -1, -1):
+        v = mins[i % num_perm]
+        if v != EMPTY:
+            nxt = v
+            dist = 0
+        else:
+            dist += 1
+        if i < num_perm:
+            sig[i] = v if v != EMPTY else (nxt + dist * GOLDEN) & MASK
+    return sig
+
+
+def similarity(a, b):
+    """Estimated Jaccard similarity of two signatures: the share of equal bins."""
+    return sum(map(eq, a, b)) / len(a)
+
+
+def lsh_params(threshold, num_perm):
+    """(bands, rows) with bands * rows <= num_perm that best separate pairs below / above threshold.
+
+    A pair of similarity s becomes a candidate with probability
+    1 - (1 - s**rows)**bands; this minimizes the false positive area below
+    threshold plus the false negative area above it, weighted by
+    MISS_WEIGHT: a false candidate costs one signature comparison, a miss
+    loses a duplicate.
+    """
+    steps = 200
+
+    def area(f, lo, hi):
+        w = (hi - lo) / steps
+        return sum(f(lo + (i + 0.5) * w) for i in range(steps)) * w
+
+    best = None
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        err = (area(lambda s: 1 - (1 - s ** rows) ** bands, 0.0, threshold)
+               + MISS_WEIGHT * area(lambda s: (1 - s ** rows) ** bands, threshold, 1.0))
+        if best is None or err < best[0]:
+            best = (err, bands, rows)
+    return best[1], best[2]
+
+
+def candidate_pairs(sigs, bands, rows):
+    """Pairs (i, j), i < j, of signatures sharing at least one whole band."""
+    pairs = set()
+    width = rows * sigs[0].itemsize if sigs else 0
+    raw = [sig.tobytes() for sig in sigs]
+    for band in range(bands):
+        buckets = {}
+        lo = band * width
+        for i, data in enumerate(raw):
+            buckets.setdefault(data[lo:lo + width], []).append(i)
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            if len(members) > MAX_BUCKET_PAIRS:
+                pairs.update((members[0], j) for j in members[1:])
+            else:
+                pairs.update((a, b) for n, a in enumerate(members) for b in members[n + 1:])
+    return pairs
+
+
+def clusters(sigs, threshold, bands, rows):
+    """Groups of signature indexes joined by candidate pairs of estimated similarity >= threshold.
+
+    Returns (clusters as sorted index lists, {(i, j): similarity} of the checked pairs kept).
+    """
+    parent = list(range(len(sigs)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    edges = {}
+    for i, j in candidate_pairs(sigs, bands, rows):
+        s = similarity(sigs[i], sigs[j])
+        if s >= threshold:
+            edges[i, j] = s
+            parent[find(i)] = find(j)
+    groups = {}
+    for i, j in edges:
+        groups.setdefault(find(i), set()).update((i, j))
+    return sorted((sorted(g) for g in groups.values()), key=lambda g: (-len(g), g)), edges
+
+
+def containment(sig, size, page_sig, page_size):
+    """Estimated share of a set's shingles (signature, count) that are also in a page's."""
+    j = similarity(sig, page_sig)
+    return min(1.0, j * (size + page_size) / ((1 + j) * size))
+
+
+def scan_task(task):
+    """Worker: hash one page and compute [shingle count, signature hex] unless the hash equals known_hash."""
+    p, known_hash, num_perm, k, code = task
+    st = p.stat()
+    data = p.read_bytes()
+    h = digest(data)
+    if h == known_hash:
+        return st, h, None
+    found = shingles(data.decode('utf-8'), k, code)
+    sig = minhash(found, num_perm)
+    return st, h, [len(found), '' if sig is None else sig.tobytes().hex()]
+
+
+def signatures(docs=DOCS, num_perm=NUM_PERM, k=SHINGLE_WORDS, code=False, cache_path=None, cold=False, jobs=1):
+    """{docs-relative path: (shingle count, signature) or None} for every page; only changed pages are read."""
+    docs = Path(docs)
+    cache = ResultCache(cache_path or docs.resolve().parent / CACHE_PATH, signature_version(num_perm, k, code),
+                        cold=cold)
+    found = {}
+    tasks = []
+    for p in docs_files(docs):
+        rel = p.relative_to(docs).as_posix()
+        hit, found[rel] = cache.fresh(rel, p.stat())
+        if not hit:
+            tasks.append((rel, p))
+    work = [(p, cache.cached_hash(rel), num_perm, k, code) for rel, p in tasks]
+    for (rel, p), (st, h, sig) in zip(tasks, map_files(scan_task, work, jobs)):
+        if sig is None:
+            sig = cache.match(rel, st, h)[1]
+        else:
+            cache.put(rel, st, h, sig)
+        found[rel] = sig
+    cache.save()
+    return {rel: (n, array('I', bytes.fromhex(sig))) if sig else None for rel, (n, sig) in found.items()}
+
+
+def template_copies(pages, sigs, sizes, templates, threshold):
+    """{template: [(containment, page)], least complete first} of the pages containing at least threshold of it."""
+    out = {}
+    for t in templates:
+        i = pages.index(t)
+        copies = [(containment(sigs[i], sizes[i], s, n), p) for p, s, n in zip(pages, sigs, sizes) if p != t]
+        out[t] = sorted(c for c in copies if c[0] >= threshold)
+    return out
+
+
+def main():
+    ap = argparse.ArgumentParser(description='Find near-duplicate pages and drifted template copies in docs/')
+    ap.add_argument('--docs', default=str(DOCS), help='docs folder (default: the repo docs/)')
+    ap.add_argument('--threshold', type=float, default=0.8, help='similarity of pages reported as near duplicates')
+    ap.add_argument('--copy-threshold', type=float, default=0.5,
+                    help="share of a template's text a page must contain to be reported as its copy")
+    ap.add_argument('--template', action='append', metavar='GLOB',
+                    help=f'docs-relative glob of template pages (repeatable; default: {", ".join(TEMPLATES)})')
+    ap.add_argument('--num-perm', type=int, default=NUM_PERM, help='MinHash bins per signature')
+    ap.add_argument('--shingle', type=int, default=SHINGLE_WORDS, help='words per shingle')
+    ap.add_argument('--with-code', action='store_true', help='include fenced code blocks in the shingles')
+    ap.add_argument('--cold', action='store_true', help='ignore the cache and re-read every page')
+    ap.add_argument('--jobs', type=int, default=1, help='worker processes (0 = one per core)')
+    ap.add_argument('--json', metavar='PATH', help='also write the clusters and copies as JSON')
+    args = ap.parse_args()
+
+    found = signatures(args.docs, args.num_perm, args.shingle, args.with_code, cold=args.cold, jobs=args.jobs)
+    pages = [p for p, s in found.items() if s is not None]
+    sizes = [found[p][0] for p in pages]
+    sigs = [found[p][1] for p in pages]
+    bands, rows = lsh_params(args.threshold, args.num_perm)
+    groups, edges = clusters(sigs, args.threshold, bands, rows)
+    globs = args.template or TEMPLATES
+    templates = [p for p in pages if any(fnmatch(p, g) or fnmatch(os.path.basename(p), g) for g in globs)]
+    copies = template_copies(pages, sigs, sizes, templates, args.copy_threshold)
+
+    print(f'{len(pages)} pages, {len(groups)} clusters of near duplicates (similarity >= {args.threshold:.2f}, '
+          f'LSH {bands} bands x {rows} rows)')
+    report = {'clusters': [], 'templates': {}}
+    for g in groups:
+        # similarities are shown against the cluster's template, or its best connected page
+        degree = {i: 0 for i in g}
+        for i, j in edges:
+            if i in degree:
+                degree[i] += 1
+                degree[j] += 1
+        center = next((i for i in g if pages[i] in copies), max(g, key=lambda i: (degree[i], -i)))
+        members = sorted(((similarity(sigs[center], sigs[i]), pages[i]) for i in g if i != center), reverse=True)
+        print(f'\n{len(g)} pages like {pages[center]}')
+        for s, p in members:
+            print(f'  {s:.2f}  {p}')
+        report['clusters'].append({'center': pages[center], 'pages': [{'page': p, 'similarity': s} for s, p in members]})
+    for t, cs in copies.items():
+        print(f'\n{t}: copied by {len(cs)} pages (containing >= {args.copy_threshold:.0%} of it), most drifted first')
+        for c, p in cs:
+            print(f'  {c:4.0%}  {p}')
+        report['templates'][t] = [{'page': p, 'containment': c} for c, p in cs]
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=1)
+
+
+if __name__ == '__main__':
+    main()
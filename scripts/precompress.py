@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Precompress the text assets of the built site/ and write an asset manifest.
+
+For every HTML, CSS, JS, JSON, XML, SVG, TXT and source-map file under
+site/ a compressed copy is written next to it, for servers that serve
+precompressed files (nginx gzip_static / brotli_static, Caddy
+precompressed, ...):
+- foo.html.gz always (gzip -9, no timestamp, so output is reproducible)
+- foo.html.br when the brotli module is installed
+- foo.html.zst when the zstandard module is installed (or Python 3.14's
+  compression.zstd)
+A copy that would not be smaller than the original is not written.
+Compressed copies left over from a removed page are deleted. Only copies
+this script wrote (as listed in the previous asset-manifest.json) are ever
+replaced or deleted: a .gz / .br / .zst the build put there itself, like
+MkDocs' sitemap.xml.gz, is left alone and listed as a file of the site.
+
+site/asset-manifest.json lists every file of the site with its content
+hash (usable as an ETag or cache-busting version), its size and the sizes
+of its compressed copies.
+
+Files are hashed and compressed in parallel with --jobs N (0 = one per
+core). Results are kept in .cache/precompress.json with each file's
+content hash, so a re-run only compresses files whose content changed
+(or whose compressed copy is missing); unchanged files are not even read
+when their size and mtime are unchanged. A plain `mkdocs build` empties
+site/ first, which removes every copy, so this only saves work after a
+`mkdocs build --dirty` or when the script runs again on the same build.
+
+Usage: run after `mkdocs build`, like link_check.py.
+  python3 scripts/precompress.py [--site site] [--jobs N] [--codecs gz,br,zst] [--cold]
+"""
+import argparse
+import gzip
+import json
+import os
+import posixpath
+import sys
+import tempfile
+
+from md_scan import map_files
+from result_cache import ResultCache, digest, source_version, write_json_atomic
+
+CACHE_PATH = os.path.join('.cache', 'precompress.json')
+MANIFEST_NAME = 'asset-manifest.json'
+TEXT_EXTENSIONS = ('.html', '.htm', '.css', '.js', '.mjs', '.json', '.xml', '.svg', '.txt', '.map',
+                   '.webmanifest')
+# below this size the compressed copy saves less than a packet
+MIN_SIZE = 256
+
+
+def gzip_compress(data):
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def available_codecs():
+    """{extension: compress function} for gzip and whichever optional codecs are installed."""
+    codecs = {'gz': gzip_compress}
+    try:
+        import brotli
+    except ImportError:
+        pass
+    else:
+        codecs['br'] = lambda data: brotli.compress(data, quality=11)
+    try:
+        from compression import zstd
+    except ImportError:
+        try:
+            import zstandard
+        except ImportError:
+            pass
+        else:
+            codecs['zst'] = lambda data: zstandard.ZstdCompressor(level=19).compress(data)
+    else:
+        codecs['zst'] = lambda data: zstd.compress(data, level=19)
+    return codecs
+
+
+CODECS = available_codecs()
+
+
+def write_bytes_atomic(path, data):
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.' + os.path.basename(path) + '.',
+                               suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def is_text(rel):
+    return rel.lower().endswith(TEXT_EXTENSIONS)
+
+
+def written_copies(root):
+    """Relative paths of the compressed copies the last run wrote, from its asset manifest."""
+    try:
+        with open(os.path.join(root, MANIFEST_NAME), encoding='utf-8') as f:
+            files = json.load(f).get('files', {})
+    except (OSError, ValueError, AttributeError):
+        return set()
+    return {f'{rel}.{ext}' for rel, e in files.items() for ext in e if ext not in ('hash', 'size')}
+
+
+def outputs_present(path, value, codecs):
+    """True if every compressed copy recorded in value exists next to path."""
+    return all(value.get(ext) is None or os.path.exists(f'{path}.{ext}') for ext in codecs)
+
+
+def compress_task(task):
+    """Worker: hash one file and, if it is a text asset whose content or copies changed, compress it.
+
+    Copies in foreign (extensions whose file the script did not write) are neither written nor removed.
+    Returns (stat, hash, {'size': n, ext: compressed size or None, ...} or None when nothing changed).
+    """
+    path, rel, known_hash, known_value, codecs, foreign = task
+    st = os.stat(path)
+    with open(path, 'rb') as f:
+        data = f.read()
+    h = digest(data)
+    if h == known_hash and (not is_text(rel) or outputs_present(path, known_value, codecs)):
+        return st, h, None
+    value = {'size': len(data)}
+    if is_text(rel):
+        for ext in codecs:
+            if ext in foreign:
+                value[ext] = None
+                continue
+            out = f'{path}.{ext}'
+            packed = CODECS[ext](data) if len(data) >= MIN_SIZE else None
+            if packed is not None and len(packed) < len(data):
+                write_bytes_atomic(out, packed)
+                value[ext] = len(packed)
+            else:
+                value[ext] = None
+                if os.path.exists(out):
+                    os.remove(out)
+    return st, h, value
+
+
+def walk_site(root, codecs, written):
+    """Return ([(path, rel)] of the site's own files, [stale compressed copies], set of all rels).
+
+    written: rels of the compressed copies this script wrote; any other file is the site's own.
+    """
+    files = []
+    copies = []
+    rels = set()
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        rel_dir = os.path.relpath(dirpath, root).replace(os.sep, '/')
+        names = set(filenames)
+        for fn in sorted(filenames):
+            rel = posixpath.normpath(posixpath.join(rel_dir, fn))
+            rels.add(rel)
+            base, ext = posixpath.splitext(fn)
+            if rel in written and is_text(base):
+                # our compressed copy; stale once its source is gone
+                if base not in names:
+                    copies.append(os.path.join(dirpath, fn))
+                continue
+            if rel == MANIFEST_NAME or fn.startswith('.'):
+                continue
+            files.append((os.path.join(dirpath, fn), rel))
+    return files, copies, rels
+
+
+def precompress(root, codecs, jobs=1, cache=None):
+    """Compress changed text assets under root and write the manifest. Returns (manifest, stats)."""
+    written = written_copies(root)
+    files, stale, rels = walk_site(root, codecs, written)
+    for path in stale:
+        os.remove(path)
+    values = {}
+    tasks = []
+    for path, rel in files:
+        if cache is not None:
+            hit, value = cache.fresh(rel, os.stat(path))
+            if hit and (not is_text(rel) or outputs_present(path, value, codecs)):
+                values[rel] = value
+                continue
+        known_hash = cache.cached_hash(rel) if cache is not None else None
+        known_value = cache.old[rel]['value'] if known_hash is not None else None
+        foreign = [ext for ext in codecs if f'{rel}.{ext}' in rels and f'{rel}.{ext}' not in written]
+        tasks.append((path, rel, known_hash, known_value, codecs, foreign))
+    compressed = 0
+    for (path, rel, _, known_value, _, _), (st, h, value) in zip(tasks, map_files(compress_task, tasks, jobs)):
+        if value is None:
+            values[rel] = cache.match(rel, st, h)[1]
+            continue
+        values[rel] = value
+        if is_text(rel):
+            compressed += 1
+        if cache is not None:
+            cache.put(rel, st, h, value)
+    hashes = {rel: (cache.entries[rel]['hash'] if cache is not None else None) for rel in values}
+    manifest = {}
+    for path, rel in files:
+        value = values[rel]
+        h = hashes[rel]
+        if h is None:
+            with open(path, 'rb') as f:
+                h = digest(f.read())
+        entry = {'hash': h, 'size': value['size']}
+        entry.update((ext, value[ext]) for ext in codecs if value.get(ext) is not None)
+        manifest[rel] = entry
+    write_json_atomic(os.path.join(root, MANIFEST_NAME), {'version': 1, 'files': manifest})
+    if cache is not None:
+        cache.save()
+    return manifest, {'compressed': compressed, 'removed': len(stale)}
+
+
+def main():
+    ap = argparse.ArgumentParser(description='Precompress site/ text assets and write an asset manifest')
+    ap.add_argument('--site', default='site', help='built site directory (default: site)')
+    ap.add_argument('--jobs', type=int, default=1, help='worker processes for hashing and compressing (0 = one per core)')
+    ap.add_argument('--codecs', default=','.join(CODECS),
+                    help=f'comma-separated compressed copies to write (available: {",".join(CODECS)})')
+    ap.add_argument('--cold', action='store_true', help='ignore the cache and compress everything again')
+    args = ap.parse_args()
+
+    root = os.path.abspath(args.site)
+    if not os.path.isdir(root):
+        print(f'{args.site}/ directory not found; run `mkdocs build` first', file=sys.stderr)
+        sys.exit(2)
+    codecs = [c for c in args.codecs.split(',') if c]
+    missing = [c for c in codecs if c not in CODECS]
+    if missing:
+        print(f'codec not available: {", ".join(missing)} (available: {", ".join(CODECS)})', file=sys.stderr)
+        sys.exit(2)
+    version = source_version(os.path.abspath(__file__), tag=root + ':' + ','.join(codecs))
+    cache = ResultCache(CACHE_PATH, version, cold=args.cold)
+    manifest, stats = precompress(root, codecs, args.jobs, cache)
+
+    text = [e for rel, e in manifest.items() if is_text(rel)]
+    total = sum(e['size'] for e in text)
+    print(f'{len(manifest)} files, {len(text)} text assets ({total / 1e6:.1f} MB); '
+          f"compressed {stats['compressed']} changed, {len(text) - stats['compressed']} unchanged.")
+    for ext in codecs:
+        packed = sum(e.get(ext, e['size']) for e in text)
+        print(f'  .{ext}: {packed / 1e6:.1f} MB ({packed / total:.0%})' if total else f'  .{ext}: -')
+    if stats['removed']:
+        print(f"Removed {stats['removed']} compressed copies of deleted files.")
+    print(f'Wrote {os.path.join(args.site, MANIFEST_NAME)}.')
+
+
+if __name__ == '__main__':
+    main()
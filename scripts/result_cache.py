@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Persistent per-file result cache keyed by content hash and tool version.
+
+Used by the maintenance scripts to skip work on files that did not change
+since the previous run:
+- an entry is reused without reading the file when its size and mtime are
+  unchanged and the mtime is safely older than the previous save (so an
+  edit in the same clock tick as a save is not missed)
+- otherwise the file is hashed and the entry is reused when the content
+  hash matches
+- entries for files not seen during a run are dropped on save()
+- a change of `version` invalidates the whole cache
+- `extra` holds tool-specific state for the whole run; it is replaced by
+  the value passed to save()
+
+The cache is a single JSON file, written atomically.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+# mtimes this close to the previous save are not trusted (coarse filesystem clocks)
+RACY_NS = 2_000_000_000
+
+
+def digest(data):
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def digest_file(path, chunk_size=1 << 20):
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def source_version(*files, tag=''):
+    """Version string that changes whenever one of the given source files does."""
+    h = hashlib.blake2b(tag.encode(), digest_size=8)
+    for f in files:
+        h.update(Path(f).read_bytes())
+    return h.hexdigest()
+
+
+@contextmanager
+def atomic_file(path):
+    """Yield a binary temp file next to path; it replaces path when the block ends without an error.
+
+    Every writer gets a temp file of its own (mkstemp, like md_scan.AtomicWriter),
+    so two runs saving the same file at once never write into or rename each
+    other's temp file; the last rename wins.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix='.' + path.name + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            yield f
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def write_json_atomic(path, obj):
+    with atomic_file(path) as f:
+        f.write(json.dumps(obj, separators=(',', ':')).encode('utf-8'))
+
+
+class ResultCache:
+    def __init__(self, path, version, cold=False):
+        self.path = Path(path)
+        self.version = version
+        self.saved_ns = 0
+        self.extra = {}
+        self.old = {} if cold else self._read()
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _read(self):
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get('version') != self.version:
+            return {}
+        self.saved_ns = data.get('saved_ns', 0)
+        self.extra = data.get('extra', {})
+        return data.get('files', {})
+
+    def fresh(self, key, st):
+        """Return (True, value) if key's size and mtime are unchanged since the last save."""
+        e = self.old.get(key)
+        if e is not None and e['stat'] == [st.st_mtime_ns, st.st_size] and st.st_mtime_ns + RACY_NS < self.saved_ns:
+            self.entries[key] = e
+            self.hits += 1
+            return True, e['value']
+        return False, None
+
+    def cached_hash(self, key):
+        e = self.old.get(key)
+        return e['hash'] if e is not None else None
+
+    def match(self, key, st, h):
+        """Return (True, value) if key's cached content hash equals h."""
+        e = self.old.get(key)
+        if e is not None and e['hash'] == h:
+            e['stat'] = [st.st_mtime_ns, st.st_size]
+            self.entries[key] = e
+            self.hits += 1
+            return True, e['value']
+        return False, None
+
+    def put(self, key, st, h, value):
+        self.entries[key] = {'stat': [st.st_mtime_ns, st.st_size], 'hash': h, 'value': value}
+        self.misses += 1
+
+    def save(self, extra=None):
+        """Write the entries seen during this run; everything else is evicted."""
+        data = {'version': self.version, 'saved_ns': time.time_ns(), 'files': self.entries}
+        if extra is not None:
+            data['extra'] = extra
+        write_json_atomic(self.path, data)
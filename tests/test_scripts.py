@@ -0,0 +1,739 @@
+"""
+Equivalence and behaviour checks for the scripts in scripts/ and the MkDocs hooks.
+
+Each check runs on built-in snippets or a small wiki from gen_corpus.py:
+- fix_bold_spaces: the linear scanner against the old regex rules
+- link_check: extract_fast() against html.parser (IdHrefParser)
+- md_link_check: heading anchors against the toc extension's ids
+- cached runs (check_md_strict, link_check, docs_search) against cold
+  runs after an edit, and streamed runs of the Markdown scripts against
+  loaded ones
+- result_cache.write_json_atomic() under concurrent writers
+- docs_search hits against a scan of every page, near_dupes clusters
+  against exact pairwise Jaccard
+- external_links against local stand-in HTTP servers
+- convert_txt_to_md: DokuWiki links to a namespace's start page
+- mkdocs_data_tables: the data_table() call forms that split a table
+
+Timings are measured by scripts/bench_scripts.py, not here.
+
+Usage: python3 -m unittest discover tests   (or: python3 -m pytest tests)
+"""
+import hashlib
+import json
+import os
+import random
+import re
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import combinations
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS = ROOT / 'scripts'
+sys.path[1:1] = [str(SCRIPTS), str(ROOT)]
+
+from docs_search import QUERY_RE, SearchIndex, page_sections, tokenize, update  # noqa: E402
+from external_links import LinkCache, check_urls, is_ok, split_url  # noqa: E402
+from fix_bold_spaces import fix_doc, fix_line_outside_code  # noqa: E402
+from gen_corpus import generate, large_page  # noqa: E402
+from link_check import IdHrefParser, extract_fast, parse_html  # noqa: E402
+from md_link_check import heading_anchor  # noqa: E402
+from md_scan import Doc, docs_files  # noqa: E402
+from near_dupes import clusters, containment, lsh_params, shingles, signatures  # noqa: E402
+
+
+class Corpus:
+    """A generated wiki shared by the tests of one class; copy() gives a scratch copy."""
+
+    def __init__(self, pages, seed=0):
+        self.tmp = tempfile.mkdtemp(prefix='test_scripts_')
+        self.root = Path(self.tmp) / 'pristine'
+        generate(self.root, pages, seed=seed)
+
+    def copy(self, name):
+        work = Path(self.tmp) / name
+        shutil.rmtree(work, ignore_errors=True)
+        shutil.copytree(self.root, work)
+        return work
+
+    def close(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+
+def run(script, cwd, *args):
+    """Run scripts/<script> in cwd; returns (exit code, stdout)."""
+    proc = subprocess.run([sys.executable, str(SCRIPTS / script)] + list(args), cwd=cwd,
+                          stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    return proc.returncode, proc.stdout
+
+
+def tree_digest(root):
+    h = hashlib.blake2b(digest_size=16)
+    for p in sorted(Path(root).rglob('*')):
+        if p.is_file():
+            h.update(str(p.relative_to(root)).encode())
+            h.update(p.read_bytes())
+    return h.hexdigest()
+
+
+# --- fix_bold_spaces ---------------------------------------------------------
+
+TRIPLE_PAT = re.compile(r"\*\*\*\s+(.+?)\s+\*\*\*")
+BOLD_PAT = re.compile(r"\*\*\s+(.+?)\s+\*\*")
+ITALIC_PAT = re.compile(r"(?<!\*)\*\s+(.+?)\s+\*(?!\*)")
+
+
+def legacy(text):
+    """The previous emphasis rules, verbatim."""
+    new = text
+    for pat in (TRIPLE_PAT, BOLD_PAT, ITALIC_PAT):
+        while True:
+            new2 = pat.sub(lambda m: m.group(0).replace(m.group(1), m.group(1).strip()), new)
+            if new2 == new:
+                break
+            new = new2
+    return new
+
+
+def legacy_file(s):
+    """The previous per-file loop of fix_bold_spaces.main(), verbatim around legacy()."""
+    out_lines = []
+    in_fence = False
+    for line in s.splitlines(True):
+        stripped = line.lstrip()
+        if stripped.startswith('```') or stripped.startswith('~~~'):
+            in_fence = not in_fence
+            out_lines.append(line)
+            continue
+        if in_fence:
+            out_lines.append(line)
+            continue
+        parts = line.split('`')
+        for i in range(0, len(parts), 2):
+            parts[i] = legacy(parts[i])
+        out_lines.append('`'.join(parts))
+    return ''.join(out_lines)
+
+
+EMPHASIS_PIECES = ['*', '**', '***', '****', ' ', '   ', '\t', ' \t ', '    ', 'alpha', 'DNS', '2', '=', '|', ' | ',
+                   'é']
+EMPHASIS_CASES = [
+    '| * | * |',
+    '| ** | ** |',
+    '2 * 3 = 6 and 4 * 5',
+    'Use * as wildcard and * for all',
+    '* item with ** bold ** text',
+    '| model | ** device ** | * x * |',
+    '**Note** and ** x **',
+    '**   **',
+    '*   *   *',
+    '| ***    *** |  *\t \t*',
+]
+
+
+class EmphasisTest(unittest.TestCase):
+    def assertLegacy(self, lines):
+        for line in lines:
+            want = legacy(line)
+            got, changed = fix_line_outside_code(line)
+            self.assertEqual((got, changed), (want, want != line), repr(line))
+
+    def test_cases(self):
+        self.assertLegacy(EMPHASIS_CASES)
+
+    def test_generated_lines(self):
+        rng = random.Random(0)
+        self.assertLegacy(''.join(rng.choice(EMPHASIS_PIECES) for _ in range(rng.randint(1, 16)))
+                          for _ in range(5000))
+
+    def test_generated_wiki(self):
+        corpus = Corpus(150)
+        try:
+            for p in docs_files(corpus.root / 'docs'):
+                text = p.read_text(encoding='utf-8')
+                got, changed = fix_doc(Doc(text, p))
+                want = legacy_file(text)
+                self.assertEqual(got, want, p.name)
+                self.assertEqual(changed, want != text, p.name)
+        finally:
+            corpus.close()
+
+
+# --- link_check extraction ---------------------------------------------------
+
+HTML_CASES = [
+    b'<a href="x.html#y" id="top">x</a><div ID=\'b\'></div>',
+    b'<a href=plain.html>p</a><a href>empty</a><a href="">q</a><span id></span>',
+    b'<a href="a?x=1&amp;y=2">e</a><p id="caf&eacute;"></p>',
+    b'<!-- <a href="hidden.html"> --><a href="shown.html"></a>',
+    b'<script id="cfg">var s = "<a href=\'no.html\'>";</script><a href="yes.html"></a>',
+    b'<style>a[id="x"]{}</style><A HREF="upper.html" Id="u"></A>',
+    b'<a href="one" href="two"></a><br/><img src="i.png" id="i"/>',
+    b'<a href="x"title="no space">bad</a>',
+    b'<a href=x"y>odd</a>',
+    b'<!-- unterminated <a href="z.html">',
+    b'<script>never closed <a href="s.html">',
+    b'text with a<b comparison and <a href="after.html">',
+    b'<a\xc2\xa0href="nbsp.html">n</a><p id="\xc3\xa9"></p>',
+    b'<a href="latin\xe9.html">l</a>',
+    b'<a href="trunc.html"',
+    b'<![CDATA[<a href="cd">]]><a href="after.html" id="a">',
+    b'<![CDATA[ x > <a href="cd2"> ]]><p id="p"></p>',
+    b'<?php <a href="pi"> ?><a href="after.html">',
+    b'<?pi unterminated <a href="u.html">',
+    b'<!DOCTYPE html><!x <a href="decl.html" id="d">><a href="ok.html"></a>',
+    b'<!ELEMENT a <a href="elem"> "<p id=q>">',
+    b'</div <a href="endtag.html">><a href="real.html"></a></a>',
+    b'</ <a href="bogus.html"><p id="e"></p>',
+    b'<title id="t">a <a href="in-title.html"> b</title><a href="after.html">',
+    b'<textarea><p id="in-ta"><!-- </textarea><p id="out">',
+    b'<TITLE>x</Title ><a href="y.html"></a>',
+    b'<title/><a href="sc.html"></a>',
+    b'<textarea>never closed <a href="ta.html">',
+]
+
+
+def reference(data):
+    try:
+        text = data.decode('utf-8')
+    except UnicodeDecodeError:
+        text = data.decode('latin-1')
+    p = IdHrefParser()
+    try:
+        p.feed(text)
+    except Exception:
+        pass
+    return p.ids, p.hrefs
+
+
+def fast(data):
+    try:
+        return extract_fast(data)
+    except ValueError:
+        return reference(data)
+
+
+class LinkExtractTest(unittest.TestCase):
+    def test_cases(self):
+        for data in HTML_CASES:
+            self.assertEqual(fast(data), reference(data), data)
+
+    def test_raw_text_elements(self):
+        data = b'<title id="t">a <a href="in.html"></title><textarea><p id="ta"></textarea><p id="out">'
+        expected = ({'t', 'out'}, [])
+        self.assertEqual(extract_fast(data), expected)
+        self.assertEqual(reference(data), expected)
+
+    def test_generated_site(self):
+        corpus = Corpus(150)
+        try:
+            for p in sorted((corpus.root / 'site').rglob('*.html')):
+                data = p.read_bytes()
+                self.assertEqual(extract_fast(data), reference(data), p.name)
+                self.assertEqual(parse_html(str(p)), reference(data), p.name)
+        finally:
+            corpus.close()
+
+
+# --- md_link_check anchors ---------------------------------------------------
+
+HEADINGS = [
+    ('ip_address field', 'ip_address-field'),
+    ('snake_case_name', 'snake_case_name'),
+    ('Code `x_y` bit', 'code-x_y-bit'),
+    ('`__init__` method', '__init__-method'),
+    ('x __init__ y', 'x-init-y'),
+    ('_emph_ and __strong__ words', 'emph-and-strong-words'),
+    ('*star* and **bold**', 'star-and-bold'),
+    ('_a_b_', 'a_b'),
+    ('_a `x_y` b_', 'a-x_y-b'),
+    (r'escaped \_x\_ stays', 'escaped-_x_-stays'),
+    ('Link [to_x](a_b.md) and ![alt_x](i.png)', 'link-to_x-and'),
+    ('<span>tag_x</span> AT&amp;T', 'tag_x-att'),
+    ('`a*b` and `<b>`', 'ab-and-b'),
+    ('Café résumé', 'cafe-resume'),
+    ('Trailing _', 'trailing-_'),
+]
+
+
+class HeadingAnchorTest(unittest.TestCase):
+    def test_known_anchors(self):
+        for text, anchor in HEADINGS:
+            self.assertEqual(heading_anchor(text, set()), anchor, text)
+
+    def test_against_toc_extension(self):
+        try:
+            import markdown
+        except ImportError:
+            self.skipTest('Markdown is not installed')
+        corpus = Corpus(100)
+        try:
+            headings = [text for text, _ in HEADINGS]
+            for p in docs_files(corpus.root / 'docs') + docs_files(ROOT / 'docs'):
+                headings += re.findall(r'^#{1,6} +(.+?)(?: +#+)? *$', p.read_text(encoding='utf-8'), re.M)
+        finally:
+            corpus.close()
+        for text in headings:
+            md = markdown.Markdown(extensions=['toc', 'attr_list', 'abbr', 'admonition'])
+            md.convert('## ' + text)
+            self.assertEqual(heading_anchor(text, set()), md.toc_tokens[0]['id'], text)
+
+    def test_links_to_underscore_headings(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            docs = Path(tmp) / 'docs'
+            docs.mkdir()
+            (docs / 'a_b.md').write_text('# A\n', encoding='utf-8')
+            (docs / 'i.png').write_bytes(b'')
+            (docs / 'fields.md').write_text('# Fields\n\n' + ''.join(f'## {t}\n\nText.\n\n' for t, _ in HEADINGS),
+                                            encoding='utf-8')
+            (docs / 'index.md').write_text('# Home\n\n' + ''.join(f'- [x](fields.md#{a})\n' for _, a in HEADINGS) +
+                                           '- [x](fields.md#ipaddress-field)\n', encoding='utf-8')
+            code, out = run('md_link_check.py', tmp)
+            self.assertEqual(code, 1)
+            broken = [l for l in out.split('\n') if l.startswith('- In ')]
+            self.assertEqual(len(broken), 1, out)
+            self.assertIn('"fields.md#ipaddress-field" => anchor-not-found', broken[0])
+
+
+# --- cached and streamed runs against plain ones -----------------------------
+
+def edit_pages(docs, n, seed=0):
+    """Append a style issue and a broken link to n pages, and delete one page."""
+    pages = docs_files(docs)
+    rng = random.Random(seed)
+    for p in rng.sample(pages, n):
+        with open(p, 'a', encoding='utf-8') as f:
+            f.write('\nEdited\tline\n## Late heading\n[gone](missing_after_edit.md)\n')
+    rng.choice(pages).unlink()
+
+
+class IncrementalTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.corpus = Corpus(200)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.corpus.close()
+
+    def test_check_md_strict(self):
+        work = self.corpus.copy('check_md_strict')
+        run('check_md_strict.py', work)
+        edit_pages(work / 'docs', 10)
+        self.assertEqual(run('check_md_strict.py', work), run('check_md_strict.py', work, '--no-cache'))
+
+    def test_link_check(self):
+        work = self.corpus.copy('link_check')
+        run('link_check.py', work)
+        pages = sorted((work / 'site').rglob('index.html'))
+        rng = random.Random(1)
+        for p in rng.sample(pages, 10):
+            text = p.read_text(encoding='utf-8')
+            # drop the page's heading ids and add a link to a missing page
+            text = re.sub(r' id="[^"]*"', '', text).replace('</body>', '<a href="../nowhere/">x</a></body>')
+            p.write_text(text, encoding='utf-8')
+        shutil.rmtree(rng.choice(pages).parent)
+        code, out = run('link_check.py', work)
+        self.assertEqual(code, 1)
+        self.assertIn('Re-parsed 10 changed files', out)
+        # the cached run adds one line saying how much it re-checked
+        out = '\n'.join(l for l in out.split('\n') if not l.startswith('Re-parsed '))
+        self.assertEqual((code, out), run('link_check.py', work, '--no-cache'))
+
+    def test_docs_search(self):
+        work = self.corpus.copy('docs_search')
+        docs = work / 'docs'
+        update(docs)
+        old = time.time() - 60
+        for p in docs_files(docs):
+            os.utime(p, (old, old))
+        edit_pages(docs, 10)
+        update(docs)
+        queries = ['dhcp', 'late heading', 'serv*', '"backup server"', 'dns-gate*']
+        index = SearchIndex(work / '.cache' / 'docs_search.idx')
+        warm = [index.search(q, limit=1 << 30) for q in queries]
+        index.close()
+        update(docs, cold=True)
+        index = SearchIndex(work / '.cache' / 'docs_search.idx')
+        self.assertEqual(warm, [index.search(q, limit=1 << 30) for q in queries])
+        index.close()
+
+
+# a run saving a large cache over and over, as a CI run and md_watch or two
+# checker runs do when they save the same cache file at once
+SAVE_LOOP = '''
+import sys
+from result_cache import write_json_atomic
+for i in range(40):
+    write_json_atomic(sys.argv[1], {'writer': sys.argv[2], 'files': {str(n): 'x' * 40 for n in range(20000)}})
+'''
+
+
+class ConcurrentSaveTest(unittest.TestCase):
+    def test_concurrent_writers(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / '.cache' / 'check_md_strict.json'
+            env = dict(os.environ, PYTHONPATH=str(SCRIPTS))
+            procs = [subprocess.Popen([sys.executable, '-c', SAVE_LOOP, str(path), str(n)], env=env,
+                                      stderr=subprocess.PIPE, text=True) for n in range(4)]
+            errors = [p.communicate()[1] for p in procs]
+            self.assertEqual([p.returncode for p in procs], [0] * 4, errors)
+            self.assertEqual(len(json.loads(path.read_text(encoding='utf-8'))['files']), 20000)
+            self.assertEqual(os.listdir(path.parent), [path.name])
+
+
+class StreamingTest(unittest.TestCase):
+    SCRIPTS = [('check_md_strict.py', '--no-cache'), ('fix_md_strict.py',), ('fix_bold_spaces.py',),
+               ('convert_backslash_return.py',), ('md_pipeline.py',)]
+
+    def test_streamed_runs(self):
+        corpus = Corpus(30)
+        try:
+            shutil.rmtree(corpus.root / 'site')
+            large_page(corpus.root / 'docs' / 'inventory.md', corpus.root / 'docs', 2)
+            for script, *args in self.SCRIPTS:
+                results = []
+                for limit in ('100', '0'):
+                    work = corpus.copy('work')
+                    code, out = run(script, work, *args, '--stream-above', limit)
+                    self.assertIn(code, (0, 2), script)
+                    results.append((code, out, tree_digest(work / 'docs')))
+                self.assertEqual(results[0], results[1], script)
+        finally:
+            corpus.close()
+
+
+# --- docs_search and near_dupes ----------------------------------------------
+
+def section_tokens(terms, n):
+    toks = [None] * n
+    for t, ps in terms.items():
+        for i in ps:
+            toks[i] = t
+    return toks
+
+
+def scan(docs, query):
+    """(page, line) of every section matching query, by reading and tokenizing every page."""
+    items = []
+    for phrase, word in QUERY_RE.findall(query):
+        if phrase:
+            items.append(('phrase', tokenize(phrase)))
+        elif word.endswith('*') and tokenize(word):
+            *whole, last = tokenize(word)
+            items.extend(('word', w) for w in whole)
+            items.append(('prefix', last))
+        else:
+            items.extend(('word', w) for w in tokenize(word))
+    out = set()
+    for p in docs_files(docs):
+        rel = p.relative_to(docs).as_posix()
+        for _, _, _, line, _, n, terms in page_sections(p.read_text(encoding='utf-8')):
+            toks = section_tokens(terms, n)
+            ok = True
+            for kind, w in items:
+                if kind == 'word':
+                    ok = w in terms
+                elif kind == 'prefix':
+                    ok = any(t.startswith(w) for t in terms)
+                else:
+                    ok = any(toks[i:i + len(w)] == w for i in range(len(toks) - len(w) + 1))
+                if not ok:
+                    break
+            if ok:
+                out.add((rel, line))
+    return out
+
+
+class DocsSearchTest(unittest.TestCase):
+    def test_hits_match_scan(self):
+        corpus = Corpus(200)
+        try:
+            docs = corpus.root / 'docs'
+            update(docs)
+            index = SearchIndex(corpus.root / '.cache' / 'docs_search.idx')
+            queries = ['warranty', 'dhcp subnet', 'firewall vendor', '"backup server"', 'ser*', 'dns-gate*',
+                       'configuration', '00042']
+            for q in queries:
+                got = {(index.section(s)[0], index.section(s)[4]) for _, s in index.search(q, limit=1 << 30)}
+                self.assertEqual(got, scan(docs, q), q)
+            index.close()
+        finally:
+            corpus.close()
+
+
+def plant_copies(docs, rng, templates, copies):
+    """Write drifted copies of random pages; returns {template rel: [copy rel]}."""
+    pages = sorted(docs.rglob('*.md'))
+    pool = [l for p in rng.sample(pages, min(50, len(pages))) for l in p.read_text(encoding='utf-8').split('\n') if l]
+    planted = {}
+    for t, src in enumerate(rng.sample(pages, templates)):
+        lines = src.read_text(encoding='utf-8').split('\n')
+        rel = src.relative_to(docs).as_posix()
+        planted[rel] = []
+        for c in range(copies):
+            drift = 0.4 * c / max(1, copies - 1)
+            out = [rng.choice(pool) if rng.random() < drift else l for l in lines]
+            out += [rng.choice(pool) for _ in range(int(len(lines) * drift / 2))]
+            dst = src.parent / f'copy_{t}_{c}.md'
+            dst.write_text('\n'.join(out), encoding='utf-8')
+            planted[rel].append(dst.relative_to(docs).as_posix())
+    return planted
+
+
+class NearDupesTest(unittest.TestCase):
+    THRESHOLD = 0.8
+
+    def test_clusters_against_exact_jaccard(self):
+        corpus = Corpus(300)
+        try:
+            docs = corpus.root / 'docs'
+            planted = plant_copies(docs, random.Random(0), 5, 10)
+            found = signatures(docs)
+            pages = [p for p, s in found.items() if s is not None]
+            sigs = [found[p][1] for p in pages]
+            sets = [shingles((docs / p).read_text(encoding='utf-8')) for p in pages]
+            self.assertEqual(signatures(docs), found)
+        finally:
+            corpus.close()
+        bands, rows = lsh_params(self.THRESHOLD, len(sigs[0]))
+        groups, edges = clusters(sigs, self.THRESHOLD, bands, rows)
+        exact = {}
+        for i, j in combinations(range(len(sets)), 2):
+            inter = len(sets[i] & sets[j])
+            if inter:
+                exact[i, j] = inter / (len(sets[i]) + len(sets[j]) - inter)
+        cluster_of = {i: n for n, g in enumerate(groups) for i in g}
+        want = [pair for pair, s in exact.items() if s >= self.THRESHOLD]
+        self.assertTrue(want)
+        hit = sum(1 for i, j in want if i in cluster_of and cluster_of.get(i) == cluster_of.get(j))
+        self.assertGreaterEqual(hit / len(want), 0.9)
+        self.assertFalse([pair for pair in edges if exact.get(pair, 0.0) < self.THRESHOLD - 0.1])
+        index = {p: i for i, p in enumerate(pages)}
+        for t, cs in planted.items():
+            ti = index[t]
+            for c in cs:
+                ci = index[c]
+                true = len(sets[ti] & sets[ci]) / len(sets[ti])
+                self.assertLess(abs(containment(sigs[ti], len(sets[ti]), sigs[ci], len(sets[ci])) - true), 0.2)
+
+
+# --- external_links ----------------------------------------------------------
+
+class StandIn(ThreadingHTTPServer):
+    """A local HTTP/1.1 server: /ok/N 200, /missing/N 404, /nohead/N 405 to HEAD, /redirect/N 301 to /ok/N."""
+    daemon_threads = True
+
+    def __init__(self, latency=0.01, host='127.0.0.1'):
+        if ':' in host:
+            self.address_family = socket.AF_INET6
+        super().__init__((host, 0), StandInHandler)
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests = 0
+        self.connections = 0
+        self.paths = []
+        self.host_headers = []
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+        # headers and body go out in separate writes; do not let Nagle hold the body back
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, *args):
+        pass
+
+    def answer(self, head):
+        s = self.server
+        with s.lock:
+            s.requests += 1
+            s.in_flight += 1
+            s.max_in_flight = max(s.max_in_flight, s.in_flight)
+            s.paths.append(self.path)
+            s.host_headers.append(self.headers.get('Host'))
+        try:
+            time.sleep(s.latency)
+            kind = self.path.split('/')[1]
+            if kind == 'nohead' and head:
+                status = 405
+            elif kind == 'redirect':
+                status = 301
+            else:
+                status = {'ok': 200, 'nohead': 200}.get(kind, 404)
+            body = b'stand-in page\n' if status == 200 else b''
+            self.send_response(status)
+            if status == 301:
+                self.send_header('Location', '/ok/' + self.path.split('/')[2])
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            if not head:
+                self.wfile.write(body)
+        finally:
+            with s.lock:
+                s.in_flight -= 1
+
+    def do_HEAD(self):
+        self.answer(True)
+
+    def do_GET(self):
+        self.answer(False)
+
+
+class ExternalLinksTest(unittest.TestCase):
+    PER_HOST = 3
+
+    def setUp(self):
+        self.servers = [StandIn() for _ in range(3)]
+        for s in self.servers:
+            threading.Thread(target=s.serve_forever, daemon=True).start()
+        self.tmp = tempfile.mkdtemp(prefix='test_external_')
+
+    def tearDown(self):
+        for s in self.servers:
+            s.shutdown()
+            s.server_close()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_verdicts_limits_and_cache(self):
+        expect = {}
+        for s in self.servers:
+            for kind, ok in (('ok', True), ('missing', False), ('nohead', True), ('redirect', True)):
+                for n in range(15):
+                    expect[f'http://127.0.0.1:{s.server_address[1]}/{kind}/{n}'] = ok
+        cache = LinkCache(os.path.join(self.tmp, 'external_links.json'))
+        results, stats = check_urls(list(expect) * 2, cache, per_host=self.PER_HOST)
+        self.assertEqual({u: is_ok(results[u]) for u in expect}, expect)
+        self.assertLessEqual(max(s.max_in_flight for s in self.servers), self.PER_HOST)
+        self.assertLess(sum(s.connections for s in self.servers), stats['requests'])
+        cache = LinkCache(cache.path)
+        results, stats = check_urls(list(expect), cache, per_host=self.PER_HOST)
+        self.assertEqual(stats['probed'], 0)
+        self.assertEqual({u: is_ok(results[u]) for u in expect}, expect)
+
+    def test_request_targets_are_ascii(self):
+        s = self.servers[0]
+        base = f'http://127.0.0.1:{s.server_address[1]}/ok'
+        urls = {'/café': '/caf%C3%A9', '/漢ok': '/%E6%BC%A2ok', '/a b?q=a b&r=ü': '/a%20b?q=a%20b&r=%C3%BC',
+                '/kept%20escape?x=%41': '/kept%20escape?x=%41'}
+        results, _ = check_urls([base + u for u in urls])
+        self.assertTrue(all(is_ok(r) for r in results.values()), results)
+        self.assertEqual(sorted(s.paths), sorted('/ok' + t for t in urls.values()))
+        self.assertEqual(split_url('https://bücher.example/ä')[1:], ('xn--bcher-kva.example', 443, '/%C3%A4'))
+
+    def test_ipv6_host_header(self):
+        try:
+            s = StandIn(host='::1')
+        except OSError:
+            self.skipTest('no IPv6 loopback')
+        threading.Thread(target=s.serve_forever, daemon=True).start()
+        self.servers.append(s)
+        url = f'http://[::1]:{s.server_address[1]}/ok/1'
+        results, _ = check_urls([url])
+        self.assertTrue(is_ok(results[url]), results)
+        self.assertEqual(s.host_headers, [f'[::1]:{s.server_address[1]}'])
+
+    def test_stalled_tls_handshake_times_out(self):
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            # never accepted: the kernel completes the TCP handshake, nobody answers the ClientHello
+            sock.listen(8)
+            url = f'https://127.0.0.1:{sock.getsockname()[1]}/stall'
+            t0 = time.perf_counter()
+            results, _ = check_urls([url], timeout=0.5)
+            self.assertEqual(results[url]['error'], 'timeout')
+            self.assertLess(time.perf_counter() - t0, 2)
+
+
+# --- convert_txt_to_md -------------------------------------------------------
+
+class StartPageLinkTest(unittest.TestCase):
+    LINKS = ['..:..:other:start', '..:..:other:index', 'other:start', 'other:index', 'other:', ':other:start']
+
+    def convert(self, start_page):
+        with tempfile.TemporaryDirectory() as tmp:
+            docs = Path(tmp)
+            (docs / 'a' / 'b').mkdir(parents=True)
+            (docs / 'other').mkdir()
+            (docs / 'other' / start_page).write_text('====== Other ======\n', encoding='utf-8')
+            (docs / 'a' / 'b' / 'page.txt').write_text(
+                '====== Page ======\n' + ''.join(f'[[{t}|o]]\n' for t in self.LINKS), encoding='utf-8')
+            code, out = run('convert_txt_to_md.py', tmp, '--docs', tmp)
+            self.assertEqual(code, 0)
+            self.assertNotIn('Unresolved', out)
+            return (docs / 'a' / 'b' / 'page.md').read_text(encoding='utf-8')
+
+    def test_index_page(self):
+        # the layout after rename_start_to_index.py
+        md = self.convert('index.md')
+        self.assertEqual(md.count('[o](../../other/index.md)'), len(self.LINKS), md)
+
+    def test_start_page(self):
+        md = self.convert('start.txt')
+        self.assertEqual(md.count('[o](../../other/start.md)'), len(self.LINKS), md)
+
+
+# --- mkdocs_data_tables ------------------------------------------------------
+
+class DataTablesTest(unittest.TestCase):
+    ROWS = 1234
+    PER_PAGE = 500
+    # (page, data_table call, splits)
+    CASES = [
+        ('positional.md', "data_table('inventory.csv', per_page={n})", True),
+        ('keyword.md', 'data_table(src="inventory.csv", per_page={n})', True),
+        ('keyword_sorted.md', "data_table(sort='-Port', src='inventory.csv', per_page={n}, columns='Device,Port')",
+         True),
+        ('sub/absolute.md', "data_table('/inventory.csv', per_page={n})", True),
+        ('no_src.md', 'data_table(per_page={n})', False),
+        ('non_literal.md', "data_table('inventory.csv', per_page=size)", False),
+        ('unsplit.md', "data_table('inventory.csv')", False),
+    ]
+
+    def test_split_call_forms(self):
+        import ast
+        import csv
+        import mkdocs_data_tables as dt
+
+        with tempfile.TemporaryDirectory() as tmp:
+            docs = Path(tmp)
+            with open(docs / 'inventory.csv', 'w', encoding='utf-8', newline='') as f:
+                w = csv.writer(f)
+                w.writerow(['Device', 'Port', 'Site'])
+                for i in range(self.ROWS):
+                    w.writerow([f'SW{i:05d}', i % 48, f'Site {i % 7}'])
+            (docs / 'sub').mkdir()
+            for page, call, splits in self.CASES:
+                path = docs / page
+                path.write_text(f'# {page}\n\n{{{{ {call.format(n=self.PER_PAGE)} }}}}\n', encoding='utf-8')
+                found = dt.page_split(str(path))
+                planned = dt.split_parts(str(docs), page, found) if found else []
+                want = [dt.part_uri(page, n) for n in (2, 3)] if splits else []
+                self.assertEqual([uri for uri, _ in planned], want, page)
+                for n, (uri, content) in enumerate(planned, 2):
+                    (docs / uri).write_text(content, encoding='utf-8')
+                    call = ast.parse(content[content.index('{{') + 2:content.rindex('}}')].strip(), mode='eval').body
+                    args = [ast.literal_eval(a) for a in call.args]
+                    kwargs = {k.arg: ast.literal_eval(k.value) for k in call.keywords}
+                    table = dt.data_table(str(docs), uri, *args, **kwargs)
+                    rows = [l for l in table.split('\n') if l.startswith('| SW')]
+                    self.assertEqual(len(rows), min(self.PER_PAGE, self.ROWS - (n - 1) * self.PER_PAGE), uri)
+
+
+if __name__ == '__main__':
+    unittest.main()